@@ -26,14 +26,14 @@ documentation.  For more information on the Python package, licence and source c
 
 name = 'astroconst'
 
-import numpy as __np
+import math as __math
 from . import aa  # Submodule with constants from the Astronomical Almanac
 
 # Angles:
 # Mathematical constans:
 c3rd  = 1/3;              """One third"""
 
-pi    = __np.pi;          """π"""
+pi    = __math.pi;        """π"""
 pi2   = 2*pi;             """2π"""
 pi4   = 4*pi;             """4π"""
 pio2  = pi/2;             """π/2"""
@@ -106,7 +106,6 @@ c2k      = 273.15;                              """Degrees Celcius to Kelvin (sh
 
 # Non-SI units
 erg     = 1e-7;                                """1 erg in Joule"""
-eV      = 1.6021766e-19;                       """1 eV in Joule"""
 keV     = 1000*eV;                             """1 keV in Joule"""
 MeV     = 1000*keV;                            """1 MeV in Joule"""
 GeV     = 1000*MeV;                            """1 GeV in Joule"""
@@ -122,8 +121,8 @@ glon_se_2000    = 0.5747704;     """Galactic longitude of the Spring equinox for
 ra_gp_2000      = 3.3660329;     """RA of the Galactic pole for J2000: 192.85948° in rad"""
 dec_gp_2000     = 0.4734773;     """Dec of the Galactic pole for J2000: 27.12825° in rad"""
 
-cos_dec_gp_2000 = __np.cos(dec_gp_2000);  """Cosine of dec_gp_2000, needed for coordinate transformations"""
-sin_dec_gp_2000 = __np.sin(dec_gp_2000);  """Sine of dec_gp_2000, needed for coordinate transformations"""
+cos_dec_gp_2000 = __math.cos(dec_gp_2000);  """Cosine of dec_gp_2000, needed for coordinate transformations"""
+sin_dec_gp_2000 = __math.sin(dec_gp_2000);  """Sine of dec_gp_2000, needed for coordinate transformations"""
 
 
 # Calendar/time:
@@ -134,30 +133,34 @@ jd1950 = 2433283;        """JD at J1950.0"""
 jd2000 = 2451545;        """JD at J2000.0 (2000-01-01 12:00 UT)"""
 jd_hip = 2448349.0625;   """JD of the Hipparcos catalogue (1991-04-02 ~13:29 UT) - https://heasarc.gsfc.nasa.gov/W3Browse/all/hipparcos.html"""
 
+# Array-valued constants are defined as plain lists below, moved to __arrays at the end of the module, and
+# converted to numpy arrays on first access by __getattr__().  This way, e.g. `from astroconst import au, d2r`
+# does not need to import numpy, while the constants keep their attribute docstrings for the documentation.
+
 # Month names: 1-12 = Jan-Dec
 # en:
-months_en          = __np.array(['','January','February','March','April','May','June','July','August','September','October','November','December']);   """Capitalised month names in English."""  # (13x9)
-months_en_lc       = __np.array(['','january','february','march','april','may','june','july','august','september','october','november','december']);   """Lower-case month names in English."""  # (13x9)
-months_en_abr      = __np.array(['','Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec']);                                         """Capitalised month abbreviations in English."""  # (13x3)
-months_en_abr_lc   = __np.array(['','jan','feb','mar','apr','may','jun','jul','aug','sep','oct','nov','dec']);                                         """Lower-case month abbreviations in English."""  # (13x3)
+months_en         = ['','January','February','March','April','May','June','July','August','September','October','November','December'];   """Capitalised month names in English."""  # (13x9)
+months_en_lc      = ['','january','february','march','april','may','june','july','august','september','october','november','december'];   """Lower-case month names in English."""  # (13x9)
+months_en_abr     = ['','Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec'];                                         """Capitalised month abbreviations in English."""  # (13x3)
+months_en_abr_lc  = ['','jan','feb','mar','apr','may','jun','jul','aug','sep','oct','nov','dec'];                                         """Lower-case month abbreviations in English."""  # (13x3)
 
 # nl:
-months_nl          = __np.array(['','januari','februari','maart','april','mei','juni','juli','augustus','september','oktober','november','december']);  """Lower-case month names in Dutch."""  # (13x9)
-months_nl_cap      = __np.array(['','Januari','Februari','Maart','April','Mei','Juni','Juli','Augustus','September','Oktober','November','December']);  """Capitalised month names in Dutch."""  # (13x9)
-months_nl_abr      = __np.array(['','jan','feb','mrt','apr','mei','jun','jul','aug','sep','okt','nov','dec']);                                          """Lower-case month abbreviations in Dutch."""  # (13x3)
-months_nl_abr_cap  = __np.array(['','Jan','Feb','Mrt','Apr','Mei','Jun','Jul','Aug','Sep','Okt','Nov','Dec']);                                          """Capitalised month abbreviations in Dutch."""  # (13x3)
+months_nl         = ['','januari','februari','maart','april','mei','juni','juli','augustus','september','oktober','november','december'];  """Lower-case month names in Dutch."""  # (13x9)
+months_nl_cap     = ['','Januari','Februari','Maart','April','Mei','Juni','Juli','Augustus','September','Oktober','November','December'];  """Capitalised month names in Dutch."""  # (13x9)
+months_nl_abr     = ['','jan','feb','mrt','apr','mei','jun','jul','aug','sep','okt','nov','dec'];                                          """Lower-case month abbreviations in Dutch."""  # (13x3)
+months_nl_abr_cap = ['','Jan','Feb','Mrt','Apr','Mei','Jun','Jul','Aug','Sep','Okt','Nov','Dec'];                                          """Capitalised month abbreviations in Dutch."""  # (13x3)
 
 
 # Days of the week; 0-6 = Sun-Sat:
 # En:
-dow_en       = __np.array(['Sunday','Monday','Tuesday','Wednesday','Thursday','Friday','Saturday']);  """Capitalised day-of-week names in English."""  # (7x9)
-dow_en_abr   = __np.array(['Sun','Mon','Tue','Wed','Thu','Fri','Sat']);                               """Capitalised three-letter day-of-week abbreviations in English."""  # (7x3)
-dow_en_abr2  = __np.array(['Su','Mo','Tu','We','Th','Fr','Sa']);                                      """Capitalised two-letter day-of-week abbreviations in English."""  # (7x2)
+dow_en       = ['Sunday','Monday','Tuesday','Wednesday','Thursday','Friday','Saturday'];  """Capitalised day-of-week names in English."""  # (7x9)
+dow_en_abr   = ['Sun','Mon','Tue','Wed','Thu','Fri','Sat'];                               """Capitalised three-letter day-of-week abbreviations in English."""  # (7x3)
+dow_en_abr2  = ['Su','Mo','Tu','We','Th','Fr','Sa'];                                      """Capitalised two-letter day-of-week abbreviations in English."""  # (7x2)
 
 # Nl:
-dow_nl       = __np.array(['zondag','maandag','dinsdag','woensdag','donderdag','vrijdag','zaterdag']);  """Lower-case day-of-week names in Dutch."""  # (7x9)
-dow_nl_abr   = __np.array(['zo','ma','di','wo','do','vr','za']);                                        """Lower-case two-letter day-of-week abbreviations in Dutch."""  # (7x2)
-dow_nl_abr4  = __np.array(['zon','maa','din','woe','don','vrij','zat']);                                """Lower-case four-letter day-of-week abbreviations in Dutch."""  # (7x4)
+dow_nl       = ['zondag','maandag','dinsdag','woensdag','donderdag','vrijdag','zaterdag'];  """Lower-case day-of-week names in Dutch."""  # (7x9)
+dow_nl_abr   = ['zo','ma','di','wo','do','vr','za'];                                        """Lower-case two-letter day-of-week abbreviations in Dutch."""  # (7x2)
+dow_nl_abr4  = ['zon','maa','din','woe','don','vrij','zat'];                                """Lower-case four-letter day-of-week abbreviations in Dutch."""  # (7x4)
 
 # Aliases:
 weekdays_en       = dow_en;         """Capitalised day-of-week names in English."""  # (7x9)
@@ -168,10 +171,10 @@ weekdays_nl_abr   = dow_nl_abr;     """Lower-case two-letter day-of-week abbrevi
 weekdays_nl_abr4  = dow_nl_abr4;    """Lower-case four-letter day-of-week abbreviations in Dutch."""  # (7x4)
 
 
-dst_en = __np.array(['standard time','daylight-savings time']);  """English DST timezone names."""
-dst_nl = __np.array(['wintertijd','zomertijd']);                 """Dutch DST timezone names."""
+dst_en = ['standard time','daylight-savings time'];  """English DST timezone names."""
+dst_nl = ['wintertijd','zomertijd'];                 """Dutch DST timezone names."""
 
-mlen = __np.array([31,28,31,30,31,30,31,31,30,31,30,31]);  """Length of the months (for non-leap year)."""  # Len=12
+mlen = [31,28,31,30,31,30,31,31,30,31,30,31];  """Length of the months (for non-leap year)."""  # Len=12
 
 # Length of a second, minute, hour:
 second =  1;                            """Second in SI"""
@@ -277,11 +280,11 @@ e_earth = earth_e;                      """Orbital eccentricity of the Earth - h
 
 
 
-pl_d = __np.array([3476.206e3, 4879.4e3, 12198e3, 2*earth_r, 6792.4e3, 142984e3, 120536e3, 51118e3, 49528e3, 2390e3]);     """Equatorial planet diameters (m); [0]=Moon; Venus = 12103.6km + clouds?"""
-pl_r = pl_d/2;  """Planet equatorial radii (m) = pland/2."""
-pl_a = __np.array([384400e3/au, 0.3871,   0.7233,       1,  1.5237, 5.2028,  9.5388, 19.191,  30.061, 39.529])*au;         """Planet semi-major axes (m); [0]=Moon"""
-pl_p = __np.array([0.0748,    0.240846, 0.615198,       1, 1.88082, 11.862, 29.4571, 84.0205,  164.8, 247.94])*year_trop;  """Planet orbital periods (s - https://en.wikipedia.org/wiki/Orbital_period); [0]=Moon."""
-pl_e = __np.array([0.0549,      0.2056,   0.0068, 0.01671,  0.0934, 0.0484,  0.0541,  0.0472, 0.0086, 0.2488]);            """Planet orbital eccentricities (s - https://en.wikipedia.org/wiki/Orbital_eccentricity); [0]=Moon."""
+pl_d = [3476.206e3, 4879.4e3, 12198e3, 2*earth_r, 6792.4e3, 142984e3, 120536e3, 51118e3, 49528e3, 2390e3];     """Equatorial planet diameters (m); [0]=Moon; Venus = 12103.6km + clouds?"""
+pl_r = [d/2 for d in pl_d];  """Planet equatorial radii (m) = pland/2."""
+pl_a = [a*au for a in [384400e3/au, 0.3871,   0.7233,       1,  1.5237, 5.2028,  9.5388, 19.191,  30.061, 39.529]];         """Planet semi-major axes (m); [0]=Moon"""
+pl_p = [p*year_trop for p in [0.0748,    0.240846, 0.615198,       1, 1.88082, 11.862, 29.4571, 84.0205,  164.8, 247.94]];  """Planet orbital periods (s - https://en.wikipedia.org/wiki/Orbital_period); [0]=Moon."""
+pl_e = [0.0549,      0.2056,   0.0068, 0.01671,  0.0934, 0.0484,  0.0541,  0.0472, 0.0086, 0.2488];            """Planet orbital eccentricities (s - https://en.wikipedia.org/wiki/Orbital_eccentricity); [0]=Moon."""
 
 # Satellites:
 # satrad(4:8,30);   """Radii Galilean moons (m)"""
@@ -289,14 +292,14 @@ pl_e = __np.array([0.0549,      0.2056,   0.0068, 0.01671,  0.0934, 0.0484,  0.0
 
 
 # English planet names:
-plname_en     = __np.array(['Moon','Mercury','Venus','Sun','Mars','Jupiter','Saturn','Uranus','Neptune','Pluto']);  """Capitalised planet names."""          # 10x7
-plname_en_lc  = __np.array(['moon','mercury','venus','sun','mars','jupiter','saturn','uranus','neptune','pluto']);  """Lower-case planet names."""           # 10x7
-plname_en_abr = __np.array(['Moon','Mer.','Ven.','Sun','Mars','Jup.','Sat.','Ura.','Nep.','Plu.']);                 """Capitalised planet abbreviations."""  # 10x4
+plname_en     = ['Moon','Mercury','Venus','Sun','Mars','Jupiter','Saturn','Uranus','Neptune','Pluto'];  """Capitalised planet names."""          # 10x7
+plname_en_lc  = ['moon','mercury','venus','sun','mars','jupiter','saturn','uranus','neptune','pluto'];  """Lower-case planet names."""           # 10x7
+plname_en_abr = ['Moon','Mer.','Ven.','Sun','Mars','Jup.','Sat.','Ura.','Nep.','Plu.'];                 """Capitalised planet abbreviations."""  # 10x4
 
 # Dutch planet names:
-plname_nl     = __np.array(['Maan','Mercurius','Venus','Zon','Mars','Jupiter','Saturnus','Uranus','Neptunus','Pluto']);  """Capitalised Dutch planet names."""          # 10x9
-plname_nl_lc  = __np.array(['maan','mercurius','venus','zon','mars','jupiter','saturnus','uranus','neptunus','pluto']);  """Lower-case Dutch planet names."""           # 10x9
-plname_nl_abr = __np.array(['Maan','Mer.','Ven.','Zon','Mars','Jup.','Sat.','Ura.','Nep.','Plu.']);                      """Capitalised Dutch planet abbreviations."""  # 10x4
+plname_nl     = ['Maan','Mercurius','Venus','Zon','Mars','Jupiter','Saturnus','Uranus','Neptunus','Pluto'];  """Capitalised Dutch planet names."""          # 10x9
+plname_nl_lc  = ['maan','mercurius','venus','zon','mars','jupiter','saturnus','uranus','neptunus','pluto'];  """Lower-case Dutch planet names."""           # 10x9
+plname_nl_abr = ['Maan','Mer.','Ven.','Zon','Mars','Jup.','Sat.','Ura.','Nep.','Plu.'];                      """Capitalised Dutch planet abbreviations."""  # 10x4
 
 
 
@@ -308,15 +311,66 @@ moon_a = 384399e3;                      """Semimajor axis of the Moon's orbit in
 moon_i = 5.145*d2r;                     """Inclination angle of the Moon's orbit in SI (rad)  - https://en.wikipedia.org/wiki/Moon"""
 
 # Moon phases:
-moonphase_en  = __np.array(['New Moon','First Quarter','Full Moon','Last Quarter']);            """English names of Lunar phases."""  # 4x13
-moonphase_nl  = __np.array(['Nieuwe Maan','Eerste Kwartier','Volle Maan','Laatste Kwartier']);  """Dutch names of Lunar phases."""    # 4x16
+moonphase_en  = ['New Moon','First Quarter','Full Moon','Last Quarter'];            """English names of Lunar phases."""  # 4x13
+moonphase_nl  = ['Nieuwe Maan','Eerste Kwartier','Volle Maan','Laatste Kwartier'];  """Dutch names of Lunar phases."""    # 4x16
 
 
 
 # Character constants:
-enGrChar   = __np.array(['alpha','beta','gamma','delta','epsilon','zeta','eta','theta','iota','kappa','lambda',
-                         'mu','nu','xi','omicron','pi','rho','sigma','tau','upsilon','phi','chi','psi','omega']); """Lower-case English names for Greek characters."""  # (24x7) # len=7
-
-htmlGrChar = __np.array(['&alpha;','&beta;','&gamma;','&delta;','&epsilon;','&zeta;','&eta;','&theta;','&iota;',
-                         '&kappa;','&lambda;','&mu;','&nu;','&xi;','&omicron;','&pi;','&rho;','&sigma;','&tau;',
-                         '&upsilon;','&phi;','&chi;','&psi;','&omega;']); """HTML codes for lower-case Greek characters."""    # (24x9) # len=9
+enGrChar   = ['alpha','beta','gamma','delta','epsilon','zeta','eta','theta','iota','kappa','lambda',
+              'mu','nu','xi','omicron','pi','rho','sigma','tau','upsilon','phi','chi','psi','omega']; """Lower-case English names for Greek characters."""  # (24x7) # len=7
+
+htmlGrChar = ['&alpha;','&beta;','&gamma;','&delta;','&epsilon;','&zeta;','&eta;','&theta;','&iota;',
+              '&kappa;','&lambda;','&mu;','&nu;','&xi;','&omicron;','&pi;','&rho;','&sigma;','&tau;',
+              '&upsilon;','&phi;','&chi;','&psi;','&omega;']; """HTML codes for lower-case Greek characters."""    # (24x9) # len=9
+
+
+
+# Move the array-valued constants from the namespace to __arrays (name -> list of values), and names bound to
+# the same list to __aliases (alias -> name of the array-valued constant):
+__arrays  = {}
+__aliases = {}
+for __name, __value in list(globals().items()):
+    if __name.startswith('_') or type(__value) is not list: continue
+    del globals()[__name]
+    __first = next((__array for __array, __values in __arrays.items() if __values is __value), None)
+    if __first is None:
+        __arrays[__name] = __value
+    else:
+        __aliases[__name] = __first
+del __name, __value, __first
+
+
+# Public names, including the array-valued constants, so that `from astroconst import *` keeps working:
+__all__ = [__name for __name in globals() if not __name.startswith('_')] + list(__arrays) + list(__aliases)
+
+
+def __getattr__(name):
+    """Create the array-valued constants (and their aliases) as numpy arrays on first access.
+
+    Parameters:
+      name (str):  Name of the requested module attribute.
+
+    Returns:
+      (np.array):  Array-valued constant with the requested name.
+
+    Note:
+      - This is only called for names that are not (yet) defined in the module, so that scalar constants can be
+        imported without importing numpy.  The arrays are cached in the module namespace after their creation.
+    """
+    
+    target = __aliases.get(name, name)
+    if target not in __arrays:
+        raise AttributeError('module '+repr(__name__)+' has no attribute '+repr(name))
+    
+    if target not in globals():
+        import numpy as np
+        globals()[target] = np.array(__arrays[target])
+        
+    globals()[name] = globals()[target]
+    return globals()[name]
+
+
+def __dir__():
+    """List the module attributes, including the array-valued constants that have not been created yet."""
+    return sorted(set(globals()) | set(__arrays) | set(__aliases))
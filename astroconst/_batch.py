@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" _batch.py:  Private helpers for the vectorised (batch) submodules of astroconst.
+"""
+
+
+import numpy as np
+
+chunk_size = 65536;  """Default number of array elements processed per chunk, to bound the size of temporary arrays."""
+
+
+def chunks(size, chunksize=None):
+    """Iterate over slices that split a flat array of a given size into chunks.
+
+    Parameters:
+      size (int):       Total number of elements.
+      chunksize (int):  Number of elements per chunk (optional; default: chunk_size).
+
+    Yields:
+      (slice):  Slice selecting the next chunk.
+    """
+
+    if chunksize is None: chunksize = chunk_size
+    for start in range(0, size, chunksize):
+        yield slice(start, min(start+chunksize, size))
+
+
+
+def float_dtype(*arrays):
+    """Return the floating-point dtype to compute in, without upcasting float32 input.
+
+    Parameters:
+      arrays (array-like):  Input arrays or scalars.
+
+    Returns:
+      (np.dtype):  Floating-point result type of the input, or np.float64 for non-float (e.g. integer) input.
+    """
+
+    dtype = np.result_type(*arrays)
+    if not np.issubdtype(dtype, np.floating): dtype = np.dtype(np.float64)
+    return dtype
+
+
+_kinds = {'f': 'floating-point', 'u': 'unsigned-integer', 'i': 'integer'}  # Descriptions of dtype kinds
+
+def flat_out(out, shape, kind='f'):
+    """Check an output array and return a flat view of it, so that no results are written into a copy.
+
+    Parameters:
+      out (array):   Output array supplied by the caller.
+      shape (tuple): Shape of the result.
+      kind (str):    Required dtype kind, e.g. 'f' for floating point (optional, default: 'f').
+
+    Returns:
+      (array):  One-dimensional view of out.
+
+    Note:
+      - A ValueError is raised if out is not a writeable, C-contiguous numpy array with the given shape and dtype
+        kind, since reshape() would then return a copy and the results would be lost.
+    """
+
+    if not isinstance(out, np.ndarray):
+        raise ValueError('out must be a numpy array, not %s' % type(out).__name__)
+    if out.shape != tuple(shape):
+        raise ValueError('out has shape %s, but the result has shape %s' % (out.shape, tuple(shape)))
+    if out.dtype.kind != kind:
+        raise ValueError('out has dtype %s, but a %s array is needed' % (out.dtype, _kinds.get(kind, kind)))
+    if not out.flags.c_contiguous:
+        raise ValueError('out must be C-contiguous')
+    if not out.flags.writeable:
+        raise ValueError('out must be writeable')
+    return out.reshape(-1)
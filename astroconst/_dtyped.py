@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" _dtyped.py:  Generate namespaces of the astroconst constants with a given numpy floating-point type.
+
+The sources of astroconst/__init__.py and astroconst/aa.py are parsed, every numeric literal is replaced by a
+numpy scalar created from its source text, and the code is executed.  The calculation is done in the wider of
+the target type and float64, so that derived constants like a_rad (which needs k_b^4 ~ 4e-92) are computed at
+least at the precision of the main module, and at the full precision of np.longdouble for the long-double
+namespace.  Afterwards, all numeric constants are rounded (once) to the target type, except the constants that
+are integers in astroconst (e.g. c, jd2000, second and mlen), which are kept as Python integers.
+
+The namespaces are generated from the source at import and are frozen: they do not follow changes of the
+constants by astroconst.editions.
+"""
+
+
+import ast
+import types
+
+import numpy as np
+
+import astroconst as _ac
+from . import aa as _aa
+
+
+_pi = '3.14159265358979323846264338327950288'  # π with enough digits for any floating-point type
+
+
+class _Literals(ast.NodeTransformer):
+    """Replace numeric literals by calls to __dtype('<literal>') and remove the imports of math and aa."""
+
+    def __init__(self, source):
+        self.lines = source.encode().split(b'\n')  # The column offsets of ast are in bytes
+
+    def visit_Constant(self, node):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)): return node
+        line = self.lines[node.lineno-1]
+        text = line[node.col_offset:node.end_col_offset].decode().replace('_', '')
+        call = ast.Call(func=ast.Name(id='__dtype', ctx=ast.Load()), args=[ast.Constant(value=text)], keywords=[])
+        return ast.copy_location(call, node)
+
+    def visit_Import(self, node):
+        return None if [alias.name for alias in node.names] == ['math'] else node
+
+    def visit_ImportFrom(self, node):
+        return None if node.level == 1 and [alias.name for alias in node.names] == ['aa'] else node
+
+
+def _execute(module, namespace, calc_dtype):
+    """Execute the transformed source of a module in a namespace, with literals of type calc_dtype."""
+
+    with open(module.__file__, encoding='utf-8') as sfile:
+        source = sfile.read()
+
+    tree = ast.fix_missing_locations(_Literals(source).visit(ast.parse(source)))
+    namespace['__dtype'] = calc_dtype
+    namespace['__math']  = types.SimpleNamespace(pi=calc_dtype(_pi), cos=np.cos, sin=np.sin)
+    exec(compile(tree, module.__file__, 'exec'), namespace)  # pylint: disable=exec-used
+    del namespace['__dtype'], namespace['__math']
+
+
+def _is_int(value):
+    """Return True if value is an integer (not a bool) or a non-empty list of integers."""
+    if isinstance(value, list): return bool(value) and all(_is_int(elem) for elem in value)
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _cast(value, dtype, original=None):
+    """Round a numeric constant, or the values of a numeric list, to dtype; if the original value of the constant
+    in astroconst is an integer (list), it is returned unchanged."""
+
+    if isinstance(value, (bool, np.bool_)): return value
+    if _is_int(original): return original
+    if isinstance(value, (int, float, np.number)): return dtype(value)
+    if isinstance(value, list) and all(isinstance(elem, (int, float, np.number)) for elem in value):
+        return [dtype(elem) for elem in value]
+    return value
+
+
+def populate(namespace, dtype):
+    """Fill a module namespace with the astroconst constants in the given floating-point type.
+
+    Parameters:
+      namespace (dict):   Globals of the module to fill, e.g. globals() of astroconst.f32.
+      dtype (np.dtype):   Floating-point type of the constants, e.g. np.float32 or np.longdouble.
+
+    Note:
+      - The numeric scalars become numpy scalars of type dtype, and the numeric array-valued constants are
+        created (lazily, on first access, as in astroconst) as arrays of type dtype.  Constants that are integers
+        in astroconst remain integers.
+      - The submodule aa is available as an attribute of the namespace, with constants of the same type.
+    """
+
+    dtype = np.dtype(dtype).type
+    calc_dtype = np.result_type(dtype, np.float64).type
+    doc = namespace.get('__doc__')
+
+    aa_namespace = types.ModuleType(namespace['__name__']+'.aa', _aa.__doc__)
+    _execute(_aa, vars(aa_namespace), calc_dtype)
+    for name, value in list(vars(aa_namespace).items()):
+        if not name.startswith('__'): setattr(aa_namespace, name, _cast(value, dtype, vars(_aa).get(name)))
+
+    namespace['aa'] = aa_namespace
+    _execute(_ac, namespace, calc_dtype)
+    for name, value in list(namespace.items()):
+        if not name.startswith('__'): namespace[name] = _cast(value, dtype, vars(_ac).get(name))
+
+    arrays, ac_arrays = namespace['__arrays'], vars(_ac)['__arrays']
+    for name, value in arrays.items():
+        arrays[name] = _cast(value, dtype, ac_arrays.get(name))
+
+    namespace['__doc__'] = doc
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" _rotation.py:  Private helpers to rotate arrays of spherical coordinates and vectors in chunks.
+"""
+
+
+import numpy as np
+
+from ._batch import chunks, flat_out, float_dtype
+from .angles import wrap_2pi
+
+
+def rotate_angles(lon, lat, matrix, out=None, chunksize=None):
+    """Rotate spherical coordinates with a rotation matrix, in chunks.
+
+    Parameters:
+      lon (float or array):  Longitude(s) (rad).
+      lat (float or array):  Latitude(s) (rad).
+      matrix (array):        3x3 rotation matrix M, so that v_new = M @ v for unit vectors v.
+      out (tuple):           Tuple of two C-contiguous output arrays for the new (lon, lat) (optional).
+      chunksize (int):       Number of elements processed at once (optional).
+
+    Returns:
+      tuple (array,array):  Tuple containing (lon, lat) in the new frame; lon in [0, 2π), lat in [-π/2, π/2] (rad).
+    """
+
+    lon, lat = np.asarray(lon), np.asarray(lat)
+    dtype = float_dtype(lon, lat)
+    mat = np.asarray(matrix, dtype=dtype)
+
+    shape = np.broadcast_shapes(lon.shape, lat.shape)
+    lon = np.broadcast_to(lon, shape).reshape(-1)
+    lat = np.broadcast_to(lat, shape).reshape(-1)
+
+    if out is None: out = (np.empty(shape, dtype=dtype), np.empty(shape, dtype=dtype))
+    lon_out, lat_out = flat_out(out[0], shape), flat_out(out[1], shape)
+
+    for chunk in chunks(lon.size, chunksize):
+        cos_lat = np.cos(lat[chunk], dtype=dtype)
+        x = np.cos(lon[chunk], dtype=dtype) * cos_lat
+        y = np.sin(lon[chunk], dtype=dtype) * cos_lat
+        z = np.sin(lat[chunk], dtype=dtype)
+
+        x2 = mat[0,0]*x + mat[0,1]*y + mat[0,2]*z
+        y2 = mat[1,0]*x + mat[1,1]*y + mat[1,2]*z
+        z2 = mat[2,0]*x + mat[2,1]*y + mat[2,2]*z
+
+        wrap_2pi(np.arctan2(y2, x2), out=lon_out[chunk])
+        np.arctan2(z2, np.hypot(x2, y2), out=lat_out[chunk])
+
+    if shape == (): return lon_out[0], lat_out[0]
+    return out
+
+
+def rotate_vectors(vec, matrix, out=None, chunksize=None):
+    """Rotate vectors with a rotation matrix, in chunks.
+
+    Parameters:
+      vec (array):      Array of vectors with shape (..., 3).
+      matrix (array):   3x3 rotation matrix M, so that v_new = M @ v.
+      out (array):      C-contiguous output array with the same shape (optional; may be vec for in-place operation).
+      chunksize (int):  Number of vectors processed at once (optional).
+
+    Returns:
+      (array):  Rotated vectors with shape (..., 3).
+    """
+
+    vec = np.asarray(vec)
+    if vec.shape[-1] != 3:
+        raise ValueError('the last dimension of the vector array must have size 3, not %i' % vec.shape[-1])
+
+    dtype = float_dtype(vec)
+    mat_t = np.asarray(matrix, dtype=dtype).T  # Row vectors: v' = v @ M^T
+    if out is None: out = np.empty(vec.shape, dtype=dtype)
+
+    in_place = np.shares_memory(vec, out)
+    vec2 = vec.reshape(-1, 3)
+    out2 = flat_out(out, vec.shape).reshape(-1, 3)
+    for chunk in chunks(len(vec2), chunksize):
+        if in_place:
+            out2[chunk] = vec2[chunk] @ mat_t  # matmul cannot write into its own input
+        else:
+            np.matmul(vec2[chunk], mat_t, out=out2[chunk])
+
+    return out
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" angles.py:  Vectorised angle conversions, based on the conversion factors d2r, h2r, as2r, etc.
+
+All functions accept scalars and numpy arrays, and most accept an output buffer `out`, which may be the input
+array itself for in-place operation.  The dtype of the input is kept, so that float32 arrays stay float32.
+"""
+
+
+import numpy as np
+
+from . import pi, pi2, d2r, r2d, h2r, r2h, am2r, r2am, as2r, r2as, mas2r, r2mas
+from ._batch import chunks
+
+
+def deg2rad(deg, out=None):
+    """Convert degrees to radians, using d2r."""
+    return np.multiply(deg, d2r, out=out)
+
+def rad2deg(rad, out=None):
+    """Convert radians to degrees, using r2d."""
+    return np.multiply(rad, r2d, out=out)
+
+def hours2rad(hours, out=None):
+    """Convert hours to radians, using h2r."""
+    return np.multiply(hours, h2r, out=out)
+
+def rad2hours(rad, out=None):
+    """Convert radians to hours, using r2h."""
+    return np.multiply(rad, r2h, out=out)
+
+def arcmin2rad(arcmin, out=None):
+    """Convert arcminutes to radians, using am2r."""
+    return np.multiply(arcmin, am2r, out=out)
+
+def rad2arcmin(rad, out=None):
+    """Convert radians to arcminutes, using r2am."""
+    return np.multiply(rad, r2am, out=out)
+
+def arcsec2rad(arcsec, out=None):
+    """Convert arcseconds to radians, using as2r."""
+    return np.multiply(arcsec, as2r, out=out)
+
+def rad2arcsec(rad, out=None):
+    """Convert radians to arcseconds, using r2as."""
+    return np.multiply(rad, r2as, out=out)
+
+def mas2rad(mas, out=None):
+    """Convert milliarcseconds to radians, using mas2r."""
+    return np.multiply(mas, mas2r, out=out)
+
+def rad2mas(rad, out=None):
+    """Convert radians to milliarcseconds, using r2mas."""
+    return np.multiply(rad, r2mas, out=out)
+
+
+def wrap_2pi(angle, out=None):
+    """Wrap angles to the interval [0, 2π).
+
+    Parameters:
+      angle (float or array):  Angle(s) (rad).
+      out (array):             Output buffer (optional; may be angle for in-place operation).
+
+    Returns:
+      (float or array):  Angle(s) in [0, 2π) (rad).
+    """
+
+    out = np.mod(angle, pi2, out=out)
+    return _fix_2pi(out)
+
+
+def wrap_pi(angle, out=None):
+    """Wrap angles to the interval (-π, π].
+
+    Parameters:
+      angle (float or array):  Angle(s) (rad).
+      out (array):             Output buffer (optional; may be angle for in-place operation).
+
+    Returns:
+      (float or array):  Angle(s) in (-π, π] (rad).
+    """
+
+    angle = np.asarray(angle)
+    if out is None: out = np.empty(angle.shape, dtype=np.result_type(angle, 1.0))
+
+    # π - ((π - angle) mod 2π), using out for all intermediate results:
+    np.subtract(pi, angle, out=out)
+    _fix_2pi(np.mod(out, pi2, out=out))
+    np.subtract(pi, out, out=out)
+
+    if out.ndim == 0: return out[()]
+    return out
+
+
+def _fix_2pi(angle):
+    """Replace 2π by 0 in the result of a modulo operation; x mod 2π rounds to 2π for tiny negative x."""
+
+    if not isinstance(angle, np.ndarray):
+        return angle.dtype.type(0) if angle >= pi2 else angle
+
+    np.copyto(angle, 0, where=angle >= pi2)
+    return angle
+
+
+def split_sexagesimal(value, factor=1, decimals=None, chunksize=None):
+    """Split values into sign, whole units, minutes and seconds, e.g. degrees into d:m:s or hours into h:m:s.
+
+    Parameters:
+      value (float or array):  Value(s) to split.
+      factor (float):          Factor to convert value to the whole units, e.g. r2d or r2h (optional, default: 1).
+      decimals (int):          Round the seconds to this number of decimals, and carry into minutes and units
+                               where needed, so that e.g. 59.999s becomes the next minute (optional).
+      chunksize (int):         Number of elements processed at once (optional).
+
+    Returns:
+      tuple (array,array,array,array):  Tuple containing (sign, units, minutes, seconds):
+
+      - sign (int8 array):       Sign of the value: -1 or +1.  Needed to represent e.g. -0°30'.
+      - units (int32 array):     Absolute number of whole units (degrees or hours).
+      - minutes (int32 array):   Whole minutes, 0-59.
+      - seconds (float array):   Seconds, [0, 60).
+    """
+
+    value = np.asarray(value)
+    shape = value.shape
+    value = value.reshape(-1)
+    ftype = np.result_type(value, 1.0)
+
+    sign    = np.empty(value.size, dtype=np.int8)
+    units   = np.empty(value.size, dtype=np.int32)
+    minutes = np.empty(value.size, dtype=np.int32)
+    seconds = np.empty(value.size, dtype=ftype)
+
+    for chunk in chunks(value.size, chunksize):
+        val = np.multiply(value[chunk], factor*3600, dtype=ftype)  # Value in seconds
+        neg = val < 0
+        np.abs(val, out=val)
+
+        if decimals is None:
+            mins, secs = np.divmod(val, 60)
+            whole, mins = np.divmod(mins, 60)
+        else:
+            # Use integer ticks of 10^-decimals seconds, so that the carry is exact:
+            scale = 10**decimals
+            ticks = np.rint(val*scale).astype(np.int64)
+            neg &= ticks != 0  # Values that round to zero are not negative
+            mins, secs = np.divmod(ticks, 60*scale)
+            whole, mins = np.divmod(mins, 60)
+            secs = np.divide(secs, scale, dtype=ftype)
+
+        sign[chunk]    = np.where(neg, -1, 1)
+        units[chunk]   = whole
+        minutes[chunk] = mins
+        seconds[chunk] = secs
+
+    return sign.reshape(shape), units.reshape(shape), minutes.reshape(shape), seconds.reshape(shape)
+
+
+def join_sexagesimal(units, minutes=0, seconds=0, sign=None, factor=1, out=None):
+    """Join whole units, minutes and seconds (e.g. d:m:s or h:m:s) into a single value.
+
+    Parameters:
+      units (float or array):    Whole units (e.g. degrees or hours).  Without sign, the sign of units is used,
+                                 including that of -0.0.
+      minutes (float or array):  Minutes (optional, default: 0).
+      seconds (float or array):  Seconds (optional, default: 0).
+      sign (int or array):       Sign of the value (-1 or +1; optional).  Use this to represent e.g. -0°30' with
+                                 integer units.
+      factor (float):            Factor to convert the result from units, e.g. d2r or h2r (optional, default: 1).
+      out (array):               Output buffer (optional; may be one of the inputs for in-place operation).
+
+    Returns:
+      (float or array):  Joined value(s), multiplied by factor.
+    """
+
+    units, minutes, seconds = [val if np.isscalar(val) else np.asarray(val) for val in (units, minutes, seconds)]
+    if out is None:
+        shape = np.broadcast_shapes(np.shape(units), np.shape(minutes), np.shape(seconds), np.shape(sign))
+        out = np.empty(shape, dtype=np.result_type(units, minutes, seconds, 1.0))
+    else:
+        # The inputs that are read after out was first written must not be overwritten when out is one of them:
+        units, minutes, sign = [val.copy() if isinstance(val, np.ndarray) and np.may_share_memory(val, out) else val
+                                for val in (units, minutes, sign)]
+
+    # sign * (|units| + (minutes + seconds/60)/60), using out for all intermediate results:
+    np.divide(seconds, 60, out=out)
+    np.add(out, minutes, out=out)
+    np.divide(out, 60, out=out)
+    np.copysign(out, units, out=out)
+    np.add(out, units, out=out)
+    if sign is not None:
+        np.copysign(out, sign, out=out)
+    if factor != 1:
+        np.multiply(out, factor, out=out)
+
+    if out.ndim == 0: return out[()]
+    return out
+
+
+def rad2dms(angle, decimals=None, chunksize=None):
+    """Split angles in radians into sign, degrees, arcminutes and arcseconds.  See split_sexagesimal()."""
+    return split_sexagesimal(angle, r2d, decimals, chunksize)
+
+def rad2hms(angle, decimals=None, chunksize=None):
+    """Split angles in radians into sign, hours, minutes and seconds.  See split_sexagesimal()."""
+    return split_sexagesimal(angle, r2h, decimals, chunksize)
+
+def dms2rad(deg, arcmin=0, arcsec=0, sign=None, out=None):
+    """Convert degrees, arcminutes and arcseconds to radians.  See join_sexagesimal()."""
+    return join_sexagesimal(deg, arcmin, arcsec, sign, d2r, out)
+
+def hms2rad(hours, minutes=0, seconds=0, sign=None, out=None):
+    """Convert hours, minutes and seconds to radians.  See join_sexagesimal()."""
+    return join_sexagesimal(hours, minutes, seconds, sign, h2r, out)
@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" cosmology.py:  Vectorised distances and times in a flat ΛCDM universe, using H0, tH, c and cmb_temp.
+
+For each set of density parameters, the integrals D(u) = ∫ (1+z)/E du and T(u) = ∫ 1/E du, with u = ln(1+z) and
+E = H/H0 = √(Ω_r (1+z)⁴ + Ω_m (1+z)³ + Ω_Λ), are computed once on a grid in u with Gauss-Legendre quadrature
+(accurate to machine precision), and the ratios D/u and T/u are stored together with their derivatives.  Batched redshift queries are
+then answered by cubic Hermite interpolation of the table, without quadrature per element.  The tables are
+dimensionless, cached (the least recently used of more than cache_size tables are discarded) and extended
+automatically for redshifts above z_max.  The relative interpolation error of a table is measured when it is
+built and returned by error_bound(); it is ~1e-10 for the default node spacing.
+
+By default, the current values of astroconst.H0 and astroconst.cmb_temp are used, so that a change with
+astroconst.editions is taken into account.  Distances are in metres and times in seconds.  Redshifts must be
+≥ 0; the results are NaN for negative or infinite redshifts.
+
+Example:
+  >>> import numpy as np
+  >>> from astroconst import cosmology, Mpc, Gyr
+  >>> z = np.random.uniform(0, 3, 10_000_000)
+  >>> d_l = cosmology.luminosity_distance(z) / Mpc
+  >>> cosmology.age(0) / Gyr         # 13.79
+  >>> cosmology.error_bound()        # ~1e-10
+"""
+
+
+import functools
+import math
+from collections import namedtuple
+
+import numpy as np
+
+import astroconst as _ac
+from ._batch import chunks, flat_out, float_dtype
+
+
+omega_matter = 0.315;  """Matter density parameter Ω_m (2018 Planck results)"""
+n_eff = 3.046;  """Effective number of neutrino species, for the radiation density"""
+z_max = 1e4;  """Default maximum redshift of the lookup tables; higher redshifts extend the table to the next power of ten"""
+step = 0.01;  """Default node spacing of the lookup tables in u = ln(1+z)"""
+cache_size = 16;  """Maximum number of cached lookup tables"""
+
+_gl_nodes, _gl_weights = np.polynomial.legendre.leggauss(8)  # Exact for polynomials of degree 15
+
+# Lookup table: node spacing, coefficients of the cubic polynomials in t = u/h - i per interval i for D/u and T/u
+# (shape (2, n, 4)), the largest u, ∫_umax^∞ du/E for the age, and the relative error bound:
+_Table = namedtuple('_Table', 'step coefs umax t_tail error')
+
+
+def omega_radiation(h0=None, temp=None, neff=n_eff):
+    """Compute the density parameter of radiation (photons and relativistic neutrinos).
+
+    Parameters:
+      h0 (float):    Hubble constant (Hz) (optional, default: astroconst.H0).
+      temp (float):  Temperature of the cosmic microwave background (K) (optional, default: astroconst.cmb_temp).
+      neff (float):  Effective number of neutrino species (optional, default: n_eff).
+
+    Returns:
+      (float):  Ω_r = Ω_γ (1 + 7/8 (4/11)^(4/3) N_eff), ~9.1e-5 for the defaults.
+    """
+
+    if h0 is None: h0 = _ac.H0
+    if temp is None: temp = _ac.cmb_temp
+    rho_crit = 3*h0**2 / (8*_ac.pi*_ac.G)
+    omega_gamma = _ac.a_rad*temp**4/_ac.c**2 / rho_crit
+    return omega_gamma * (1 + 7/8*(4/11)**(4/3)*neff)
+
+
+def _integrands(u, omega_m, omega_r):
+    """Return the integrands (1+z)/E and 1/E of D and T as a function of u = ln(1+z), stacked on the last axis."""
+    opz = np.exp(u)
+    inv_e = 1/np.sqrt((omega_r*opz + omega_m)*opz**3 + (1 - omega_m - omega_r))
+    return np.stack([opz*inv_e, inv_e], axis=-1)
+
+
+def _quad(u1, u2, omega_m, omega_r):
+    """Return the integrals of D and T over the intervals [u1, u2] (shape (..., 2))."""
+    half = (u2 - u1)/2
+    points = (u1 + half)[..., None] + half[..., None]*_gl_nodes
+    return half[..., None] * np.einsum('...kj,k->...j', _integrands(points, omega_m, omega_r), _gl_weights)
+
+
+@functools.lru_cache(maxsize=cache_size)
+def _table(omega_m, omega_r, zmax, step_):
+    """Build (and cache) the lookup table for a parameter set."""
+
+    umax = math.log1p(zmax)
+    size = max(math.ceil(umax/step_), 1)
+    hstep = umax/size
+    nodes = np.arange(size+1) * hstep
+    nodes[-1] = umax
+
+    # Interpolate the ratios R(u) = D(u)/u and T(u)/u, which are smooth and non-zero at u = 0, so that the
+    # relative error is small for all redshifts.  R' = (f - R)/u, and R(0) = f(0), R'(0) = f'(0)/2:
+    integrands = _integrands(nodes, omega_m, omega_r)
+    values = np.empty((size+1, 2))
+    np.cumsum(_quad(nodes[:-1], nodes[1:], omega_m, omega_r), axis=0, out=values[1:])
+    values[1:] /= nodes[1:, None]
+    values[0] = integrands[0]
+    slopes = np.empty((size+1, 2))
+    slopes[1:] = (integrands[1:] - values[1:]) / nodes[1:, None] * hstep  # dR/dt
+    dlne = (4*omega_r + 3*omega_m)/2                                      # d ln E/du at u = 0
+    slopes[0] = np.array([1 - dlne, -dlne]) / 2 * hstep
+
+    # Hermite cubic per interval: R(t) = c0 + c1 t + c2 t² + c3 t³, matching the values and slopes at the nodes:
+    val0, val1, slope0, slope1 = values[:-1], values[1:], slopes[:-1], slopes[1:]
+    coefs = np.stack([val0, slope0, 3*(val1-val0) - 2*slope0 - slope1, 2*(val0-val1) + slope0 + slope1], axis=-1)
+    coefs = np.ascontiguousarray(coefs.transpose(1, 0, 2))
+
+    # The interpolation error is largest near the middle of the intervals; compare there with the quadrature
+    # and add the rounding error of the cumulative sum:
+    mids = nodes[:-1] + hstep/2
+    exact = (values[:-1]*nodes[:-1, None] + _quad(nodes[:-1], mids, omega_m, omega_r)) / mids[:, None]
+    interp = coefs[..., 0] + coefs[..., 1]/2 + coefs[..., 2]/4 + coefs[..., 3]/8
+    error = 2*np.max(np.abs(interp/exact.T - 1)) + size*np.finfo(float).eps
+
+    # Tail of the age integral, ∫_umax^∞ du/E = ∫_0^x a da / √(Ω_r + Ω_m a + Ω_Λ a⁴), with x = 1/(1+zmax).  With
+    # a = s², this is ∫_0^√x 2s³ ds / √(Ω_r + Ω_m s² + Ω_Λ s⁸), which is smooth at s = 0 also for Ω_r = 0:
+    scale = np.array(math.sqrt(1/(1+zmax))/2)
+    points = scale + scale*_gl_nodes
+    integrand = 2*points**3 / np.sqrt(omega_r + omega_m*points**2 + (1-omega_m-omega_r)*points**8)
+    t_tail = float(scale * np.sum(_gl_weights*integrand))
+
+    coefs.flags.writeable = False
+    return _Table(hstep, coefs, umax, t_tail, float(error))
+
+
+def _get_table(omega_m, omega_r, h0, zmax):
+    """Return the table for the parameters, covering redshifts up to zmax."""
+    if omega_m is None: omega_m = omega_matter
+    if omega_r is None: omega_r = omega_radiation(h0)
+    if zmax > z_max: zmax = 10**math.ceil(math.log10(zmax))
+    else: zmax = z_max
+    return _table(float(omega_m), float(omega_r), float(zmax), step)
+
+
+def error_bound(omega_m=None, omega_r=None, h0=None, zmax=z_max):
+    """Return the bound on the relative interpolation error of the lookup table for a parameter set.
+
+    Parameters:
+      omega_m (float):   Matter density parameter Ω_m (optional, default: omega_matter).
+      omega_r (float):   Radiation density parameter Ω_r (optional, default: omega_radiation(h0)).
+      h0 (float):        Hubble constant (Hz), used for the default Ω_r (optional, default: astroconst.H0).
+      zmax (float):      Maximum redshift of the table (optional, default: z_max).
+
+    Returns:
+      (float):  Relative error bound of the comoving distance and the lookback time: twice the largest
+                interpolation error found halfway between the nodes, plus the rounding error of the cumulative
+                sum.
+    """
+    return _get_table(omega_m, omega_r, h0, zmax).error
+
+
+def clear_cache():
+    """Discard the cached lookup tables."""
+    _table.cache_clear()
+
+
+def _evaluate(redshift, column, finish, omega_m, omega_r, h0, out, chunksize):
+    """Interpolate column 0 (D) or 1 (T) of the table for redshifts, and apply finish(values, z) per chunk."""
+
+    redshift = np.asarray(redshift)
+    dtype = float_dtype(redshift)
+    if h0 is None: h0 = _ac.H0
+
+    z_flat = redshift.reshape(-1)
+    finite = z_flat[np.isfinite(z_flat)]
+    table = _get_table(omega_m, omega_r, h0, float(finite.max()) if finite.size else 0.0)
+    coefs = table.coefs[column]
+    size = coefs.shape[0]
+
+    if out is None: out = np.empty(redshift.shape, dtype=dtype)
+    out_flat = flat_out(out, redshift.shape)
+
+    for chunk in chunks(z_flat.size, chunksize):
+        zchunk = z_flat[chunk].astype(np.float64, copy=False)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            scaled = np.log1p(zchunk) / table.step
+        valid = (scaled >= 0) & (scaled <= size)
+        scaled[~valid] = 0
+        index = np.minimum(scaled.astype(np.intp), size-1)
+        tval = scaled - index
+        cfs = coefs[index]
+        res = ((cfs[:, 3]*tval + cfs[:, 2])*tval + cfs[:, 1])*tval + cfs[:, 0]
+        res *= scaled*table.step  # R(u) u
+        res = finish(res, zchunk, table, h0)
+        res[~valid] = np.nan
+        out_flat[chunk] = res
+
+    if out.ndim == 0: return out[()]
+    return out
+
+
+def comoving_distance(redshift, omega_m=None, omega_r=None, h0=None, out=None, chunksize=None):
+    """Compute the line-of-sight comoving distance, which equals the transverse comoving distance in a flat universe.
+
+    Parameters:
+      redshift (float or array):  Redshift(s) z ≥ 0.
+      omega_m (float):            Matter density parameter Ω_m (optional, default: omega_matter).
+      omega_r (float):            Radiation density parameter Ω_r (optional, default: omega_radiation(h0)).
+      h0 (float):                 Hubble constant (Hz) (optional, default: astroconst.H0).
+      out (array):                C-contiguous output array with the shape of redshift (optional).
+      chunksize (int):            Number of elements processed at once (optional).
+
+    Returns:
+      (float or array):  Comoving distance(s) D_C = c/H0 ∫_0^z dz'/E(z') (m).
+
+    Note:
+      - Ω_Λ = 1 - Ω_m - Ω_r.
+    """
+    return _evaluate(redshift, 0, lambda res, z, table, h0: res*(_ac.c/h0), omega_m, omega_r, h0, out, chunksize)
+
+
+def luminosity_distance(redshift, omega_m=None, omega_r=None, h0=None, out=None, chunksize=None):
+    """Compute the luminosity distance.
+
+    Parameters:
+      redshift (float or array):  Redshift(s) z ≥ 0.
+      omega_m (float):            Matter density parameter Ω_m (optional, default: omega_matter).
+      omega_r (float):            Radiation density parameter Ω_r (optional, default: omega_radiation(h0)).
+      h0 (float):                 Hubble constant (Hz) (optional, default: astroconst.H0).
+      out (array):                C-contiguous output array with the shape of redshift (optional).
+      chunksize (int):            Number of elements processed at once (optional).
+
+    Returns:
+      (float or array):  Luminosity distance(s) D_L = (1+z) D_C (m).
+    """
+    return _evaluate(redshift, 0, lambda res, z, table, h0: res*(_ac.c/h0)*(1+z), omega_m, omega_r, h0, out,
+                     chunksize)
+
+
+def angular_diameter_distance(redshift, omega_m=None, omega_r=None, h0=None, out=None, chunksize=None):
+    """Compute the angular-diameter distance.
+
+    Parameters:
+      redshift (float or array):  Redshift(s) z ≥ 0.
+      omega_m (float):            Matter density parameter Ω_m (optional, default: omega_matter).
+      omega_r (float):            Radiation density parameter Ω_r (optional, default: omega_radiation(h0)).
+      h0 (float):                 Hubble constant (Hz) (optional, default: astroconst.H0).
+      out (array):                C-contiguous output array with the shape of redshift (optional).
+      chunksize (int):            Number of elements processed at once (optional).
+
+    Returns:
+      (float or array):  Angular-diameter distance(s) D_A = D_C / (1+z) (m).
+    """
+    return _evaluate(redshift, 0, lambda res, z, table, h0: res*(_ac.c/h0)/(1+z), omega_m, omega_r, h0, out,
+                     chunksize)
+
+
+def distance_modulus(redshift, omega_m=None, omega_r=None, h0=None, out=None, chunksize=None):
+    """Compute the distance modulus.
+
+    Parameters:
+      redshift (float or array):  Redshift(s) z > 0.
+      omega_m (float):            Matter density parameter Ω_m (optional, default: omega_matter).
+      omega_r (float):            Radiation density parameter Ω_r (optional, default: omega_radiation(h0)).
+      h0 (float):                 Hubble constant (Hz) (optional, default: astroconst.H0).
+      out (array):                C-contiguous output array with the shape of redshift (optional).
+      chunksize (int):            Number of elements processed at once (optional).
+
+    Returns:
+      (float or array):  Distance modulus/moduli μ = 5 log10(D_L / 10 pc) (mag).
+    """
+
+    def finish(res, z, table, h0):
+        with np.errstate(divide='ignore'):
+            return 5*np.log10(res*(_ac.c/h0/(10*_ac.pc))*(1+z))
+    return _evaluate(redshift, 0, finish, omega_m, omega_r, h0, out, chunksize)
+
+
+def lookback_time(redshift, omega_m=None, omega_r=None, h0=None, out=None, chunksize=None):
+    """Compute the lookback time.
+
+    Parameters:
+      redshift (float or array):  Redshift(s) z ≥ 0.
+      omega_m (float):            Matter density parameter Ω_m (optional, default: omega_matter).
+      omega_r (float):            Radiation density parameter Ω_r (optional, default: omega_radiation(h0)).
+      h0 (float):                 Hubble constant (Hz) (optional, default: astroconst.H0).
+      out (array):                C-contiguous output array with the shape of redshift (optional).
+      chunksize (int):            Number of elements processed at once (optional).
+
+    Returns:
+      (float or array):  Lookback time(s) t_H ∫_0^z dz'/((1+z') E(z')) (s).
+    """
+    return _evaluate(redshift, 1, lambda res, z, table, h0: res/h0, omega_m, omega_r, h0, out, chunksize)
+
+
+def age(redshift, omega_m=None, omega_r=None, h0=None, out=None, chunksize=None):
+    """Compute the age of the universe at a redshift.
+
+    Parameters:
+      redshift (float or array):  Redshift(s) z ≥ 0.
+      omega_m (float):            Matter density parameter Ω_m (optional, default: omega_matter).
+      omega_r (float):            Radiation density parameter Ω_r (optional, default: omega_radiation(h0)).
+      h0 (float):                 Hubble constant (Hz) (optional, default: astroconst.H0).
+      out (array):                C-contiguous output array with the shape of redshift (optional).
+      chunksize (int):            Number of elements processed at once (optional).
+
+    Returns:
+      (float or array):  Age(s) t_H ∫_z^∞ dz'/((1+z') E(z')) (s); age(0) ≈ astroconst.age_of_universe.
+
+    Note:
+      - The relative error is bounded by error_bound() times age(0)/age(z).
+    """
+
+    def finish(res, z, table, h0):
+        total = table.coefs[1, -1].sum()*table.umax + table.t_tail  # T(umax) + ∫_umax^∞ du/E
+        return (total - res)/h0
+    return _evaluate(redshift, 1, finish, omega_m, omega_r, h0, out, chunksize)
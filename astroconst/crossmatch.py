@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" crossmatch.py:  Spatial index of sky positions for batched cone searches and catalogue cross-matching.
+
+The positions of a catalogue are stored as 3-D unit vectors, sorted by the Morton (Z-order) key of their cell in
+a grid of 2^21 cells per axis over the cube [-1, 1]³ (cells of ~0.2″).  The Morton order forms an implicit
+octree: every aligned cube of 2^j x 2^j x 2^j cells is a contiguous range of keys.  A cone with radius r around
+a query position lies within a box of ±2 sin(r/2) around its unit vector, which is covered by at most 8 such
+cubes, so that the candidates are found with 16 binary searches, i.e. in O(log N) time, for any radius.  The
+candidates are then filtered exactly on the chord distance.  Separations are computed as
+2 atan2(|a-b|, |a+b|) from the unit vectors a and b, which is accurate for all angles (unlike the arccos of
+the dot product near 0 and the haversine formula near π).
+
+All angles are in radians; use e.g. radius = 1*as2r or 50*mas2r.  Queries are processed in chunks, optionally in
+parallel threads (numpy releases the GIL in the heavy operations).
+
+Example:
+  >>> import numpy as np
+  >>> from astroconst import crossmatch, as2r
+  >>> index = crossmatch.SkyIndex(ra_cat, dec_cat)
+  >>> match, sep = index.match(ra, dec, 1*as2r, workers=4)       # Nearest neighbour within 1″, or -1
+  >>> query, found, sep = index.cone_search(ra, dec, 30*as2r)    # All pairs within 30″
+"""
+
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from ._batch import chunks
+
+
+_bits  = 21                 # Number of bits of the grid index per axis; 3 x 21 = 63 bits per key
+_ncell = 1 << _bits         # Number of cells per axis
+_cell  = 2/_ncell           # Size of a cell (in the units of the unit vectors)
+_max_level = _bits - 1      # Largest cube level used in queries: 2 x 2 x 2 cubes of 2^20 cells cover the grid
+
+# Masks to spread the bits of a 21-bit integer to every third bit of a 63-bit integer:
+_spread_steps = [(32, 0x1f00000000ffff), (16, 0x1f0000ff0000ff), (8, 0x100f00f00f00f00f),
+                 (4, 0x10c30c30c30c30c3), (2, 0x1249249249249249)]
+
+
+def _spread(ivals):
+    """Spread the bits of 21-bit integers to every third bit, for Morton keys."""
+    val = ivals.astype(np.uint64)
+    for shift, mask in _spread_steps:
+        val = (val | (val << np.uint64(shift))) & np.uint64(mask)
+    return val
+
+
+def _morton(cells):
+    """Return the Morton keys (uint64) of integer cell coordinates with shape (n, 3)."""
+    return _spread(cells[:, 0]) | (_spread(cells[:, 1]) << np.uint64(1)) | (_spread(cells[:, 2]) << np.uint64(2))
+
+
+def unit_vectors(ra, dec, dtype=np.float64):
+    """Convert spherical coordinates to unit vectors.
+
+    Parameters:
+      ra (float or array):   Longitude(s), e.g. right ascension(s) (rad).
+      dec (float or array):  Latitude(s), e.g. declination(s) (rad).
+      dtype (np.dtype):      Floating-point type of the vectors (optional, default: np.float64).
+
+    Returns:
+      (array):  Unit vectors with shape (..., 3).
+    """
+
+    ra, dec = np.asarray(ra, dtype=np.float64), np.asarray(dec, dtype=np.float64)
+    shape = np.broadcast_shapes(ra.shape, dec.shape)
+    vec = np.empty(shape + (3,), dtype=dtype)
+    cos_dec = np.cos(dec)
+    vec[..., 0] = np.cos(ra)*cos_dec
+    vec[..., 1] = np.sin(ra)*cos_dec
+    vec[..., 2] = np.sin(dec)
+    return vec
+
+
+def chord_to_angle(chord):
+    """Convert chord lengths between unit vectors to angles: 2 atan2(c, √(4-c²)) (rad), stable for all angles."""
+    chord = np.asarray(chord)
+    return 2*np.arctan2(chord, np.sqrt(np.maximum(4 - chord*chord, 0)))
+
+
+def angle_to_chord(angle):
+    """Convert angles (rad) to chord lengths between unit vectors: 2 sin(θ/2), for θ in [0, π]."""
+    return 2*np.sin(np.minimum(np.asarray(angle, dtype=np.float64), np.pi)/2)
+
+
+def separation(ra1, dec1, ra2, dec2, chunksize=None):
+    """Compute the angular separations between two sets of positions, accurately for all angles.
+
+    Parameters:
+      ra1 (float or array):   Longitude(s) of the first position(s) (rad).
+      dec1 (float or array):  Latitude(s) of the first position(s) (rad).
+      ra2 (float or array):   Longitude(s) of the second position(s) (rad).
+      dec2 (float or array):  Latitude(s) of the second position(s) (rad).
+      chunksize (int):        Number of elements processed at once (optional).
+
+    Returns:
+      (float or array):  Separation(s) 2 atan2(|a-b|, |a+b|) of the unit vectors a and b (rad).
+    """
+
+    arrays = [np.asarray(arr, dtype=np.float64) for arr in (ra1, dec1, ra2, dec2)]
+    shape = np.broadcast_shapes(*[arr.shape for arr in arrays])
+    ra1, dec1, ra2, dec2 = [np.broadcast_to(arr, shape).reshape(-1) for arr in arrays]
+    result = np.empty(shape)
+    res_flat = result.reshape(-1)
+
+    for chunk in chunks(res_flat.size, chunksize):
+        vec1 = unit_vectors(ra1[chunk], dec1[chunk])
+        vec2 = unit_vectors(ra2[chunk], dec2[chunk])
+        diff = np.sqrt(np.einsum('ij,ij->i', vec1 - vec2, vec1 - vec2))
+        vec1 += vec2
+        res_flat[chunk] = 2*np.arctan2(diff, np.sqrt(np.einsum('ij,ij->i', vec1, vec1)))
+
+    if result.ndim == 0: return result[()]
+    return result
+
+
+def _workers(workers):
+    """Return the number of threads to use: workers, or the number of CPUs for workers <= 0."""
+    if workers is None or workers > 0: return workers or 1
+    return os.cpu_count() or 1
+
+
+class SkyIndex:
+    """Spatial index of sky positions, for batched cone searches and nearest-neighbour cross-matching.
+
+    Parameters:
+      ra (array):        Longitudes, e.g. right ascensions, of the catalogue (rad).
+      dec (array):       Latitudes, e.g. declinations, of the catalogue (rad).
+      chunksize (int):   Number of positions processed at once while building the index (optional).
+
+    Attributes:
+      keys (array):      Sorted Morton keys of the cells of the catalogue positions (uint64).
+      vectors (array):   Unit vectors of the catalogue positions in the order of keys, shape (n, 3).
+      index (array):     Indices of the positions in the original catalogue, in the order of keys.
+
+    Note:
+      - The index uses 32 bytes per position (keys, vectors and index) and is read only; it can be shared
+        between threads.
+    """
+
+    def __init__(self, ra, dec, chunksize=None):
+        ra, dec = np.asarray(ra, dtype=np.float64).reshape(-1), np.asarray(dec, dtype=np.float64).reshape(-1)
+        if ra.size != dec.size:
+            raise ValueError('ra and dec must have the same size, not %i and %i' % (ra.size, dec.size))
+
+        keys = np.empty(ra.size, dtype=np.uint64)
+        for chunk in chunks(ra.size, chunksize):
+            keys[chunk] = _morton(self._cells(unit_vectors(ra[chunk], dec[chunk])))
+
+        self.index = np.argsort(keys, kind='stable')
+        self.keys = keys[self.index]
+        self.vectors = np.empty((ra.size, 3))
+        for chunk in chunks(ra.size, chunksize):
+            sel = self.index[chunk]
+            self.vectors[chunk] = unit_vectors(ra[sel], dec[sel])
+
+        for array in (self.index, self.keys, self.vectors):
+            array.setflags(write=False)
+
+    def __len__(self):
+        return self.keys.size
+
+    @staticmethod
+    def _cells(vec):
+        """Return the integer grid cells (shape (n, 3)) of (unit) vectors."""
+        return np.clip(((vec + 1)/_cell).astype(np.int64), 0, _ncell-1)
+
+    def _candidates(self, vec, chord):
+        """Return the pairs (query, position in the index, squared chord) of the catalogue positions within the
+        chord distances of the query vectors."""
+
+        nquery = vec.shape[0]
+        half = chord/_cell  # Half width of the box around a query, in cells
+        level = np.minimum(np.ceil(np.log2(2*half + 1)), _max_level).astype(np.int64)
+
+        scaled = (vec + 1)/_cell
+        lower = np.clip(np.floor(scaled - half[:, None]), 0, _ncell-1).astype(np.int64) >> level[:, None]
+        upper = np.clip(np.floor(scaled + half[:, None]), 0, _ncell-1).astype(np.int64) >> level[:, None]
+
+        # The box is covered by (at most) 2 x 2 x 2 aligned cubes of 2^level cells; each cube is a key range:
+        firsts, duplicates = [], []
+        size = np.uint64(1) << (np.uint64(3)*level.astype(np.uint64))
+        for corner in range(8):
+            use = [(corner >> axis) & 1 for axis in range(3)]
+            firsts.append(_morton(np.where(use, upper, lower) << level[:, None]))
+            duplicate = np.zeros(nquery, dtype=bool)
+            for axis in range(3):
+                if use[axis]: duplicate |= upper[:, axis] == lower[:, axis]
+            duplicates.append(duplicate)
+        firsts = np.stack(firsts, axis=1)
+
+        # Search the range boundaries in sorted order, which is much faster for large indices (cache locality):
+        bounds = np.concatenate([firsts.reshape(-1), (firsts + size[:, None]).reshape(-1)])
+        order = np.argsort(bounds)
+        found = np.empty(bounds.size, dtype=np.intp)
+        found[order] = np.searchsorted(self.keys, bounds[order])
+        starts, ends = found[:firsts.size], found[firsts.size:]
+        counts = np.where(np.stack(duplicates, axis=1).reshape(-1), 0, ends - starts)
+
+        total = int(counts.sum())
+        query = np.repeat(np.repeat(np.arange(nquery), 8), counts)
+        offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        position = offsets + np.arange(total)
+
+        diff = self.vectors[position] - vec[query]
+        chord2 = np.einsum('ij,ij->i', diff, diff)
+        keep = chord2 <= (chord*chord)[query]
+        return query[keep], position[keep], chord2[keep]
+
+    def _separation(self, vec, query, position):
+        """Return the angular separations 2 atan2(|a-b|, |a+b|) of pairs of query vectors and index positions."""
+        diff = self.vectors[position] - vec[query]
+        total = self.vectors[position] + vec[query]
+        return 2*np.arctan2(np.sqrt(np.einsum('ij,ij->i', diff, diff)), np.sqrt(np.einsum('ij,ij->i', total, total)))
+
+    def _query(self, ra, dec, radius, func, workers, chunksize):
+        """Apply func(start, vectors, chords) to chunks of queries, in parallel threads, and return the results."""
+
+        ra, dec = np.asarray(ra, dtype=np.float64), np.asarray(dec, dtype=np.float64)
+        shape = np.broadcast_shapes(ra.shape, dec.shape)
+        ra, dec = np.broadcast_to(ra, shape).reshape(-1), np.broadcast_to(dec, shape).reshape(-1)
+        chord = np.broadcast_to(angle_to_chord(radius), shape).reshape(-1)
+
+        def work(chunk):
+            return func(chunk.start, unit_vectors(ra[chunk], dec[chunk]), chord[chunk])
+
+        work_chunks = list(chunks(ra.size, chunksize))
+        nthread = min(_workers(workers), len(work_chunks))
+        if nthread <= 1: return shape, [work(chunk) for chunk in work_chunks]
+        with ThreadPoolExecutor(nthread) as executor:
+            return shape, list(executor.map(work, work_chunks))
+
+    def cone_search(self, ra, dec, radius, workers=1, chunksize=None):
+        """Find all catalogue positions within a radius of each of a set of query positions.
+
+        Parameters:
+          ra (float or array):      Longitude(s), e.g. right ascension(s), of the query position(s) (rad).
+          dec (float or array):     Latitude(s), e.g. declination(s), of the query position(s) (rad).
+          radius (float or array):  Search radius/radii (rad), e.g. 1*as2r; may differ per query.
+          workers (int):            Number of parallel threads; <= 0 for the number of CPUs (optional, default: 1).
+          chunksize (int):          Number of queries processed at once (per thread) (optional).
+
+        Returns:
+          tuple (array,array,array):  Tuple containing (query, match, separation), sorted by query and separation:
+
+          - query (array):       Indices of the query positions (in the flattened query arrays).
+          - match (array):       Indices of the matching catalogue positions.
+          - separation (array):  Angular separations of the pairs (rad).
+        """
+
+        def func(start, vec, chord):
+            query, position, _ = self._candidates(vec, chord)
+            sep = self._separation(vec, query, position)
+            order = np.lexsort((sep, query))
+            return query[order] + start, self.index[position[order]], sep[order]
+
+        _, results = self._query(ra, dec, radius, func, workers, chunksize)
+        if not results: return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp), np.zeros(0)
+        return tuple(np.concatenate(arrays) for arrays in zip(*results))
+
+    def match(self, ra, dec, radius, workers=1, chunksize=None):
+        """Find the nearest catalogue position within a radius of each of a set of query positions.
+
+        Parameters:
+          ra (float or array):      Longitude(s), e.g. right ascension(s), of the query position(s) (rad).
+          dec (float or array):     Latitude(s), e.g. declination(s), of the query position(s) (rad).
+          radius (float or array):  Match radius/radii (rad), e.g. 1*as2r or 50*mas2r; may differ per query.
+          workers (int):            Number of parallel threads; <= 0 for the number of CPUs (optional, default: 1).
+          chunksize (int):          Number of queries processed at once (per thread) (optional).
+
+        Returns:
+          tuple (int or array,float or array):  Tuple containing (match, separation), with the shape of the query:
+
+          - match (int or array):         Index/indices of the nearest catalogue position(s); -1 if none is
+                                          within the radius.
+          - separation (float or array):  Angular separation(s) of the match(es) (rad); NaN if there is no match.
+        """
+
+        def func(start, vec, chord):
+            query, position, chord2 = self._candidates(vec, chord)
+            match = np.full(vec.shape[0], -1, dtype=np.intp)
+            sep = np.full(vec.shape[0], np.nan)
+            order = np.lexsort((chord2, query))
+            first = np.ones(order.size, dtype=bool)
+            first[1:] = query[order][1:] != query[order][:-1]  # Nearest candidate of each query
+            best = order[first]
+            match[query[best]] = self.index[position[best]]
+            sep[query[best]] = self._separation(vec, query[best], position[best])
+            return match, sep
+
+        shape, results = self._query(ra, dec, radius, func, workers, chunksize)
+        if not results: return np.zeros(shape, dtype=np.intp), np.zeros(shape)
+        match, sep = [np.concatenate(arrays).reshape(shape) for arrays in zip(*results)]
+        if match.ndim == 0: return match[()], sep[()]
+        return match, sep
+
+
+def crossmatch(ra1, dec1, ra2, dec2, radius, workers=1, chunksize=None):
+    """Cross-match two catalogues: find the nearest position in catalogue 2 for every position in catalogue 1.
+
+    Parameters:
+      ra1 (array):              Longitudes, e.g. right ascensions, of catalogue 1 (rad).
+      dec1 (array):             Latitudes, e.g. declinations, of catalogue 1 (rad).
+      ra2 (array):              Longitudes of catalogue 2, which is indexed (rad).
+      dec2 (array):             Latitudes of catalogue 2 (rad).
+      radius (float or array):  Match radius/radii (rad), e.g. 1*as2r.
+      workers (int):            Number of parallel threads; <= 0 for the number of CPUs (optional, default: 1).
+      chunksize (int):          Number of positions processed at once (per thread) (optional).
+
+    Returns:
+      tuple (array,array):  Tuple containing (match, separation); see SkyIndex.match().
+    """
+    return SkyIndex(ra2, dec2, chunksize).match(ra1, dec1, radius, workers, chunksize)
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" dates.py:  Vectorised conversion between calendar dates, numpy datetime64 and Julian Days.
+
+The conversions follow Meeus, Astronomical Algorithms (1998), Ch.7, and are valid for JD >= 0.  The calendar
+can be 'gregorian', 'julian' or 'auto'; the latter uses the Julian calendar before 1582-10-15 and the
+Gregorian calendar from that date onward.
+"""
+
+
+import numpy as np
+
+from . import jd2000, mlen
+
+
+_jd_greg_start   = 2299160.5   # JD of the start of the Gregorian calendar: 1582-10-15 0h
+_date_greg_start = 15821015    # The same date as yyyymmdd
+_epoch_jd2000    = np.datetime64('2000-01-01T12:00:00')  # jd2000 as datetime64
+
+_cum_days = np.concatenate(([0], np.cumsum(mlen)[:-1]))  # Number of days before month 1-12 (non-leap year)
+
+
+def _use_gregorian(calendar, greg_auto):
+    """Return True, False or the boolean array greg_auto for calendar = 'gregorian', 'julian' or 'auto'."""
+
+    if calendar == 'gregorian': return True
+    if calendar == 'julian':    return False
+    if calendar == 'auto':      return greg_auto
+    raise ValueError("calendar must be 'gregorian', 'julian' or 'auto', not "+repr(calendar))
+
+
+def date2jd(year, month, day, calendar='auto'):
+    """Convert calendar dates to Julian Days.
+
+    Parameters:
+      year (int or array):     Year(s) (astronomical numbering: year 0 = 1 BCE).
+      month (int or array):    Month(s) (1-12).
+      day (float or array):    Day(s) of the month, including the fraction of the day (1.0 - 31.999...).
+      calendar (str):          Calendar: 'gregorian', 'julian' or 'auto' (optional, default: 'auto').
+
+    Returns:
+      (float or array):  Julian Day(s).
+    """
+
+    year, month, day = np.asarray(year), np.asarray(month), np.asarray(day)
+
+    jan_feb = month <= 2  # January and February count as months 13 and 14 of the previous year
+    yr  = year - jan_feb
+    mon = month + 12*jan_feb
+
+    jd = np.floor(365.25*(yr + 4716)) + np.floor(30.6001*(mon + 1)) + day - 1524.5
+
+    greg = _use_gregorian(calendar, (year*100 + month)*100 + day >= _date_greg_start)
+    if greg is not False:
+        cent = np.floor_divide(yr, 100)
+        jd += np.where(greg, 2 - cent + np.floor_divide(cent, 4), 0)
+
+    return jd
+
+
+def jd2date(jd, calendar='auto'):
+    """Convert Julian Days to calendar dates.
+
+    Parameters:
+      jd (float or array):  Julian Day(s).
+      calendar (str):       Calendar: 'gregorian', 'julian' or 'auto' (optional, default: 'auto').
+
+    Returns:
+      tuple (int,int,float or arrays):  Tuple containing (year, month, day):
+
+      - year (int or array):     Year(s) (astronomical numbering: year 0 = 1 BCE).
+      - month (int or array):    Month(s) (1-12).
+      - day (float or array):    Day(s) of the month, including the fraction of the day.
+    """
+
+    jd = np.asarray(jd, dtype=np.float64) + 0.5
+    whole = np.floor(jd)
+    frac  = jd - whole
+
+    greg = _use_gregorian(calendar, whole >= _jd_greg_start + 0.5)
+    if greg is not False:
+        alpha = np.floor((whole - 1867216.25)/36524.25)
+        whole = np.where(greg, whole + 1 + alpha - np.floor(alpha/4), whole)
+
+    b = whole + 1524
+    c = np.floor((b - 122.1)/365.25)
+    d = np.floor(365.25*c)
+    e = np.floor((b - d)/30.6001)
+
+    day   = b - d - np.floor(30.6001*e) + frac
+    month = np.where(e < 14, e - 1, e - 13).astype(np.int64)
+    year  = np.where(month > 2, c - 4716, c - 4715).astype(np.int64)
+
+    if np.ndim(jd) == 0: return year[()], month[()], day[()]
+    return year, month, day
+
+
+def datetime2jd(dt):
+    """Convert numpy datetime64 values (UT) to Julian Days.
+
+    Parameters:
+      dt (np.datetime64 or array):  Date(s) and time(s), with any time unit.
+
+    Returns:
+      (float or array):  Julian Day(s).
+    """
+
+    delta = np.asarray(dt) - _epoch_jd2000  # Timedelta in the finer unit of dt and the epoch
+    return jd2000 + delta/np.timedelta64(1, 'D')
+
+
+def jd2datetime(jd, unit='us'):
+    """Convert Julian Days to numpy datetime64 values (UT).
+
+    Parameters:
+      jd (float or array):  Julian Day(s).
+      unit (str):           Time unit of the result: 's' or finer, e.g. 'ms' or 'us' (optional, default: 'us').
+
+    Returns:
+      (np.datetime64 or array):  Date(s) and time(s).
+    """
+
+    unit_day = np.timedelta64(1, 'D').astype('timedelta64['+unit+']').astype(np.float64)  # Units per day
+    delta = np.rint((np.asarray(jd, dtype=np.float64) - jd2000) * unit_day).astype('timedelta64['+unit+']')
+    return _epoch_jd2000.astype('datetime64['+unit+']') + delta
+
+
+def day_of_week(jd):
+    """Return the day of the week for Julian Days; 0 = Sunday, so that the result can be used as an index for
+    dow_en, dow_nl, etc.
+
+    Parameters:
+      jd (float or array):  Julian Day(s).
+
+    Returns:
+      (int or array):  Day(s) of the week (0-6 = Sunday-Saturday).
+    """
+
+    return np.floor(np.mod(np.asarray(jd) + 1.5, 7)).astype(np.int64)
+
+
+def is_leap_year(year, calendar='auto'):
+    """Return whether years are leap years.
+
+    Parameters:
+      year (int or array):  Year(s).
+      calendar (str):       Calendar: 'gregorian', 'julian' or 'auto' (optional, default: 'auto'; Gregorian
+                            from 1583 onward).
+
+    Returns:
+      (bool or array):  True for leap years.
+    """
+
+    year = np.asarray(year)
+    leap = year % 4 == 0
+    greg = _use_gregorian(calendar, year > 1582)
+    if greg is not False:
+        leap &= np.logical_not(greg) | (year % 100 != 0) | (year % 400 == 0)
+    return leap
+
+
+def day_of_year(year, month, day, calendar='auto'):
+    """Return the day of the year for calendar dates, based on the month lengths in mlen.
+
+    Parameters:
+      year (int or array):    Year(s).
+      month (int or array):   Month(s) (1-12).
+      day (float or array):   Day(s) of the month (1-31; may include the fraction of the day).
+      calendar (str):         Calendar for the leap years: 'gregorian', 'julian' or 'auto' (optional, default:
+                              'auto').
+
+    Returns:
+      (int/float or array):  Day(s) of the year (1-366; including the fraction of the day if present in day).
+    """
+
+    month = np.asarray(month)
+    return _cum_days[month-1] + day + (is_leap_year(year, calendar) & (month > 2))
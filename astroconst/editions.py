@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" editions.py:  Switch the base constants of astroconst between editions (CODATA 2014/2018/2022, AA 2021).
+
+Derived constants (e.g. h_bar, a_rad, sigma, earth_g, au_lighttime_days, tH, Mo_per_year and pl_a) are
+described by a dependency graph, so that switching an edition or updating a base value recomputes only the
+constants that depend on the changed values, without reloading the module.  Only the base constants and the
+other independent constants of the graph (e.g. day_sol, pc and H0; see updatable) can be updated, so that no
+derived constant is left with a stale value.  The constants are updated in the astroconst namespace, and
+array-valued constants that have already been created are updated in place.
+Submodules that cache values derived from the constants (e.g. units and planck) are reset after each change.
+Names that were imported with `from astroconst import ...` before a change keep their old values; use e.g.
+`astroconst.h_bar` to see the current value.
+
+Example:
+  >>> import astroconst as ac
+  >>> from astroconst import editions
+  >>> editions.use('CODATA 2018')    # Returns the names of the changed constants, e.g. ['h_p', 'k_b', ...]
+  >>> ac.h_bar                       # 1.0545718176461565e-34
+  >>> editions.update(H0=70*ac.km/ac.Mpc)  # ['H0', 'tH']
+"""
+
+
+import sys
+import threading
+
+import astroconst as _ac
+from . import aa as _aa
+
+
+_arrays = vars(_ac)['__arrays']  # Lists of values of the array-valued constants
+_lock   = threading.RLock()
+
+
+def _get(name):
+    """Return the current value of a constant (a list for the array-valued constants)."""
+    if name in _arrays: return _arrays[name]
+    return getattr(_ac, name)
+
+
+def _set(name, value):
+    """Set the value of a constant; numpy arrays that were already created are updated in place."""
+    if name in _arrays:
+        _arrays[name] = list(value)
+        array = vars(_ac).get(name)
+        if array is not None: array[:] = value
+    else:
+        setattr(_ac, name, value)
+
+
+# Dependency graph: derived constant -> (names of the constants it depends on, function of those constants).
+# The entries are in dependency order, so that a single pass updates everything downstream of a change:
+_derived = {}
+
+def _alias(base, *aliases):
+    """Add aliases of a constant to the dependency graph."""
+    for alias in aliases:
+        _derived[alias] = ((base,), lambda value: value)
+
+_alias('G', 'g')
+_derived['h_bar']  = (('h_p', 'pi2'), lambda h_p, pi2: h_p/pi2)
+_derived['a_rad']  = (('k_b', 'c', 'h_p', 'pi'), lambda k_b, c, h_p, pi: k_b**4/((c*h_p)**3) * 8*pi**5/15)
+_derived['sigma']  = (('a_rad', 'c'), lambda a_rad, c: a_rad*c*0.25)
+_alias('eV', 'ec')
+_derived['keV']    = (('eV',), lambda eV: 1000*eV)
+_derived['MeV']    = (('keV',), lambda keV: 1000*keV)
+_derived['GeV']    = (('MeV',), lambda MeV: 1000*MeV)
+_derived['m_h']    = (('amu',), lambda amu: 1.00782503214*amu)
+_alias('a_0', 'bohr_rad')
+_alias('R_inf', 'rydberg')
+_alias('r_sun', 'sun_r', 'sol_r', 'Rsun', 'Ro')
+_alias('m_sun', 'sun_m', 'sol_m', 'Msun', 'Mo')
+_alias('day_sol', 'day')
+_derived['month_greg'] = (('day_sol',), lambda day_sol: 30.4369*day_sol)
+_derived['month_sid']  = (('day_sol',), lambda day_sol: 27.321661547*day_sol)
+_derived['month_trop'] = (('day_sol',), lambda day_sol: 27.321582241*day_sol)
+_derived['month_ano']  = (('day_sol',), lambda day_sol: 27.554549878*day_sol)
+_derived['month_drac'] = (('day_sol',), lambda day_sol: 27.212220817*day_sol)
+_derived['month_syn']  = (('day_sol',), lambda day_sol: 29.530588853*day_sol)
+_alias('month_greg', 'month')
+_derived['year_jul']   = (('day_sol',), lambda day_sol: 365.25*day_sol)
+_derived['year_greg']  = (('day_sol',), lambda day_sol: 365.2425*day_sol)
+_derived['year_sid']   = (('day_sol',), lambda day_sol: 365.256363051*day_sol)
+_derived['year_trop']  = (('day_sol',), lambda day_sol: 365.24218967*day_sol)
+_derived['year_anom']  = (('day_sol',), lambda day_sol: 365.259635864*day_sol)
+_alias('year_trop', 'year')
+_derived['kyr']    = (('year',), lambda year: 1000*year)
+_derived['Myr']    = (('kyr',), lambda kyr: 1000*kyr)
+_derived['Gyr']    = (('Myr',), lambda Myr: 1000*Myr)
+_derived['age_of_universe'] = (('Gyr',), lambda Gyr: 13.787*Gyr)
+_derived['pl_p']   = (('year_trop',), lambda year_trop: [p*year_trop for p in _pl_p_yr])
+_derived['Mo_per_year'] = (('Mo', 'year'), lambda Mo, year: Mo/year)
+_derived['kpc']    = (('pc',), lambda pc: 1000*pc)
+_derived['Mpc']    = (('kpc',), lambda kpc: 1000*kpc)
+_derived['Gpc']    = (('Mpc',), lambda Mpc: 1000*Mpc)
+_derived['tH']     = (('H0',), lambda H0: 1/H0)
+_derived['au_lighttime_days'] = (('au', 'c', 'day'), lambda au, c, day: au/c/day)
+_alias('earth_m', 'm_earth')
+_alias('earth_r', 'r_earth')
+_derived['earth_g'] = (('G', 'earth_m', 'earth_r'), lambda G, earth_m, earth_r: G*earth_m/earth_r**2)
+_alias('earth_g', 'g_earth')
+_derived['pl_d']   = (('earth_r',), lambda earth_r: _arrays['pl_d'][:3] + [2*earth_r] + _arrays['pl_d'][4:])
+_derived['pl_r']   = (('pl_d',), lambda pl_d: [d/2 for d in pl_d])
+_derived['pl_a']   = (('au',), lambda au: _arrays['pl_a'][:1] + [a*au for a in _pl_a_au])  # [0] = Moon, in m
+
+_pl_a_au = [a/_ac.au for a in _arrays['pl_a'][1:]]  # Planet semi-major axes in au
+_pl_p_yr = [p/_ac.year_trop for p in _arrays['pl_p']]  # Planet orbital periods in tropical years
+
+
+# Values of the base constants per edition; constants missing from an edition keep their default value:
+_editions = {
+    'CODATA 2014': dict(h_p=6.626070040e-34, k_b=1.38064852e-23, eV=1.6021766208e-19, G=6.67408e-11,
+                        m_e=9.10938356e-31, m_pr=1.672621898e-27, amu=1.660539040e-27, a_0=5.2917721067e-11,
+                        R_inf=10973731.568508, sigma_T=6.6524587158e-29, epsilon0=8.854187817e-12,
+                        mu0=1.2566370614e-06),
+    'CODATA 2018': dict(h_p=6.62607015e-34, k_b=1.380649e-23, eV=1.602176634e-19, G=6.67430e-11,
+                        m_e=9.1093837015e-31, m_pr=1.67262192369e-27, amu=1.66053906660e-27, a_0=5.29177210903e-11,
+                        R_inf=10973731.568160, sigma_T=6.6524587321e-29, epsilon0=8.8541878128e-12,
+                        mu0=1.25663706212e-06),
+    'CODATA 2022': dict(h_p=6.62607015e-34, k_b=1.380649e-23, eV=1.602176634e-19, G=6.67430e-11,
+                        m_e=9.1093837139e-31, m_pr=1.67262192595e-27, amu=1.66053906892e-27, a_0=5.29177210544e-11,
+                        R_inf=10973731.568157, sigma_T=6.6524587051e-29, epsilon0=8.8541878188e-12,
+                        mu0=1.25663706127e-06),
+    'AA 2021':     dict(c=_aa.c, au=_aa.au, G=_aa.g, m_sun=_aa.m_s, earth_m=_aa.m_e, earth_r=_aa.a_e,
+                        r_sun=_aa.r_sun*1e3),
+}
+_base_names = sorted({name for values in _editions.values() for name in values})
+_editions = {'default': {name: _get(name) for name in _base_names}, **_editions}
+
+editions = tuple(_editions);  """Names of the available editions; 'default' contains the values astroconst ships with."""
+
+# Constants that can be updated: the base constants of the editions and the other independent constants of the
+# dependency graph, except the mathematical constants:
+_roots = {dep for deps, _ in _derived.values() for dep in deps} - set(_derived) - {'pi', 'pi2'}
+updatable = tuple(sorted(set(_base_names) | _roots));  """Names of the constants that can be changed with update()."""
+_current = 'default'
+
+
+def edition():
+    """Return the name of the current edition ('custom' after update() changed a base value)."""
+    return _current
+
+
+def dependants(name):
+    """Return the names of the derived constants that depend (directly or indirectly) on a constant.
+
+    Parameters:
+      name (str):  Name of the constant, e.g. 'h_p'.
+
+    Returns:
+      (list):  Names of the dependent constants, in the order in which they are recomputed.
+    """
+
+    changed, result = {name}, []
+    for derived, (deps, _) in _derived.items():
+        if not changed.isdisjoint(deps):
+            changed.add(derived)
+            result.append(derived)
+    return result
+
+
+def _apply(values):
+    """Set the base constants that differ from the given values and recompute their dependants.
+
+    Returns:
+      (list):  Names of the base and derived constants that were changed.
+    """
+
+    changed = [name for name, value in values.items() if _get(name) != value]
+    for name in changed:
+        _set(name, values[name])
+
+    updated = set(changed)
+    for name, (deps, func) in _derived.items():
+        if updated.isdisjoint(deps): continue
+        _set(name, func(*[_get(dep) for dep in deps]))
+        updated.add(name)
+        changed.append(name)
+
+    if changed: _reset_modules()
+    return changed
+
+
+def _reset_modules():
+    """Call _reset() of the imported astroconst submodules that define it, to clear their cached constants."""
+    for name, module in list(sys.modules.items()):
+        if name.startswith('astroconst.') and callable(getattr(module, '_reset', None)):
+            module._reset()
+
+
+def use(edition):
+    """Switch the base constants to an edition and recompute the affected derived constants.
+
+    Parameters:
+      edition (str):  Name of the edition: 'default', 'CODATA 2014', 'CODATA 2018', 'CODATA 2022' or 'AA 2021'.
+
+    Returns:
+      (list):  Names of the constants that were changed.
+    """
+
+    global _current
+    if edition not in _editions:
+        raise ValueError('unknown edition %r; use one of %s' % (edition, ', '.join(editions)))
+
+    values = {**_editions['default'], **_editions[edition]}
+    with _lock:
+        changed = _apply(values)
+        _current = edition
+    return changed
+
+
+def update(**values):
+    """Update one or more base constants and recompute the affected derived constants.
+
+    Parameters:
+      values (float):  New values of the base constants, as keyword arguments, e.g. h_p=6.62607015e-34; the names
+                       must be in updatable.
+
+    Returns:
+      (list):  Names of the constants that were changed.
+    """
+
+    global _current
+    for name in values:
+        if name in _derived:
+            raise ValueError('%r is a derived constant; update the constant(s) it depends on: %s'
+                             % (name, ', '.join(_derived[name][0])))
+        if name not in updatable:
+            raise ValueError('%r cannot be updated; use one of %s' % (name, ', '.join(updatable)))
+
+    with _lock:
+        for name in values:
+            _editions['default'].setdefault(name, _get(name))  # So that use('default') restores the value
+        changed = _apply(values)
+        if changed: _current = 'custom'
+    return changed
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" ephemcache.py:  Opt-in disk cache of derived tables (Kepler positions, body parameters), memory-mapped read-only.
+
+Tables derived from pl_a, pl_p, pl_e, pl_r and plname_* are computed once, written to a .npy file and memory
+mapped read-only, so that all worker processes on a node share the same physical memory pages and skip the
+computation.  The file name contains the format version and a SHA-256 hash of the current values of the
+constants and of the parameters of the table, so that a changed constant (e.g. with astroconst.editions) or a
+new format automatically leads to a new file; stale files are never read, and can be removed with clear().
+Files are written to a temporary file and renamed atomically, so that concurrent processes never see a partly
+written table.
+
+The cache directory is $ASTROCONST_CACHE_DIR, or astroconst/ in $XDG_CACHE_HOME or ~/.cache.  Nothing is
+written unless one of the functions below is called.
+
+Example:
+  >>> import numpy as np
+  >>> from astroconst import ephemcache, jd2000
+  >>> pos = ephemcache.positions(jd2000 + np.arange(0, 36525, 0.5))   # (10, 73050, 3) read-only memmap (m)
+  >>> ephemcache.bodies()['mean_motion']                             # Per-body parameters (rad/day)
+"""
+
+
+import hashlib
+import os
+import re
+import tempfile
+import time
+
+import numpy as np
+
+import astroconst as _ac
+from . import kepler
+
+
+format_version = 1;  """Version of the cache-file format; part of the file names."""
+
+_constants = ('pl_a', 'pl_p', 'pl_e', 'pl_r', 'plname_en', 'plname_nl')
+_table_file = re.compile(r'^(positions|bodies)-v\d+-[0-9a-f]{32}\.npy$')  # Completed table, see _cached()
+_temp_file  = re.compile(r'^\.(positions|bodies)-.+\.npy$')               # Temporary file while it is written
+_opened = {}  # Path -> memory-mapped array, so that each file is mapped once per process
+
+
+def cache_dir():
+    """Return the cache directory: $ASTROCONST_CACHE_DIR, or astroconst/ in $XDG_CACHE_HOME or ~/.cache."""
+    if os.environ.get('ASTROCONST_CACHE_DIR'): return os.environ['ASTROCONST_CACHE_DIR']
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'astroconst')
+
+
+def _hash(*parts):
+    """Return the SHA-256 hash of the current values of the constants, kepler.gm and further parts."""
+
+    sha = hashlib.sha256(b'astroconst-ephemcache-%i' % format_version)
+    for name in _constants:
+        value = np.asarray(getattr(_ac, name))
+        sha.update(name.encode() + b'\0' + str(value.dtype).encode() + b'\0')
+        sha.update('\0'.join(value.tolist()).encode() if value.dtype.kind == 'U' else value.tobytes())
+    sha.update(np.asarray(kepler.gm).tobytes())
+    for part in parts:
+        part = np.ascontiguousarray(part)
+        sha.update(b'\0' + str(part.dtype).encode() + str(part.shape).encode() + b'\0' + part.tobytes())
+    return sha.hexdigest()[:32]
+
+
+def _cached(kind, key, shape, dtype, fill, directory):
+    """Return a table from the cache, computing and writing it first if needed.
+
+    Parameters:
+      kind (str):       Kind of table, used in the file name.
+      key (str):        Hash of the constants and parameters of the table.
+      shape (tuple):    Shape of the table.
+      dtype (dtype):    Data type of the table.
+      fill (function):  Function that fills a writeable array of the given shape and dtype.
+      directory (str):  Cache directory (optional, default: cache_dir()).
+
+    Returns:
+      (np.memmap):  Read-only memory-mapped table.
+    """
+
+    directory = directory or cache_dir()
+    path = os.path.join(directory, '%s-v%i-%s.npy' % (kind, format_version, key))
+    table = _opened.get(path)
+    if table is not None: return table
+
+    try:
+        table = np.load(path, mmap_mode='r')
+        if table.shape != tuple(shape) or table.dtype != np.dtype(dtype): table = None  # Corrupt; rewrite
+    except (OSError, ValueError):
+        table = None
+
+    if table is None:
+        os.makedirs(directory, exist_ok=True)
+        tmp = tempfile.NamedTemporaryFile(dir=directory, prefix='.%s-' % kind, suffix='.npy', delete=False)
+        tmp.close()
+        try:
+            array = np.lib.format.open_memmap(tmp.name, mode='w+', dtype=dtype, shape=tuple(shape))
+            fill(array)
+            array.flush()
+            del array
+            os.replace(tmp.name, path)  # Atomic: other processes see either no file or the complete file
+        finally:
+            if os.path.exists(tmp.name): os.remove(tmp.name)
+        table = np.load(path, mmap_mode='r')
+
+    _opened[path] = table
+    return table
+
+
+def positions(jd, bodies=None, jd0=_ac.jd2000, mean_anom0=0, incl=0, node=0, argp=0, use_gm=False, iterations=4,
+              directory=None):
+    """Return the Kepler-orbit positions of bodies on a time grid from the cache; see kepler.propagate().
+
+    Parameters:
+      jd (float or array):          Epoch(s) of the grid (JD).
+      bodies (int or array):        Index/indices of the bodies, as in plname_en (optional, default: all).
+      jd0 (float):                  Reference epoch of the mean anomalies (JD; optional, default: jd2000).
+      mean_anom0 (float or array):  Mean anomaly/anomalies at jd0, per body (rad; optional, default: 0).
+      incl (float or array):        Inclination(s) of the orbits, per body (rad; optional, default: 0).
+      node (float or array):        Longitude(s) of the ascending node, per body (rad; optional, default: 0).
+      argp (float or array):        Argument(s) of perihelion, per body (rad; optional, default: 0).
+      use_gm (bool):                Derive the mean motions from gm and pl_a rather than pl_p (optional).
+      iterations (int):             Number of iterations for kepler.solve_kepler() (optional, default: 4).
+      directory (str):              Cache directory (optional, default: cache_dir()).
+
+    Returns:
+      (np.memmap):  Read-only positions with shape (n_bodies, n_epochs, 3) (m).
+    """
+
+    bodies = np.atleast_1d(np.arange(len(_ac.pl_a)) if bodies is None else np.asarray(bodies, dtype=np.int64))
+    jd = np.atleast_1d(np.asarray(jd, dtype=np.float64))
+    params = [np.broadcast_to(np.asarray(par, dtype=np.float64), bodies.shape)
+              for par in (mean_anom0, incl, node, argp)]
+
+    def fill(out):
+        kepler.propagate(jd, bodies, jd0, *params, use_gm=use_gm, iterations=iterations, out=out)
+
+    key = _hash(jd, bodies, np.float64(jd0), *params, np.array([use_gm, iterations]))
+    return _cached('positions', key, (bodies.size, jd.size, 3), np.float64, fill, directory)
+
+
+def bodies(directory=None):
+    """Return a table of the physical and orbital parameters of the bodies in plname_en from the cache.
+
+    Parameters:
+      directory (str):  Cache directory (optional, default: cache_dir()).
+
+    Returns:
+      (np.memmap):  Read-only structured array with one row per body (indexed as plname_en) and the fields:
+
+      - name_en, name_nl (str):  English and Dutch names, from plname_en and plname_nl.
+      - a, p, e, r (float):      Semi-major axis (m), orbital period (s), eccentricity and equatorial radius (m),
+                                 from pl_a, pl_p, pl_e and pl_r.
+      - gm (float):              G(M+m) of the central and orbiting body (m^3/s^2), from kepler.gm.
+      - mean_motion (float):     Mean motion 2π/p (rad/day).
+      - b (float):               Semi-minor axis a √(1-e²) (m).
+      - perihelion, aphelion (float):  Pericentre and apocentre distances a(1-e) and a(1+e) (m).
+    """
+
+    names_en, names_nl = np.asarray(_ac.plname_en), np.asarray(_ac.plname_nl)
+    dtype = np.dtype([('name_en', names_en.dtype), ('name_nl', names_nl.dtype)]
+                     + [(field, np.float64) for field in ('a', 'p', 'e', 'r', 'gm', 'mean_motion', 'b',
+                                                          'perihelion', 'aphelion')])
+
+    def fill(out):
+        out['name_en'], out['name_nl'] = names_en, names_nl
+        out['a'], out['p'], out['e'], out['r'] = _ac.pl_a, _ac.pl_p, _ac.pl_e, _ac.pl_r
+        out['gm'] = kepler.gm
+        out['mean_motion'] = kepler.mean_motion()
+        out['b'] = out['a']*np.sqrt(1 - out['e']**2)
+        out['perihelion'] = out['a']*(1 - out['e'])
+        out['aphelion'] = out['a']*(1 + out['e'])
+
+    return _cached('bodies', _hash(), (len(names_en),), dtype, fill, directory)
+
+
+def clear(directory=None, max_age=86400):
+    """Remove the cache files and forget the mapped tables of this process.
+
+    Parameters:
+      directory (str):  Cache directory (optional, default: cache_dir()).
+      max_age (float):  Minimum age of the temporary files to remove (s; optional, default: 86400).
+
+    Returns:
+      (int):  Number of files removed.
+
+    Note:
+      - Only completed tables are removed, and temporary files that were last modified at least max_age ago
+        (left behind by a process that was killed).  Younger temporary files may still be written by another
+        process, and are kept.
+      - Tables that are still referenced remain valid: the memory mapping keeps the data of a removed file.
+    """
+
+    directory = directory or cache_dir()
+    _opened.clear()
+    if not os.path.isdir(directory): return 0
+    count = 0
+    now = time.time()
+    for fname in os.listdir(directory):
+        path = os.path.join(directory, fname)
+        try:
+            if _table_file.match(fname) or (_temp_file.match(fname) and now - os.path.getmtime(path) >= max_age):
+                os.remove(path)
+                count += 1
+        except FileNotFoundError:  # Renamed or removed by another process meanwhile
+            continue
+    return count
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" export.py:  Generate a C header, a Cython .pxd file and a Fortran module with the scalar constants.
+
+The constants are taken from the registry (see astroconst.registry), i.e. from the definitions in
+astroconst/__init__.py and astroconst/aa.py.  The constants of the aa submodule get the prefix 'aa_', e.g. aa_g.
+Values are written with the shortest decimal representation that round-trips to the same float64 (repr()), so
+that the compiled constants are bit-identical to the Python values, and compile-time constants (static const
+double in C, parameter in Fortran) allow the compiler to inline and fold them.  With --check, the existing files
+are compared to the Python values, and the C header and Fortran module are compiled (with $CC or cc and $FC or
+gfortran, if available) into programs that print the bit patterns of the compiled values.
+
+Usage:
+  python -m astroconst.export [-o <directory>] [-f c pxd f90] [--check]
+"""
+
+
+import argparse
+import os
+import re
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import textwrap
+
+from . import registry
+
+
+formats = {'c': 'astroconst.h', 'pxd': 'astroconst.pxd', 'f90': 'astroconst.f90'};  """Output formats and file names."""
+_prefix = 'ac_'  # Prefix for the C names, e.g. ac_au, ac_aa_g
+
+
+def constants():
+    """Return the scalar constants to export.
+
+    Returns:
+      (list):  List of tuples (name, value, description), with names like 'au' and 'aa_g'.
+    """
+
+    return [(str(row['name']).replace('aa.', 'aa_'), float(row['value']), ' '.join(str(row['description']).split()))
+            for row in registry.table()]
+
+
+def _comment(desc, end='*/'):
+    """Return a description that is safe to use in a comment."""
+    return desc.replace(end, '')
+
+
+def to_c(consts):
+    """Return the C header as a string."""
+
+    lines = ['/* astroconst.h:  Astronomical constants, generated by python -m astroconst.export - do not edit. */',
+             '', '#ifndef ASTROCONST_H', '#define ASTROCONST_H', '']
+    for name, value, desc in consts:
+        lines.append('static const double %-25s = %-24s /* %s */' % (_prefix+name, repr(value)+';', _comment(desc)))
+    lines += ['', '#endif /* ASTROCONST_H */', '']
+    return '\n'.join(lines)
+
+
+def to_pxd(consts):
+    """Return the Cython .pxd file, which declares the constants of the C header astroconst.h, as a string."""
+
+    lines = ['# astroconst.pxd:  Astronomical constants, generated by python -m astroconst.export - do not edit.',
+             '# The values are defined in astroconst.h, so that the C compiler can inline them.', '',
+             'cdef extern from "astroconst.h":']
+    for name, value, desc in consts:
+        lines.append('    const double %-25s  # %s = %s' % (_prefix+name, desc, repr(value)))
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def to_f90(consts):
+    """Return the Fortran module as a string.
+
+    Note:
+      - Fortran is case insensitive; of names that differ only in case (e.g. g and G), only the first is kept.
+      - Descriptions that would make a line longer than the 132 characters of free-form Fortran are written on
+        comment lines before the declaration.
+    """
+
+    lines = ['! astroconst.f90:  Astronomical constants, generated by python -m astroconst.export - do not edit.', '',
+             'module astroconst', '  use, intrinsic :: iso_fortran_env, only: real64', '  implicit none', '']
+    seen = {}  # Lower-case name -> (name, value)
+    for name, value, desc in consts:
+        if name.lower() in seen:
+            if seen[name.lower()][1] != value:
+                raise ValueError('constants %r and %r differ only in case, but have different values'
+                                 % (seen[name.lower()][0], name))
+            continue
+        seen[name.lower()] = (name, value)
+        line = '  real(real64), parameter :: %-25s = %-30s' % (name, repr(value)+'_real64')
+        if len(line) + len(desc) + 4 <= _f90_width:
+            lines.append(line + '  ! ' + desc)
+        else:
+            lines += textwrap.wrap(desc, _f90_width, initial_indent='  ! ', subsequent_indent='  ! ')
+            lines.append(line.rstrip())
+    lines += ['', 'end module astroconst', '']
+    return '\n'.join(lines)
+
+
+_f90_width = 132  # Maximum line length in free-form Fortran
+_writers = {'c': to_c, 'pxd': to_pxd, 'f90': to_f90}
+_parsers = {'c':   re.compile(r'^static const double (\w+)\s*=\s*(\S+);', re.M),
+            'pxd': re.compile(r'^    const double (\w+)\s*#.* = (\S+)$', re.M),
+            'f90': re.compile(r'^  real\(real64\), parameter :: (\w+)\s*=\s*(\S+)_real64', re.M)}
+
+
+def check(text, fmt, consts=None):
+    """Check that every value in the text of a generated file is bit-identical to the Python value.
+
+    Parameters:
+      text (str):     Contents of the generated file.
+      fmt (str):      Format of the file: 'c', 'pxd' or 'f90'.
+      consts (list):  Constants as returned by constants() (optional).
+
+    Returns:
+      (int):  Number of values checked.
+
+    Note:
+      - This detects files that are outdated or were edited; use compile_check() to check the values that the
+        compilers produce.
+    """
+
+    prefix = '' if fmt == 'f90' else _prefix
+    values = {prefix+name: value for name, value, _ in consts or constants()}
+    found = _parsers[fmt].findall(text)
+    for name, value in found:
+        if name not in values:
+            raise ValueError('%s: unknown constant %s' % (fmt, name))
+        if float(value).hex() != values[name].hex():
+            raise ValueError('%s: %s = %s does not round-trip to %r' % (fmt, name, value, values[name]))
+
+    expected = len({name.lower() for name in values}) if fmt == 'f90' else len(values)
+    if len(found) != expected:
+        raise ValueError('%s: found %i of %i constants' % (fmt, len(found), expected))
+    return len(found)
+
+
+def _compile_c(directory, names):
+    """Return the source of a C program that prints the names and values (as %a) of the constants, and the
+    command to compile it, or None if no C compiler was found."""
+
+    compiler = os.environ.get('CC') or shutil.which('cc')
+    if not compiler: return None
+    source = ['#include <stdio.h>', '#include "astroconst.h"', '', 'int main(void) {']
+    source += ['  printf("%s %%a\\n", %s);' % (name, name) for name in names]
+    source += ['  return 0;', '}', '']
+    return '\n'.join(source), 'check.c', [compiler, '-I', os.path.abspath(directory), '-o', 'check', 'check.c']
+
+
+def _compile_f90(directory, names):
+    """Return the source of a Fortran program that prints the names and bit patterns (as Z16) of the constants,
+    and the command to compile it, or None if no Fortran compiler was found."""
+
+    compiler = os.environ.get('FC') or shutil.which('gfortran')
+    if not compiler: return None
+    source = ['program check', '  use astroconst', '  use, intrinsic :: iso_fortran_env, only: int64',
+              '  implicit none']
+    source += ["  write(*, '(a, 1x, z16.16)') '%s', transfer(%s, 0_int64)" % (name, name) for name in names]
+    source += ['end program check', '']
+    module = os.path.abspath(os.path.join(directory, formats['f90']))
+    return '\n'.join(source), 'check.f90', [compiler, '-o', 'check', module, 'check.f90']
+
+
+_compilers = {'c': _compile_c, 'f90': _compile_f90}
+
+
+def compile_check(directory='.', fmts=tuple(_compilers), consts=None):
+    """Compile the generated C header and/or Fortran module, and check that the compiled values are bit-identical
+    to the Python values.
+
+    Parameters:
+      directory (str):  Directory with the generated files (optional, default: the current directory).
+      fmts (list):      Formats to compile: 'c' and/or 'f90' (optional, default: both).
+      consts (list):    Constants as returned by constants() (optional).
+
+    Returns:
+      (dict):  Format -> number of values checked, or None if no compiler was found for that format.
+    """
+
+    prefix = {'c': _prefix, 'f90': ''}
+    consts = consts or constants()
+    result = {}
+    for fmt in fmts:
+        with open(os.path.join(directory, formats[fmt]), encoding='utf-8') as ifile:
+            names = [name for name, _ in _parsers[fmt].findall(ifile.read())]
+        with tempfile.TemporaryDirectory() as build:
+            program = _compilers[fmt](directory, names)
+            if program is None:
+                result[fmt] = None
+                continue
+            source, fname, command = program
+            with open(os.path.join(build, fname), 'w', encoding='utf-8') as ofile:
+                ofile.write(source)
+            subprocess.run(command, cwd=build, check=True, capture_output=True)
+            output = subprocess.run([os.path.join(build, 'check')], check=True, capture_output=True,
+                                    text=True).stdout.split('\n')
+
+        values = {(prefix[fmt]+name).lower() if fmt == 'f90' else prefix[fmt]+name: value
+                  for name, value, _ in reversed(consts)}  # Fortran keeps the first of names that differ in case
+        for line in output[:len(names)]:
+            name, compiled = line.split()
+            value = values[name.lower() if fmt == 'f90' else name]
+            if fmt == 'c':
+                identical = float.fromhex(compiled).hex() == value.hex()
+            else:
+                identical = int(compiled, 16) == struct.unpack('<q', struct.pack('<d', value))[0] % 2**64
+            if not identical:
+                raise ValueError('%s: compiled %s = %s differs from %r' % (fmt, name, compiled, value))
+        result[fmt] = len(names)
+    return result
+
+
+def export(directory='.', fmts=tuple(formats)):
+    """Write the generated files to a directory.
+
+    Parameters:
+      directory (str):  Output directory (optional, default: the current directory).
+      fmts (list):      Formats to write: 'c', 'pxd' and/or 'f90' (optional, default: all).
+
+    Returns:
+      (list):  Paths of the files written.
+    """
+
+    consts = constants()
+    paths = []
+    for fmt in fmts:
+        text = _writers[fmt](consts)
+        check(text, fmt, consts)
+        path = os.path.join(directory, formats[fmt])
+        with open(path, 'w', encoding='utf-8') as ofile:
+            ofile.write(text)
+        paths.append(path)
+    return paths
+
+
+def main(args=None):
+    """Command-line interface: write (and optionally check) the generated files."""
+
+    parser = argparse.ArgumentParser(prog='python -m astroconst.export',
+                                     description='Generate C, Cython and Fortran files with the astroconst constants.')
+    parser.add_argument('-o', '--output', default='.', help='output directory (default: .)')
+    parser.add_argument('-f', '--formats', nargs='+', choices=list(formats), default=list(formats),
+                        help='formats to write (default: all)')
+    parser.add_argument('--check', action='store_true',
+                        help='check the existing files in the output directory instead of writing them')
+    args = parser.parse_args(args)
+
+    if args.check:
+        for fmt in args.formats:
+            path = os.path.join(args.output, formats[fmt])
+            with open(path, encoding='utf-8') as ifile:
+                print('%s: %i values round-trip bit-exactly' % (path, check(ifile.read(), fmt)))
+        fmts = [fmt for fmt in args.formats if fmt in _compilers]
+        for fmt, count in compile_check(args.output, fmts).items():
+            path = os.path.join(args.output, formats[fmt])
+            if count is None:
+                print('%s: no compiler found; compiled values not checked' % path)
+            else:
+                print('%s: %i compiled values are bit-identical' % (path, count))
+    else:
+        for path in export(args.output, args.formats):
+            print('Wrote', path)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
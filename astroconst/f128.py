@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" f128.py:  The astroconst constants as np.longdouble (extended precision; 80 bits stored in 128 bits on x86-64 Linux, float64 on some platforms).
+
+The names are the same as in astroconst and astroconst.aa; the numeric scalars are numpy scalars and the numeric
+arrays (e.g. pl_a, pl_r) have this type, so that arithmetic with arrays of the same type does not upcast.
+Integer constants (e.g. c, jd2000, mlen) remain integers.  The values are computed once, at import, from the
+default constants, and do not follow changes by astroconst.editions.
+
+Example:
+  >>> import astroconst.f128 as acf128
+  >>> acf128.pc, acf128.aa.au
+"""
+
+
+import numpy as _np
+
+from ._dtyped import populate as _populate
+
+_populate(globals(), _np.longdouble)
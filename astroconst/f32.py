@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" f32.py:  The astroconst constants as float32 (single precision).
+
+The names are the same as in astroconst and astroconst.aa; the numeric scalars are numpy scalars and the numeric
+arrays (e.g. pl_a, pl_r) have this type, so that arithmetic with arrays of the same type does not upcast.
+Integer constants (e.g. c, jd2000, mlen) remain integers.  The values are computed once, at import, from the
+default constants, and do not follow changes by astroconst.editions.
+
+Example:
+  >>> import astroconst.f32 as acf32
+  >>> acf32.pc, acf32.aa.au
+  >>> image_rad = image_deg * acf32.d2r  # Stays float32 for a float32 image
+"""
+
+
+import numpy as _np
+
+from ._dtyped import populate as _populate
+
+_populate(globals(), _np.float32)
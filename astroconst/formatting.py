@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" formatting.py:  Vectorised formatting of angles and dates into numpy string (or bytes) arrays.
+
+The strings are assembled as a matrix of character codes (Unicode code points, or UTF-8 bytes for bytes
+output) from the digits of the numbers and the name tables months_en, months_nl, dow_en, dow_nl, dst_en and
+dst_nl, which is then viewed as a numpy string array.  Hence, there are no Python calls per element.  Values are
+rounded to the requested number of decimals before they are split, so that the carry is correct, e.g. 59.996s
+becomes the next minute with two decimals.  The input must be finite.
+
+Example:
+  >>> import numpy as np
+  >>> from astroconst import formatting, d2r, h2r, jd2000
+  >>> formatting.format_hms(np.array([12.5822, 23.99999999])*h2r)   # ['12h34m55.92s', '00h00m00.00s']
+  >>> formatting.format_dms(np.array([12.58240, -0.5])*d2r)         # ['+12°34′56.6″', '-00°30′00.0″']
+  >>> formatting.format_date(jd2000 + 9499.5)                       # 'Sunday 4 January 2026'
+  >>> formatting.format_date(jd2000 + 9499.5, 'nl', time=True)      # 'zondag 4 januari 2026 00:00:00'
+"""
+
+
+import functools
+
+import numpy as np
+
+from . import r2d, r2h
+from ._batch import chunks, flat_out
+from .angles import split_sexagesimal, wrap_2pi
+from .dates import jd2date, day_of_week
+
+
+languages = ('en', 'nl');  """Languages of the date formats."""
+
+_names = {'en': ('dow_en', 'months_en', 'dst_en'), 'nl': ('dow_nl', 'months_nl', 'dst_nl')}
+
+
+def _ctype(kind):
+    """Return the character-code type for output of kind 'U' (str) or 'S' (bytes)."""
+    if kind == 'U': return np.uint32
+    if kind == 'S': return np.uint8
+    raise ValueError("kind must be 'U' (str) or 'S' (bytes), not %r" % kind)
+
+
+def _text(text, ctype):
+    """Return the character codes of a literal text as a piece (codes, length) for _join()."""
+    codes = np.frombuffer(text.encode('utf-32-le' if ctype == np.uint32 else 'utf-8'), dtype=ctype)
+    return codes[None, :], codes.size
+
+
+def _table(names, ctype):
+    """Return the character codes (one row per name, zero padded) and the lengths of the names in a table."""
+    encoded = [name.encode('utf-32-le' if ctype == np.uint32 else 'utf-8') for name in names]
+    width = max(len(name) for name in encoded) // np.dtype(ctype).itemsize
+    codes = np.zeros((len(names), max(width, 1)), dtype=ctype)
+    lengths = np.zeros(len(names), dtype=np.intp)
+    for irow, name in enumerate(encoded):  # Loop over the (short) table, not over the elements
+        row = np.frombuffer(name, dtype=ctype)
+        codes[irow, :row.size] = row
+        lengths[irow] = row.size
+    return codes, lengths
+
+
+@functools.lru_cache(maxsize=None)
+def _pairs(ctype):
+    """Return the character codes of the two-digit numbers 00-99 (shape (100, 2))."""
+    return np.array([[ord(char) for char in '%02i' % num] for num in range(100)], dtype=ctype)
+
+
+def _digits(values, width, ctype):
+    """Return the character codes of non-negative integers < 10^width as zero-padded fields of width digits.
+
+    The digits are converted in pairs with a lookup table, to halve the number of integer divisions.
+    """
+
+    pairs = _pairs(ctype)
+    if width == 2: return pairs[values]
+    codes = np.empty((values.size, width), dtype=ctype)
+    rest, col = values, width
+    while col > 2:
+        rest, low = np.divmod(rest, 100)
+        codes[:, col-2:col] = pairs[low]
+        col -= 2
+    codes[:, :col] = pairs[rest][:, 2-col:]
+    return codes
+
+
+def _number(values, width, ctype):
+    """Return the character codes (left aligned, zero padded) and lengths of non-negative integers without leading
+    zeros, as a piece for _join()."""
+
+    padded = _digits(values, width, ctype)
+    lengths = np.ones(values.size, dtype=np.intp)
+    for ndig in range(2, width+1):
+        lengths += values >= 10**(ndig-1)
+    index = np.arange(width) + (width - lengths)[:, None]
+    codes = np.take_along_axis(padded, np.minimum(index, width-1), axis=1)
+    codes[index >= width] = 0
+    return codes, lengths
+
+
+def _join(pieces, out):
+    """Concatenate pieces (codes, lengths) into the character-code matrix out.
+
+    The codes of a piece are left aligned and padded with zeros, so that every piece can be written with its full
+    width, and is then partly overwritten by the next piece.  Leading pieces with fixed (scalar) lengths are
+    written as slices, and later runs of fixed-length pieces are merged and written at once.
+    """
+
+    nrow, owidth = out.shape
+    fixed = 0  # Common offset while all preceding pieces have fixed lengths
+    while pieces and np.ndim(pieces[0][1]) == 0:
+        codes, length = pieces.pop(0)
+        out[:, fixed:fixed+length] = codes
+        fixed += length
+
+    merged = []
+    for codes, lengths in pieces:
+        if merged and np.ndim(lengths) == 0 and np.ndim(merged[-1][1]) == 0:
+            prev = merged[-1][0]
+            nmax = max(prev.shape[0], codes.shape[0])
+            codes = np.concatenate([np.broadcast_to(prev, (nmax, prev.shape[1])),
+                                    np.broadcast_to(codes, (nmax, codes.shape[1]))], axis=1)
+            lengths += merged.pop()[1]
+        merged.append((codes, lengths))
+
+    out_flat = flat_out(out, out.shape, 'u')
+    offset = np.arange(nrow) * owidth + fixed
+    for codes, lengths in merged:
+        width = codes.shape[1]
+        out_flat[offset[:, None] + np.arange(width)] = codes
+        offset += lengths
+
+
+def _result(shape, width, kind):
+    """Return a string array of shape and its character-code matrix view."""
+    result = np.zeros(shape, dtype='%s%i' % (kind, max(width, 1)))
+    return result, result.reshape(-1).view(_ctype(kind)).reshape(-1, max(width, 1))
+
+
+def _shrink(result, used, kind):
+    """Return the string array with the itemsize reduced to the longest string."""
+    if result.dtype.itemsize // np.dtype(_ctype(kind)).itemsize > used:
+        result = result.astype('%s%i' % (kind, max(used, 1)))
+    return result
+
+
+def format_sexagesimal(value, factor=1, decimals=1, symbols=('°', '′', '″'), sign='+', width=None, modulo=None,
+                       kind='U', chunksize=None):
+    """Format values as sexagesimal strings, e.g. '+12°34′56.7″' or '12h34m56.78s'.
+
+    Parameters:
+      value (float or array):  Value(s) to format.
+      factor (float):          Factor to convert value to the whole units, e.g. r2d or r2h (optional, default: 1).
+      decimals (int):          Number of decimals of the seconds (optional, default: 1).
+      symbols (tuple):         Symbols after the units, minutes and seconds (optional, default: ('°', '′', '″')).
+                               Use e.g. (':', ':', '') for '12:34:56.7'.
+      sign (str):              '+' to print the sign of every value, '-' to print the sign of negative values only
+                               (optional, default: '+').
+      width (int):             Minimum number of digits of the units, zero padded (optional, default: 2; more
+                               when needed for the largest value).
+      modulo (int):            Take the units modulo this number after rounding, e.g. 24 so that 23h59m59.999s
+                               becomes 00h00m00.00s rather than 24h00m00.00s (optional).
+      kind (str):              'U' for a str array or 'S' for a bytes (UTF-8) array (optional, default: 'U').
+      chunksize (int):         Number of elements processed at once (optional).
+
+    Returns:
+      (str or array):  Formatted value(s).
+    """
+
+    if sign not in ('+', '-'):
+        raise ValueError("sign must be '+' or '-', not %r" % sign)
+    ctype = _ctype(kind)
+
+    value = np.asarray(value)
+    sgn, units, minutes, seconds = [arr.reshape(-1) for arr in split_sexagesimal(value, factor, decimals, chunksize)]
+    scale = 10**decimals
+    ticks = np.rint(seconds*scale).astype(np.int64)  # Exact: the seconds were rounded to ticks already
+    if modulo is not None: units %= modulo
+
+    ndig = max(width or 2, len(str(int(units.max()))) if units.size else 1)
+    sym_units, sym_min, sym_sec, plus, minus = [_text(text, ctype) for text in symbols + ('+', '-')]
+    point = _text('.', ctype)
+
+    nsign = 1 if sign == '+' else 0
+    owidth = (nsign + ndig + 2 + 2 + (decimals+1 if decimals > 0 else 0)
+              + sum(sym[0].shape[1] for sym in (sym_units, sym_min, sym_sec)))
+    if sign == '-' and (sgn < 0).any(): owidth += minus[0].shape[1]
+    result, out = _result(value.shape, owidth, kind)
+
+    sign_codes = np.concatenate([minus[0], plus[0]]) if sign == '+' else np.concatenate([minus[0], 0*minus[0]])
+    sign_lengths = np.array([minus[1], plus[1] if sign == '+' else 0])
+
+    for chunk in chunks(units.size, chunksize):
+        positive = (sgn[chunk] > 0).astype(np.intp)
+        pieces = ([(sign_codes[positive], 1)] if sign == '+' else  # Fixed length: written as a slice
+                  [(sign_codes[positive], sign_lengths[positive])] if (positive == 0).any() else [])
+        pieces += [(_digits(units[chunk], ndig, ctype), ndig), sym_units,
+                   (_digits(minutes[chunk], 2, ctype), 2), sym_min,
+                   (_digits(ticks[chunk] // scale, 2, ctype), 2)]
+        if decimals > 0:
+            pieces += [point, (_digits(ticks[chunk] % scale, decimals, ctype), decimals)]
+        pieces.append(sym_sec)
+        _join(pieces, out[chunk])
+
+    if value.ndim == 0: return result[()]
+    return result
+
+
+def format_hms(angle, decimals=2, symbols=('h', 'm', 's'), wrap=True, kind='U', chunksize=None):
+    """Format angles in radians as hours, minutes and seconds, e.g. '12h34m56.78s'.
+
+    Parameters:
+      angle (float or array):  Angle(s) (rad), e.g. right ascension(s).
+      decimals (int):          Number of decimals of the seconds (optional, default: 2).
+      symbols (tuple):         Symbols after the hours, minutes and seconds (optional, default: ('h', 'm', 's')).
+      wrap (bool):             Wrap the angles to 00h-24h, e.g. for right ascensions (optional, default: True).  If
+                               False, e.g. for hour angles, negative angles get a minus sign.
+      kind (str):              'U' for a str array or 'S' for a bytes array (optional, default: 'U').
+      chunksize (int):         Number of elements processed at once (optional).
+
+    Returns:
+      (str or array):  Formatted angle(s).
+    """
+
+    if wrap: return format_sexagesimal(wrap_2pi(np.asarray(angle, dtype=np.float64)), r2h, decimals, symbols, '-',
+                                       2, 24, kind, chunksize)
+    return format_sexagesimal(angle, r2h, decimals, symbols, '-', 2, None, kind, chunksize)
+
+
+def format_dms(angle, decimals=1, symbols=('°', '′', '″'), width=2, kind='U', chunksize=None):
+    """Format angles in radians as signed degrees, arcminutes and arcseconds, e.g. '+12°34′56.7″'.
+
+    Parameters:
+      angle (float or array):  Angle(s) (rad), e.g. declination(s).
+      decimals (int):          Number of decimals of the arcseconds (optional, default: 1).
+      symbols (tuple):         Symbols after the degrees, arcminutes and arcseconds (optional, default:
+                               ('°', '′', '″')).  Use e.g. ('d', 'm', 's') for ASCII.
+      width (int):             Minimum number of digits of the degrees (optional, default: 2; use 3 for longitudes).
+      kind (str):              'U' for a str array or 'S' for a bytes (UTF-8) array (optional, default: 'U').
+      chunksize (int):         Number of elements processed at once (optional).
+
+    Returns:
+      (str or array):  Formatted angle(s).
+    """
+    return format_sexagesimal(angle, r2d, decimals, symbols, '+', width, None, kind, chunksize)
+
+
+def format_date(jd, lang='en', weekday=True, time=False, decimals=0, dst=None, calendar='auto', kind='U',
+                chunksize=None):
+    """Format Julian Days as dates, e.g. 'Sunday 3 January 2026' or 'zondag 3 januari 2026 12:34:56'.
+
+    Parameters:
+      jd (float or array):    Julian Day(s), in the time zone to display.
+      lang (str):             Language: 'en' or 'nl' (optional, default: 'en').
+      weekday (bool):         Start with the day of the week (optional, default: True).
+      time (bool):            Append the time as hh:mm:ss (optional, default: False).
+      decimals (int):         Number of decimals of the seconds if time=True (optional, default: 0).  The time is
+                              rounded, and the carry propagates into the date, e.g. 23:59:59.7 becomes 00:00:00 of
+                              the next day.
+      dst (bool or array):    Append the name of the time zone from dst_en or dst_nl: standard time (False) or
+                              daylight-saving time (True) (optional).
+      calendar (str):         Calendar: 'gregorian', 'julian' or 'auto' (optional, default: 'auto').
+      kind (str):             'U' for a str array or 'S' for a bytes array (optional, default: 'U').
+      chunksize (int):        Number of elements processed at once (optional).
+
+    Returns:
+      (str or array):  Formatted date(s).  Years <= 0 are printed in astronomical numbering with a minus sign.
+    """
+
+    import astroconst as _ac  # pylint: disable=import-outside-toplevel  # The name tables are created lazily
+
+    if lang not in _names:
+        raise ValueError('unknown language %r; use one of %s' % (lang, ', '.join(languages)))
+    ctype = _ctype(kind)
+    dow_table, month_table, dst_table = [_table(getattr(_ac, name), ctype) for name in _names[lang]]
+
+    jd = np.asarray(jd, dtype=np.float64)
+    jd_flat = jd.reshape(-1)
+    if dst is not None: dst = np.broadcast_to(np.asarray(dst, dtype=bool), jd.shape).reshape(-1)
+
+    # Upper limit of the width; the result is shrunk to the longest string at the end:
+    space, colon, point, minus = [_text(text, ctype) for text in (' ', ':', '.', '-')]
+    years = np.floor((jd_flat[np.isfinite(jd_flat)] - 1721059.5)/365.25) if jd_flat.size else np.zeros(1)
+    ydig = len(str(int(np.abs(years).max()) + 1)) if years.size else 1
+    owidth = ((dow_table[0].shape[1] + 1 if weekday else 0) + 2 + 1 + month_table[0].shape[1] + 1 + 1 + ydig
+              + (9 + (decimals+1 if decimals > 0 else 0) if time else 0) + (dst_table[0].shape[1] + 1 if
+                                                                            dst is not None else 0))
+    result, out = _result(jd.shape, owidth, kind)
+    used = 0
+
+    scale = 10**decimals
+    ticks_day = 86400*scale
+    for chunk in chunks(jd_flat.size, chunksize):
+        # Split into the day number (starting at 0h) and the rounded time of day, with the carry into the day:
+        jd0 = jd_flat[chunk] + 0.5
+        day0 = np.floor(jd0)
+        ticks = np.rint((jd0 - day0)*ticks_day).astype(np.int64)
+        carry = ticks >= ticks_day
+        day0[carry] += 1
+        ticks[carry] -= ticks_day
+        if not time: ticks[:] = 0
+
+        year, month, day = jd2date(day0 - 0.5, calendar)
+        year, month, day = [np.atleast_1d(arr).astype(np.int64) for arr in (year, month, np.floor(day + 0.5))]
+
+        pieces = []
+        if weekday:
+            dow = np.atleast_1d(day_of_week(day0 - 0.5))
+            pieces += [(dow_table[0][dow], dow_table[1][dow]), space]
+        pieces += [_number(day, 2, ctype), space, (month_table[0][month], month_table[1][month]), space]
+        negative = (year < 0).astype(np.intp)
+        pieces += [(np.concatenate([0*minus[0], minus[0]])[negative], negative*minus[1]),
+                   _number(np.abs(year), ydig, ctype)]
+        if time:
+            secs = ticks // scale
+            pieces += [space, (_digits(secs // 3600, 2, ctype), 2), colon, (_digits(secs // 60 % 60, 2, ctype), 2),
+                       colon, (_digits(secs % 60, 2, ctype), 2)]
+            if decimals > 0:
+                pieces += [point, (_digits(ticks % scale, decimals, ctype), decimals)]
+        if dst is not None:
+            zone = dst[chunk].astype(np.intp)
+            pieces += [space, (dst_table[0][zone], dst_table[1][zone])]
+
+        _join(pieces, out[chunk])
+        used = max(used, int(np.max(np.sum([np.broadcast_to(lengths, (chunk.stop-chunk.start,))
+                                            for _, lengths in pieces], axis=0), initial=0)))
+
+    result = _shrink(result, used, kind)
+    if jd.ndim == 0: return result[()]
+    return result
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" galactic.py:  Batch transformation between J2000 equatorial and Galactic coordinates.
+
+The rotation matrix is computed once from glon_se_2000, ra_gp_2000 and dec_gp_2000 and cached.  Arrays are
+transformed in chunks to bound the memory used for temporary arrays, and float32 input is transformed in float32.
+"""
+
+
+import functools
+import math
+
+import numpy as np
+
+from . import glon_se_2000, ra_gp_2000, dec_gp_2000, cos_dec_gp_2000, sin_dec_gp_2000
+from ._rotation import rotate_angles, rotate_vectors
+
+
+def eq2gal_matrix(dtype=np.float64):
+    """Return the rotation matrix from J2000 equatorial to Galactic coordinates.
+
+    Parameters:
+      dtype (np.dtype):  Floating-point type of the matrix (optional, default: np.float64).
+
+    Returns:
+      (np.array):  Read-only 3x3 rotation matrix M, so that v_gal = M @ v_eq for unit vectors v.
+
+    Note:
+      - The rows of M are the Galactic x (l=0, b=0), y (l=90°, b=0) and z (b=90°) axes, expressed in J2000
+        equatorial coordinates.  The ascending node of the Galactic plane on the equator lies at RA = ra_gp_2000 +
+        90° and has Galactic longitude glon_se_2000.
+      - The matrices are cached per dtype.
+    """
+
+    return _eq2gal_matrix(np.dtype(dtype))
+
+
+@functools.lru_cache(maxsize=None)
+def _eq2gal_matrix(dtype):
+    """Compute the rotation matrix for eq2gal_matrix(), for a given np.dtype."""
+
+    z_gal = [cos_dec_gp_2000*math.cos(ra_gp_2000), cos_dec_gp_2000*math.sin(ra_gp_2000), sin_dec_gp_2000]
+    node  = [-math.sin(ra_gp_2000), math.cos(ra_gp_2000), 0.0]
+    perp  = [z_gal[1]*node[2] - z_gal[2]*node[1],  # z_gal x node: in the Galactic plane, 90° beyond the node
+             z_gal[2]*node[0] - z_gal[0]*node[2],
+             z_gal[0]*node[1] - z_gal[1]*node[0]]
+
+    cos_lon, sin_lon = math.cos(glon_se_2000), math.sin(glon_se_2000)
+    x_gal = [cos_lon*node[i] - sin_lon*perp[i] for i in range(3)]
+    y_gal = [sin_lon*node[i] + cos_lon*perp[i] for i in range(3)]
+
+    matrix = np.array([x_gal, y_gal, z_gal], dtype=dtype)
+    matrix.setflags(write=False)
+    return matrix
+
+
+def gal2eq_matrix(dtype=np.float64):
+    """Return the rotation matrix from Galactic to J2000 equatorial coordinates; the transpose of eq2gal_matrix()."""
+    return eq2gal_matrix(dtype).T
+
+
+def eq2gal(ra, dec, out=None, chunksize=None):
+    """Convert J2000 equatorial coordinates to Galactic coordinates.
+
+    Parameters:
+      ra (float or array):   Right ascension(s) (rad).
+      dec (float or array):  Declination(s) (rad).
+      out (tuple):           Tuple of two C-contiguous output arrays for (l, b) (optional).
+      chunksize (int):       Number of elements processed at once (optional).
+
+    Returns:
+      tuple (array,array):  Tuple containing (l, b):
+
+      - l (array):  Galactic longitude(s), [0, 2π) (rad).
+      - b (array):  Galactic latitude(s), [-π/2, π/2] (rad).
+    """
+
+    return rotate_angles(ra, dec, eq2gal_matrix(), out, chunksize)
+
+
+def gal2eq(lon, lat, out=None, chunksize=None):
+    """Convert Galactic coordinates to J2000 equatorial coordinates.
+
+    Parameters:
+      lon (float or array):  Galactic longitude(s) (rad).
+      lat (float or array):  Galactic latitude(s) (rad).
+      out (tuple):           Tuple of two C-contiguous output arrays for (ra, dec) (optional).
+      chunksize (int):       Number of elements processed at once (optional).
+
+    Returns:
+      tuple (array,array):  Tuple containing (ra, dec):
+
+      - ra (array):   Right ascension(s), [0, 2π) (rad).
+      - dec (array):  Declination(s), [-π/2, π/2] (rad).
+    """
+
+    return rotate_angles(lon, lat, gal2eq_matrix(), out, chunksize)
+
+
+def eq2gal_vec(vec, out=None, chunksize=None):
+    """Convert J2000 equatorial (unit) vectors to Galactic (unit) vectors.
+
+    Parameters:
+      vec (array):      Array of vectors with shape (..., 3).
+      out (array):      C-contiguous output array with the same shape (optional; may be vec for in-place operation).
+      chunksize (int):  Number of vectors processed at once (optional).
+
+    Returns:
+      (array):  Galactic vectors with shape (..., 3).
+    """
+
+    return rotate_vectors(vec, eq2gal_matrix(), out, chunksize)
+
+
+def gal2eq_vec(vec, out=None, chunksize=None):
+    """Convert Galactic (unit) vectors to J2000 equatorial (unit) vectors.  See eq2gal_vec()."""
+    return rotate_vectors(vec, gal2eq_matrix(), out, chunksize)
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" kepler.py:  Vectorised two-body (Kepler-orbit) propagation for the bodies in pl_a, pl_p and pl_e.
+
+The bodies are indexed as in plname_en, i.e. 0 = Moon (geocentric orbit), 3 = Earth (the orbit of the Earth
+around the Sun, listed as the Sun in plname_en) and 9 = Pluto.  Only the sizes, periods and eccentricities of
+the orbits are tabulated, hence the orientation of the orbits and the mean anomalies at the reference epoch
+must be supplied for real positions; by default, the orbits lie in the reference plane with their perihelia
+along the x axis at jd2000.  This is suitable for coarse ephemerides, e.g. for visibility pre-screening.
+"""
+
+
+import numpy as np
+
+from . import aa, day, jd2000, pl_a, pl_p, pl_e
+from ._batch import chunk_size
+from .angles import wrap_pi
+
+
+gm = np.array([aa.gme*(1 + aa.m_m_over_m_e),             # Moon (around the Earth)
+               aa.gms*(1 + 1/aa.m_s_over_m_me),          # Mercury
+               aa.gms*(1 + 1/aa.m_s_over_m_ve),          # Venus
+               aa.gms*(1 + 1/aa.m_sun_over_m_earthmoon), # Earth + Moon
+               aa.gms*(1 + 1/aa.m_s_over_m_ma),          # Mars
+               aa.gms*(1 + 1/aa.m_s_over_m_j),           # Jupiter
+               aa.gms*(1 + 1/aa.m_s_over_m_sa),          # Saturn
+               aa.gms*(1 + 1/aa.m_s_over_m_u),           # Uranus
+               aa.gms*(1 + 1/aa.m_s_over_m_n),           # Neptune
+               aa.gms*(1 + 1/aa.m_s_over_m_p)]);         """G(M+m) of the central body + orbiting body (m^3/s^2), indexed as pl_a."""
+
+
+def solve_kepler(mean_anom, ecc, iterations=4):
+    """Solve Kepler's equation E - e sin(E) = M for the eccentric anomaly E.
+
+    Parameters:
+      mean_anom (float or array):  Mean anomaly/anomalies M (rad).
+      ecc (float or array):        Eccentricity/eccentricities e (0 <= e < 1).
+      iterations (int):            Number of Halley iterations (optional, default: 4; sufficient for machine
+                                   precision for e <~ 0.5).
+
+    Returns:
+      (float or array):  Eccentric anomaly/anomalies E, with M reduced to (-π, π] (rad).
+
+    Note:
+      - A fixed number of iterations is used, so that the whole array is solved without branches or masks.  The
+        starter E0 = M + 0.85 e sign(sin M) (Danby, 1987) ensures convergence for all eccentricities.
+    """
+
+    mean_anom = wrap_pi(mean_anom)
+    ecc = np.asarray(ecc)
+    ecc_anom = mean_anom + 0.85*ecc*np.sign(mean_anom)
+
+    for _ in range(iterations):
+        esin = ecc*np.sin(ecc_anom)
+        ecos = ecc*np.cos(ecc_anom)
+        func = ecc_anom - esin - mean_anom
+        der1 = 1 - ecos
+        ecc_anom = ecc_anom - func/(der1 - 0.5*func*esin/der1)  # Halley step
+
+    return ecc_anom
+
+
+def mean_motion(bodies=None, use_gm=False):
+    """Return the mean motions of the bodies.
+
+    Parameters:
+      bodies (int or array):  Index/indices of the bodies, as in plname_en (optional, default: all).
+      use_gm (bool):          Use Kepler's third law with gm and pl_a, rather than the tabulated periods pl_p
+                              (optional, default: False).
+
+    Returns:
+      (float or array):  Mean motion(s) (rad/day).
+    """
+
+    if bodies is None: bodies = slice(None)
+    if use_gm:
+        return np.sqrt(gm[bodies]/pl_a[bodies]**3) * day
+    return 2*np.pi / pl_p[bodies] * day
+
+
+def _gauss_vectors(incl, node, argp):
+    """Return the Gaussian vectors P and Q (shape (3, n)) of orbits with the given orientation."""
+
+    cosi, sini = np.cos(incl), np.sin(incl)
+    cosn, sinn = np.cos(node), np.sin(node)
+    cosw, sinw = np.cos(argp), np.sin(argp)
+
+    pvec = np.array([cosw*cosn - sinw*sinn*cosi,  cosw*sinn + sinw*cosn*cosi, sinw*sini])
+    qvec = np.array([-sinw*cosn - cosw*sinn*cosi, -sinw*sinn + cosw*cosn*cosi, cosw*sini])
+    return pvec, qvec
+
+
+def propagate(jd, bodies=None, jd0=jd2000, mean_anom0=0, incl=0, node=0, argp=0, use_gm=False, iterations=4,
+              out=None, chunksize=None):
+    """Compute the positions of bodies in Kepler orbits for all combinations of bodies and epochs.
+
+    Parameters:
+      jd (float or array):          Epoch(s) (JD).
+      bodies (int or array):        Index/indices of the bodies, as in plname_en (optional, default: all).
+      jd0 (float):                  Reference epoch of the mean anomalies (JD; optional, default: jd2000).
+      mean_anom0 (float or array):  Mean anomaly/anomalies at jd0, per body (rad; optional, default: 0).
+      incl (float or array):        Inclination(s) of the orbits, per body (rad; optional, default: 0).
+      node (float or array):        Longitude(s) of the ascending node, per body (rad; optional, default: 0).
+      argp (float or array):        Argument(s) of perihelion, per body (rad; optional, default: 0).
+      use_gm (bool):                Derive the mean motions from gm and pl_a rather than pl_p (optional).
+      iterations (int):             Number of iterations for solve_kepler() (optional, default: 4).
+      out (array):                  C-contiguous output array with shape (n_bodies, n_epochs, 3) (optional).
+      chunksize (int):              Number of body-epoch combinations processed at once (optional).
+
+    Returns:
+      (array):  Positions with respect to the central body (the Earth for the Moon, the Sun otherwise), with
+                shape (n_bodies, n_epochs, 3) (m).
+    """
+
+    if bodies is None: bodies = np.arange(len(pl_a))
+    bodies = np.atleast_1d(bodies)
+    jd = np.atleast_1d(np.asarray(jd, dtype=np.float64))
+    nbody, nepoch = len(bodies), len(jd)
+
+    sma  = pl_a[bodies][:, None]
+    ecc  = pl_e[bodies][:, None]
+    mot  = mean_motion(bodies, use_gm)[:, None]
+    man0 = np.broadcast_to(mean_anom0, (nbody,))[:, None]
+    semi_minor = sma*np.sqrt(1 - ecc**2)
+    pvec, qvec = _gauss_vectors(*np.broadcast_arrays(incl, node, argp, np.zeros(nbody))[:3])
+    pvec, qvec = np.broadcast_to(pvec, (3, nbody)), np.broadcast_to(qvec, (3, nbody))
+
+    if out is None: out = np.empty((nbody, nepoch, 3))
+    step = max(1, (chunksize or chunk_size)//nbody)  # Epochs per chunk
+
+    for start in range(0, nepoch, step):
+        epochs = slice(start, min(start+step, nepoch))
+        ecc_anom = solve_kepler(man0 + mot*(jd[epochs] - jd0), ecc, iterations)  # Shape (nbody, nchunk)
+        xorb = sma*(np.cos(ecc_anom) - ecc)
+        yorb = semi_minor*np.sin(ecc_anom)
+        for coord in range(3):
+            out[:, epochs, coord] = xorb*pvec[coord][:, None] + yorb*qvec[coord][:, None]
+
+    return out
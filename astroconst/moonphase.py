@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" moonphase.py:  Vectorised lunar phases: phase angle, illuminated fraction and the principal phases.
+
+The principal phases are indexed as in moonphase_en and moonphase_nl: 0 = New Moon, 1 = First Quarter, 2 = Full
+Moon, 3 = Last Quarter.  The accuracy can be selected:
+
+- 'mean':   A mean synodic month (month_syn) from the mean New Moon of 2000-01-06; the times of the principal
+            phases are off by up to ~14 hours, the elongation by up to ~7°.
+- 'meeus':  The periodic terms of Meeus, Astronomical Algorithms (1998), Ch.48 (elongation, error ~0.1°) and Ch.49
+            (principal phases, error < ~1 minute).
+
+Times are Julian Days in TT (use astroconst.timescales to convert from/to UT1); ΔT (~1 minute) is negligible
+for the 'mean' model.
+
+Example:
+  >>> from astroconst import moonphase, moonphase_en
+  >>> index, jd_phase = moonphase.principal_phase(jd, which='next')
+  >>> moonphase_en[index]                       # Names of the next principal phases
+  >>> moonphase.illuminated_fraction(jd)        # 0 - 1
+"""
+
+
+import numpy as np
+
+from . import d2r, day, jd2000, month_syn, pi2
+from ._batch import chunks, flat_out
+
+
+jd_new_moon_2000 = 2451550.09766;  """Mean New Moon of 2000-01-06 (JD, TT); lunation number 0 in Meeus (1998)."""
+accuracies = ('mean', 'meeus');     """Supported accuracy models."""
+
+_syn_days = month_syn/day  # Mean synodic month (days)
+
+
+# Periodic terms for the principal phases, Meeus (1998), Ch.49: power of E, multiples of M, M', F and Ω, and the
+# coefficients (days) for New Moon, Full Moon and the quarters:
+_phase_terms = np.array([
+    # E   M   M'  F  Ω   New       Full      Quarters
+    [0,  0,  1,  0, 0, -0.40720, -0.40614, -0.62801],
+    [1,  1,  0,  0, 0,  0.17241,  0.17302,  0.17172],
+    [0,  0,  2,  0, 0,  0.01608,  0.01614,  0.00862],
+    [0,  0,  0,  2, 0,  0.01039,  0.01043,  0.00804],
+    [1, -1,  1,  0, 0,  0.00739,  0.00734,  0.00454],
+    [1,  1,  1,  0, 0, -0.00514, -0.00515, -0.01183],
+    [2,  2,  0,  0, 0,  0.00208,  0.00209,  0.00204],
+    [0,  0,  1, -2, 0, -0.00111, -0.00111, -0.00180],
+    [0,  0,  1,  2, 0, -0.00057, -0.00057, -0.00070],
+    [1,  1,  2,  0, 0,  0.00056,  0.00056,  0.00027],
+    [0,  0,  3,  0, 0, -0.00042, -0.00042, -0.00040],
+    [1,  1,  0,  2, 0,  0.00042,  0.00042,  0.00032],
+    [1,  1,  0, -2, 0,  0.00038,  0.00038,  0.00032],
+    [1, -1,  2,  0, 0, -0.00024, -0.00024, -0.00034],
+    [0,  0,  0,  0, 1, -0.00017, -0.00017, -0.00017],
+    [0,  2,  1,  0, 0, -0.00007, -0.00007,  0      ],
+    [2,  2,  1,  0, 0,  0,        0,       -0.00028],
+    [0,  0,  2, -2, 0,  0.00004,  0.00004,  0.00002],
+    [0,  3,  0,  0, 0,  0.00004,  0.00004,  0.00003],
+    [0,  1,  1, -2, 0,  0.00003,  0.00003,  0.00003],
+    [0,  0,  2,  2, 0,  0.00003,  0.00003,  0.00004],
+    [0,  1,  1,  2, 0, -0.00003, -0.00003, -0.00004],
+    [0, -1,  1,  2, 0,  0.00003,  0.00003,  0.00002],
+    [0, -1,  1, -2, 0, -0.00002, -0.00002, -0.00005],
+    [0,  1,  3,  0, 0, -0.00002, -0.00002, -0.00002],
+    [0,  0,  4,  0, 0,  0.00002,  0.00002,  0      ],
+    [0, -2,  1,  0, 0,  0,        0,        0.00004],
+])
+
+# Additional (planetary) terms for all phases: constant and lunation-number coefficient of the argument (°), and
+# the amplitude (days); the T² term of A1 is added separately:
+_planet_terms = np.array([
+    [299.77,  0.107408, 0.000325], [251.88,  0.016321, 0.000165], [251.83, 26.651886, 0.000164],
+    [349.42, 36.412478, 0.000126], [84.66,  18.206239, 0.000110], [141.74, 53.303771, 0.000062],
+    [207.14,  2.453732, 0.000060], [154.84,  7.306860, 0.000056], [34.52,  27.261239, 0.000047],
+    [207.19,  0.121824, 0.000042], [291.34,  1.844379, 0.000040], [161.72, 24.198154, 0.000037],
+    [239.56, 25.513099, 0.000035], [331.55,  3.592518, 0.000023],
+])
+
+
+def _check_accuracy(accuracy):
+    """Raise a ValueError for an unknown accuracy model."""
+    if accuracy not in accuracies:
+        raise ValueError('unknown accuracy %r; use one of %s' % (accuracy, ', '.join(accuracies)))
+
+
+def elongation(jd, accuracy='meeus'):
+    """Compute the elongation of the Moon from the Sun along the ecliptic, i.e. the phase as an angle.
+
+    Parameters:
+      jd (float or array):  Julian Day(s) (TT).
+      accuracy (str):       Accuracy model: 'mean' or 'meeus' (optional, default: 'meeus').
+
+    Returns:
+      (float or array):  Elongation(s), [0, 2π) (rad): 0 = New Moon, π/2 = First Quarter, π = Full Moon,
+                         3π/2 = Last Quarter.
+    """
+
+    _check_accuracy(accuracy)
+    jd = np.asarray(jd, dtype=np.float64)
+
+    if accuracy == 'mean':
+        return np.mod((jd - jd_new_moon_2000)/_syn_days, 1) * pi2
+
+    # Meeus (1998), Ch.47 (mean arguments) and Ch.48 (phase angle):
+    tjc = (jd - jd2000)/36525
+    elon = (297.8501921 + tjc*(445267.1114034 + tjc*(-0.0018819 + tjc*(1/545868 - tjc/113065000)))) * d2r
+    anom_sun  = (357.5291092 + tjc*(35999.0502909 + tjc*(-0.0001536 + tjc/24490000))) * d2r
+    anom_moon = (134.9633964 + tjc*(477198.8675055 + tjc*(0.0087414 + tjc*(1/69699 - tjc/14712000)))) * d2r
+
+    elon += (6.289*np.sin(anom_moon) - 2.100*np.sin(anom_sun) + 1.274*np.sin(2*elon - anom_moon)
+             + 0.658*np.sin(2*elon) + 0.214*np.sin(2*anom_moon) + 0.110*np.sin(elon)) * d2r
+    return np.mod(elon, pi2)
+
+
+def phase_angle(jd, accuracy='meeus'):
+    """Compute the phase angle of the Moon (the angle Sun - Moon - Earth).
+
+    Parameters:
+      jd (float or array):  Julian Day(s) (TT).
+      accuracy (str):       Accuracy model: 'mean' or 'meeus' (optional, default: 'meeus').
+
+    Returns:
+      (float or array):  Phase angle(s), [0, π] (rad): π = New Moon, 0 = Full Moon.
+    """
+    return np.abs(np.pi - elongation(jd, accuracy))
+
+
+def illuminated_fraction(jd, accuracy='meeus'):
+    """Compute the illuminated fraction of the lunar disc.
+
+    Parameters:
+      jd (float or array):  Julian Day(s) (TT).
+      accuracy (str):       Accuracy model: 'mean' or 'meeus' (optional, default: 'meeus').
+
+    Returns:
+      (float or array):  Illuminated fraction(s), 0 - 1.
+    """
+    return 0.5 - 0.5*np.cos(elongation(jd, accuracy))
+
+
+def phase_jd(lunation, accuracy='meeus'):
+    """Compute the times of principal phases from their (fractional) lunation numbers.
+
+    Parameters:
+      lunation (float or array):  Lunation number(s) k: an integer for New Moon, k + 0.25 for First Quarter,
+                                  k + 0.5 for Full Moon and k + 0.75 for Last Quarter; k = 0 for 2000-01-06.
+      accuracy (str):             Accuracy model: 'mean' or 'meeus' (optional, default: 'meeus').
+
+    Returns:
+      (float or array):  Julian Day(s) (TT) of the principal phase(s).
+    """
+
+    _check_accuracy(accuracy)
+    k = np.asarray(lunation, dtype=np.float64)
+    if accuracy == 'mean':
+        return jd_new_moon_2000 + _syn_days*k
+
+    # Meeus (1998), Ch.49:
+    tjc = k/1236.85
+    jde = 2451550.09766 + 29.530588861*k + tjc**2*(0.00015437 + tjc*(-0.000000150 + tjc*0.00000000073))
+    ecc = 1 - tjc*(0.002516 + tjc*0.0000074)
+    args = np.array([(2.5534 + 29.10535670*k + tjc**2*(-0.0000014 - tjc*0.00000011)),                     # M
+                     (201.5643 + 385.81693528*k + tjc**2*(0.0107582 + tjc*(0.00001238 - tjc*0.000000058))),  # M'
+                     (160.7108 + 390.67050284*k + tjc**2*(-0.0016118 + tjc*(-0.00000227 + tjc*0.000000011))),  # F
+                     (124.7746 - 1.56375588*k + tjc**2*(0.0020672 + tjc*0.00000215))]) * d2r                 # Ω
+
+    phase = np.rint(np.mod(k, 1)*4).astype(np.int64) % 4
+    column = np.choose(phase, [5, 7, 6, 7])  # Column of the coefficients in _phase_terms
+    for term in _phase_terms:
+        arg = term[1]*args[0] + term[2]*args[1] + term[3]*args[2] + term[4]*args[3]
+        jde += term[column] * ecc**int(term[0]) * np.sin(arg)
+
+    # Extra correction W for the quarters:
+    anom_sun, anom_moon, arg_lat = args[0], args[1], args[2]
+    corr_w = (0.00306 - 0.00038*ecc*np.cos(anom_sun) + 0.00026*np.cos(anom_moon) - 0.00002*np.cos(anom_moon - anom_sun)
+              + 0.00002*np.cos(anom_moon + anom_sun) + 0.00002*np.cos(2*arg_lat))
+    jde += np.choose(phase, [0, 1, 0, -1]) * corr_w
+
+    for const, rate, ampl in _planet_terms:
+        jde += ampl * np.sin((const + rate*k) * d2r)
+    jde += 0.000325 * (np.sin((299.77 + 0.107408*k - 0.009173*tjc**2) * d2r) - np.sin((299.77 + 0.107408*k) * d2r))
+
+    return jde
+
+
+def _quarter_jd(quarter, accuracy):
+    """Return the JDs of principal phases given as numbers of quarter lunations since k = 0.
+
+    Large arrays of epochs contain few distinct lunations, so the periodic terms of the Meeus model are evaluated
+    once per distinct phase.
+    """
+
+    if accuracy == 'mean' or quarter.size < 64: return phase_jd(quarter/4, accuracy)
+    unique, inverse = np.unique(quarter, return_inverse=True)
+    return phase_jd(unique/4, accuracy)[inverse.reshape(quarter.shape)]
+
+
+def principal_phase(jd, which='nearest', accuracy='meeus', chunksize=None):
+    """Find the nearest or next principal lunar phase for Julian Days.
+
+    Parameters:
+      jd (float or array):  Julian Day(s) (TT).
+      which (str):          'nearest' or 'next' principal phase (optional, default: 'nearest').
+      accuracy (str):       Accuracy model: 'mean' or 'meeus' (optional, default: 'meeus').
+      chunksize (int):      Number of elements processed at once (optional).
+
+    Returns:
+      tuple (int or array,float or array):  Tuple containing (index, jd_phase):
+
+      - index (int or array):       Index/indices of the phase(s) in moonphase_en (0-3).
+      - jd_phase (float or array):  Julian Day(s) (TT) of the principal phase(s).
+    """
+
+    if which not in ('nearest', 'next'):
+        raise ValueError("which must be 'nearest' or 'next', not %r" % which)
+    _check_accuracy(accuracy)
+
+    jd = np.asarray(jd, dtype=np.float64)
+    jd_flat = jd.reshape(-1)
+    index  = np.empty(jd.shape, dtype=np.int8)
+    result = np.empty(jd.shape)
+    index_flat, result_flat = flat_out(index, jd.shape, 'i'), flat_out(result, jd.shape)
+
+    for chunk in chunks(jd_flat.size, chunksize):
+        times = jd_flat[chunk]
+        quarters = (times - jd_new_moon_2000)/_syn_days * 4  # Mean number of quarter lunations since k = 0
+
+        if which == 'nearest':
+            # The periodic terms are < 1 day, so the nearest phase is the nearest mean phase or its neighbour
+            # on the other side of the time:
+            quarter = np.rint(quarters)
+            other = quarter + np.where(quarters >= quarter, 1, -1)
+            jd_quarter, jd_other = _quarter_jd(quarter, accuracy), _quarter_jd(other, accuracy)
+            use_other = np.abs(jd_other - times) < np.abs(jd_quarter - times)
+            quarter[use_other], jd_quarter[use_other] = other[use_other], jd_other[use_other]
+        else:
+            # The phase after the last mean phase, or (where the periodic terms move that phase to before the
+            # time) one of its successors:
+            quarter = np.floor(quarters)
+            jd_quarter = _quarter_jd(quarter, accuracy)
+            for _ in range(2):
+                passed = jd_quarter <= times
+                if not passed.any(): break
+                quarter[passed] += 1
+                jd_quarter[passed] = _quarter_jd(quarter[passed], accuracy)
+
+        result_flat[chunk] = jd_quarter
+        index_flat[chunk] = np.mod(quarter, 4)
+
+    if jd.ndim == 0: return index[()], result[()]
+    return index, result
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" names.py:  Reverse lookup of month, weekday, planet, moon-phase and Greek-character names.
+
+The names in all languages and abbreviations of a category (e.g. months_en, months_nl_abr, ...) are combined
+into a single case-insensitive dictionary, which is built once when this module is imported.  The indices are
+the same as those of the original arrays, e.g. 1-12 for months, 0-6 (Sunday-Saturday) for weekdays and 0-9
+(Moon-Pluto) for planets.
+"""
+
+
+import types
+
+import numpy as np
+
+import astroconst as _ac
+
+
+_tables = {
+    'month':     ['months_en', 'months_en_lc', 'months_en_abr', 'months_en_abr_lc',
+                  'months_nl', 'months_nl_cap', 'months_nl_abr', 'months_nl_abr_cap'],
+    'weekday':   ['dow_en', 'dow_en_abr', 'dow_en_abr2', 'dow_nl', 'dow_nl_abr', 'dow_nl_abr4'],
+    'planet':    ['plname_en', 'plname_en_lc', 'plname_en_abr', 'plname_nl', 'plname_nl_lc', 'plname_nl_abr'],
+    'moonphase': ['moonphase_en', 'moonphase_nl'],
+    'greek':     ['enGrChar', 'htmlGrChar'],
+}  # Category -> names of the astroconst arrays that are included in its index
+
+
+def _normalise(name):
+    """Return the key used in the index for a name: lower case, without surrounding whitespace."""
+    return name.strip().lower()
+
+
+def _build_index(table_names):
+    """Build a read-only dictionary name -> index from the astroconst arrays with the given names."""
+
+    index = {}
+    for table_name in table_names:
+        for ind, name in enumerate(getattr(_ac, table_name)):
+            if name == '': continue  # E.g. months_en[0]
+            keys = {_normalise(str(name))}
+            keys.add(_normalise(str(name)).rstrip('.'))  # Also accept abbreviations without full stop
+            for key in keys:
+                if index.setdefault(key, ind) != ind:
+                    raise ValueError('ambiguous name %r in %s' % (key, table_name))
+
+    return types.MappingProxyType(index)
+
+
+indices = types.MappingProxyType({category: _build_index(tables) for category, tables in _tables.items()})
+"""Read-only dictionary category -> (read-only dictionary lower-case name -> index)."""
+
+
+def lookup(category, names, default=-1):
+    """Look up the indices of names in the index of a category.
+
+    Parameters:
+      category (str):         Category: 'month', 'weekday', 'planet', 'moonphase' or 'greek'.
+      names (str or array):   Name(s) to look up, in any language, abbreviation or case.
+      default (int):          Index to return for unknown names (optional, default: -1).
+
+    Returns:
+      (int or array):  Index or array of indices into the astroconst arrays of the category.
+
+    Note:
+      - For arrays, each distinct name is normalised and looked up only once, and the names are then mapped through
+        a dictionary of the distinct names, in O(n) without sorting, so that long arrays with repeated names (e.g.
+        from log files) are fast.
+    """
+
+    try:
+        index = indices[category]
+    except KeyError:
+        raise ValueError('unknown category %r; use one of %s' % (category, ', '.join(indices))) from None
+
+    if isinstance(names, str):
+        return index.get(_normalise(names), default)
+
+    names = np.asarray(names)
+    if names.size == 0: return np.empty(names.shape, dtype=np.int64)
+
+    flat  = names.reshape(-1).tolist()
+    codes = {name: index.get(_normalise(str(name)), default) for name in set(flat)}  # Distinct name -> index
+    return np.fromiter(map(codes.__getitem__, flat), dtype=np.int64, count=len(flat)).reshape(names.shape)
+
+
+def month_index(names, default=-1):
+    """Return the month number(s) (1-12) for month name(s).  See lookup()."""
+    return lookup('month', names, default)
+
+def weekday_index(names, default=-1):
+    """Return the day-of-week number(s) (0-6 = Sunday-Saturday) for weekday name(s).  See lookup()."""
+    return lookup('weekday', names, default)
+
+def planet_index(names, default=-1):
+    """Return the planet number(s) (0-9 = Moon-Pluto) for planet name(s).  See lookup()."""
+    return lookup('planet', names, default)
+
+def moonphase_index(names, default=-1):
+    """Return the moon-phase number(s) (0-3 = New Moon-Last Quarter) for moon-phase name(s).  See lookup()."""
+    return lookup('moonphase', names, default)
+
+def greek_index(names, default=-1):
+    """Return the index/indices (0-23 = alpha-omega) for Greek-character name(s) or HTML code(s).  See lookup()."""
+    return lookup('greek', names, default)
@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" planck.py:  Vectorised Planck (blackbody) functions using h_p, k_b, c and Jy.
+
+All functions broadcast wavelengths or frequencies against temperatures, work in chunks to bound the size of
+temporary arrays, accept out= buffers, and compute in the floating-point type of the input (float32 input stays
+float32).  The Planck function C λ^-n / expm1(x) is evaluated directly where possible, and as
+exp(ln C - n ln λ - x) / (-expm1(-x)) where the prefactor or expm1(x) would overflow (the extreme Wien limit),
+so that the results are accurate without overflow from the Rayleigh-Jeans (x << 1) to the Wien (x >> 1) limit.
+Wavelengths and frequencies must be positive and finite.  The constants are read from astroconst when the
+factors are first needed, and the cached factors are cleared when the constants are changed with
+astroconst.editions.
+
+Example:
+  >>> import numpy as np
+  >>> from astroconst import planck, nm
+  >>> wav  = np.linspace(100, 3000, 1000) * nm
+  >>> temp = np.array([3000, 5772, 10000])[:, None]
+  >>> planck.b_lambda(wav, temp).shape            # (3, 1000), W m^-3 sr^-1
+  >>> planck.band_radiance(400*nm, 700*nm, 5772)  # W m^-2 sr^-1
+"""
+
+
+import functools
+import math
+from fractions import Fraction
+
+import numpy as np
+
+import astroconst as _ac
+from . import pi
+from ._batch import chunks, flat_out, float_dtype
+
+
+@functools.lru_cache(maxsize=None)
+def _coefs():
+    """Return the coefficients C of the Planck functions C var^power / expm1(x), with var = λ (m) or ν (Hz)."""
+    h_p, c = _ac.h_p, _ac.c
+    return {'b_lambda': 2*h_p*c**2, 'n_lambda': 2*c, 'b_nu': 2*h_p/c**2, 'b_nu_jy': 2*h_p/c**2/_ac.Jy,
+            'n_nu': 2/c**2}
+
+
+def _reset():
+    """Clear the cached coefficients and factors; called by astroconst.editions when constants change."""
+    _coefs.cache_clear()
+    factors.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
+def factors(dtype=np.float64):
+    """Return the constant factors of the Planck functions for a floating-point type (cached per dtype).
+
+    Parameters:
+      dtype (np.dtype):  Floating-point type (optional, default: np.float64).
+
+    Returns:
+      (dict):  Dictionary with the factors in the given type:
+
+      - 'c1':     2hc² (W m² sr^-1), the first radiation constant.
+      - 'c2':     hc/k (m K), the second radiation constant.
+      - 'c2_nu':  h/k (s K).
+      - 'ln_b_lambda', 'ln_n_lambda', 'ln_b_nu', 'ln_b_nu_jy', 'ln_n_nu':  Natural logarithms of the coefficients
+                  2hc², 2c, 2h/c², 2h/c²/Jy and 2/c² of B_λ, N_λ, B_ν (SI and Jy) and N_ν.
+      - 'band', 'band_photons':  (2k⁴/(h³c²))^(1/4) and (2k³/(h³c²))^(1/3), the coefficients of the band integrals.
+    """
+
+    dtype = np.dtype(dtype).type
+    h_p, k_b, c = _ac.h_p, _ac.k_b, _ac.c
+    fac = {'c1': dtype(2*h_p*c**2), 'c2': dtype(h_p*c/k_b), 'c2_nu': dtype(h_p/k_b),
+           'band':         dtype((2*k_b**4/(h_p**3*c**2))**0.25),  # Powers of k_b and h_p underflow in float32
+           'band_photons': dtype((2*k_b**3/(h_p**3*c**2))**(1/3))}
+    fac.update({'ln_'+kind: dtype(math.log(coef)) for kind, coef in _coefs().items()})
+    return fac
+
+
+def _planck(var, temp, kind, power, c2, inverse, out, chunksize):
+    """Evaluate C var^power / expm1(x), with x = c2/(var T) (inverse) or c2 var/T.
+
+    Parameters:
+      var (array):      Wavelength(s) (m) if inverse, frequency/frequencies (Hz) otherwise.
+      temp (array):     Temperature(s) (K).
+      kind (str):       Key of the coefficient C in _coefs(), e.g. 'b_lambda'.
+      power (int):      Power of var (-5, -4 for wavelengths; 3, 2 for frequencies).
+      c2 (str):         Key of the factor of x in factors().
+      inverse (bool):   x is proportional to 1/var (wavelengths) rather than var (frequencies).
+      out (array):      C-contiguous output array (optional).
+      chunksize (int):  Number of elements processed at once (optional).
+
+    Returns:
+      (float or array):  Function value(s).
+    """
+
+    var, temp = np.asarray(var), np.asarray(temp)
+    dtype = float_dtype(var, temp)
+    fac = factors(dtype)
+    shape = np.broadcast_shapes(var.shape, temp.shape)
+
+    # Terms that depend on var only are computed before broadcasting, e.g. once per wavelength of a grid; the
+    # prefactor is computed in (at least) float64, since e.g. 2h/c² underflows in float32:
+    with np.errstate(divide='ignore', over='ignore', under='ignore'):
+        xfac = np.divide(fac[c2], var, dtype=dtype) if inverse else np.multiply(fac[c2], var, dtype=dtype)
+        pref = (_coefs()[kind] * np.power(var, power, dtype=np.result_type(dtype, np.float64))).astype(dtype)
+    fast = bool(np.all((pref > 0) & np.isfinite(pref)))  # Otherwise, use logarithms for all elements
+
+    if not fast:
+        with np.errstate(divide='ignore'):
+            ln_var = np.log(var, dtype=dtype)
+            ln_var *= power
+            ln_var += fac['ln_'+kind]
+        ln_var = np.broadcast_to(ln_var, shape).reshape(-1)
+
+    pref = np.broadcast_to(pref, shape).reshape(-1)
+    xfac = np.broadcast_to(xfac, shape).reshape(-1)
+    temp = np.broadcast_to(temp, shape).reshape(-1)
+    if out is None: out = np.empty(shape, dtype=dtype)
+    out_flat = flat_out(out, shape)
+
+    with np.errstate(divide='ignore', over='ignore'):  # T = 0 -> x = ∞ -> result 0
+        for chunk in chunks(temp.size, chunksize):
+            xval = np.divide(xfac[chunk], temp[chunk], dtype=dtype)
+            if fast:
+                # C var^power / expm1(x), except where expm1(x) overflows (there, -expm1(-x) = 1):
+                np.expm1(xval, out=xval)
+                np.divide(pref[chunk], xval, out=out_flat[chunk])
+                wien = np.isinf(xval)
+                if not wien.any(): continue
+                xval = np.divide(xfac[chunk][wien], temp[chunk][wien], dtype=dtype)
+                res = np.log(pref[chunk][wien])
+                res -= xval
+                out_flat[chunk][wien] = np.exp(res, out=res)
+            else:
+                # exp(ln C + power ln var - x) / (1 - exp(-x)), which cannot overflow:
+                res = np.subtract(ln_var[chunk], xval)
+                np.exp(res, out=res)
+                np.negative(xval, out=xval)
+                np.expm1(xval, out=xval)
+                np.negative(xval, out=xval)
+                np.divide(res, xval, out=out_flat[chunk])
+
+    if out.ndim == 0: return out[()]
+    return out
+
+
+def b_lambda(wavelength, temp, out=None, chunksize=None):
+    """Compute the spectral radiance of a blackbody per unit wavelength, B_λ = 2hc²/λ⁵ / (exp(hc/λkT) - 1).
+
+    Parameters:
+      wavelength (float or array):  Wavelength(s) λ (m).
+      temp (float or array):        Temperature(s) T (K); broadcast against wavelength.
+      out (array):                  C-contiguous output array with the broadcast shape (optional).
+      chunksize (int):              Number of elements processed at once (optional).
+
+    Returns:
+      (float or array):  B_λ (W m^-2 sr^-1 m^-1).
+    """
+    return _planck(wavelength, temp, 'b_lambda', -5, 'c2', True, out, chunksize)
+
+
+def b_nu(freq, temp, unit='SI', out=None, chunksize=None):
+    """Compute the spectral radiance of a blackbody per unit frequency, B_ν = 2hν³/c² / (exp(hν/kT) - 1).
+
+    Parameters:
+      freq (float or array):  Frequency/frequencies ν (Hz).
+      temp (float or array):  Temperature(s) T (K); broadcast against freq.
+      unit (str):             Unit of the result: 'SI' (W m^-2 Hz^-1 sr^-1) or 'Jy' (Jy sr^-1) (optional,
+                              default: 'SI').
+      out (array):            C-contiguous output array with the broadcast shape (optional).
+      chunksize (int):        Number of elements processed at once (optional).
+
+    Returns:
+      (float or array):  B_ν (W m^-2 Hz^-1 sr^-1 or Jy sr^-1).
+    """
+
+    if unit not in ('SI', 'Jy'):
+        raise ValueError("unknown unit %r; use 'SI' or 'Jy'" % unit)
+    return _planck(freq, temp, 'b_nu' if unit == 'SI' else 'b_nu_jy', 3, 'c2_nu', False, out, chunksize)
+
+
+def photon_lambda(wavelength, temp, out=None, chunksize=None):
+    """Compute the spectral photon radiance of a blackbody per unit wavelength, N_λ = B_λ / (hc/λ).
+
+    Parameters:
+      wavelength (float or array):  Wavelength(s) λ (m).
+      temp (float or array):        Temperature(s) T (K); broadcast against wavelength.
+      out (array):                  C-contiguous output array with the broadcast shape (optional).
+      chunksize (int):              Number of elements processed at once (optional).
+
+    Returns:
+      (float or array):  N_λ (photons s^-1 m^-2 sr^-1 m^-1).
+    """
+    return _planck(wavelength, temp, 'n_lambda', -4, 'c2', True, out, chunksize)
+
+
+def photon_nu(freq, temp, out=None, chunksize=None):
+    """Compute the spectral photon radiance of a blackbody per unit frequency, N_ν = B_ν / (hν).
+
+    Parameters:
+      freq (float or array):  Frequency/frequencies ν (Hz).
+      temp (float or array):  Temperature(s) T (K); broadcast against freq.
+      out (array):            C-contiguous output array with the broadcast shape (optional).
+      chunksize (int):        Number of elements processed at once (optional).
+
+    Returns:
+      (float or array):  N_ν (photons s^-1 m^-2 Hz^-1 sr^-1).
+    """
+    return _planck(freq, temp, 'n_nu', 2, 'c2_nu', False, out, chunksize)
+
+
+_zeta = {3: 1.2020569031595942854, 4: pi**4/90}  # Riemann ζ(n)
+
+
+@functools.lru_cache(maxsize=None)
+def _series(power):
+    """Return the coefficients for the tail integral P(x) = ∫_x^∞ t^power / (e^t - 1) dt.
+
+    Returns:
+      tuple (float,array,array):  Tuple containing (total, small, large):
+
+      - total (float):  P(0) = power! ζ(power+1).
+      - small (array):  Coefficients of S(x) in P(x) = total - x^power S(x) for small x, S(x) = Σ_n B_n x^n /
+                        (n! (n+power)), with the Bernoulli numbers B_n, n = 0 - 40.
+      - large (array):  Coefficients power!/(power-j)! of x^(power-j) / k^(j+1) in the series Σ_k e^(-kx) Σ_j for
+                        large x.
+    """
+
+    bern = [Fraction(1)]
+    for num in range(1, 41):
+        bern.append(-sum(math.comb(num+1, k)*bern[k] for k in range(num)) / (num+1))
+
+    small = np.array([float(bern[num] / (math.factorial(num)*(num+power))) for num in range(41)])
+    total = math.factorial(power) * _zeta[power+1]
+    large = np.array([math.factorial(power)/math.factorial(power-j) for j in range(power+1)])
+    return total, small, large
+
+
+def _tail_integral(xval, power):
+    """Compute P(x) = ∫_x^∞ t^power / (e^t - 1) dt, using a power series for x < 2 and an exponential series
+    (at most 20 terms, fewer if the smallest x in the chunk is large) otherwise."""
+
+    total, small, large = _series(power)
+    dtype = xval.dtype
+    result = np.empty_like(xval)
+
+    sel = xval < 2
+    xsm = xval[sel]
+    series = np.full_like(xsm, small[40])
+    for num in range(38, 1, -2):  # Odd Bernoulli numbers > B_1 vanish
+        series *= xsm*xsm
+        series += small[num]
+    series *= xsm*xsm
+    series += small[0] + small[1]*xsm
+    result[sel] = dtype.type(total) - xsm**power * series
+
+    sel = ~sel
+    xlg = xval[sel]
+    if xlg.size:
+        powers = [xlg**(power-j) for j in range(power+1)]
+        qfac = np.exp(-xlg)
+        qpow = qfac.copy()
+        series = np.zeros_like(xlg)
+        xmin = xlg.min()
+        nterms = 20 if np.isnan(xmin) else min(20, int(-math.log(np.finfo(dtype).eps) / xmin) + 1)  # e^(-kx) < eps
+        for k in range(1, nterms+1):
+            term = sum(dtype.type(large[j]/k**(j+1)) * powers[j] for j in range(power+1))
+            term *= qpow
+            series += term
+            qpow *= qfac
+        series[np.isposinf(xlg)] = 0
+        result[sel] = series
+
+    return result
+
+
+def band_radiance(wavelength1, wavelength2, temp, photons=False, out=None, chunksize=None):
+    """Compute the radiance of a blackbody integrated over a wavelength band, ∫ B_λ dλ or ∫ N_λ dλ.
+
+    Parameters:
+      wavelength1 (float or array):  Lower wavelength(s) of the band (m; may be 0).
+      wavelength2 (float or array):  Upper wavelength(s) of the band (m; may be np.inf).
+      temp (float or array):         Temperature(s) T (K); broadcast against the wavelengths.
+      photons (bool):                Integrate the photon radiance N_λ rather than B_λ (optional, default: False).
+      out (array):                   C-contiguous output array with the broadcast shape (optional).
+      chunksize (int):               Number of elements processed at once (optional).
+
+    Returns:
+      (float or array):  Band radiance (W m^-2 sr^-1, or photons s^-1 m^-2 sr^-1 if photons=True).  Multiply by
+                         π for the flux emitted by a surface; for wavelength1=0, wavelength2=∞ this gives σT⁴.
+
+    Note:
+      - The integral is computed analytically from series expansions of ∫_x^∞ t^n/(e^t-1) dt, with x = hc/λkT,
+        which converge to machine precision for all x.  For very narrow bands, the difference of two tail
+        integrals loses relative precision; use b_lambda() × width instead.
+      - A band in frequency [ν1, ν2] is the wavelength band [c/ν2, c/ν1].
+    """
+
+    wav1, wav2, temp = np.asarray(wavelength1), np.asarray(wavelength2), np.asarray(temp)
+    dtype = float_dtype(wav1, wav2, temp)
+    fac = factors(dtype)
+    power = 2 if photons else 3
+    coef, c2 = fac['band_photons' if photons else 'band'], fac['c2']
+
+    shape = np.broadcast_shapes(wav1.shape, wav2.shape, temp.shape)
+    wav1 = np.broadcast_to(wav1, shape).reshape(-1)
+    wav2 = np.broadcast_to(wav2, shape).reshape(-1)
+    temp = np.broadcast_to(temp, shape).reshape(-1)
+    if out is None: out = np.empty(shape, dtype=dtype)
+    out_flat = flat_out(out, shape)
+
+    with np.errstate(divide='ignore', invalid='ignore'):  # λ = 0 or T = 0 -> x = ∞ -> tail integral 0
+        for chunk in chunks(temp.size, chunksize):
+            tchunk = temp[chunk].astype(dtype, copy=False)
+            xval1 = np.divide(c2, np.multiply(wav1[chunk], tchunk, dtype=dtype))
+            xval2 = np.divide(c2, np.multiply(wav2[chunk], tchunk, dtype=dtype))
+            res = _tail_integral(xval2, power)
+            res -= _tail_integral(xval1, power)
+            res *= (coef*tchunk)**(power+1)
+            out_flat[chunk] = res
+
+    if out.ndim == 0: return out[()]
+    return out
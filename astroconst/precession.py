@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" precession.py:  Precession of equatorial coordinates between epochs, with cached rotation matrices.
+
+The IAU 2006 (P03) precession angles of Capitaine et al. (2003) are used, with the linear rates taken from the
+AA constants aa.dpsi_dt, aa.domega_dt, aa.depsilon_dt and aa.p_a, and eps2000 as the J2000.0 obliquity.  Epochs
+are Julian Days (TT), e.g. jd_hip, jd1950 or jd2000.  The precession matrix between two epochs is computed once
+and kept in a bounded LRU cache, so that whole catalogues can be precessed with a single matrix.
+"""
+
+
+import functools
+import math
+
+import numpy as np
+
+from . import aa, as2r, eps2000, jd2000
+from ._rotation import rotate_angles, rotate_vectors
+
+
+# Polynomial coefficients for T^1 - T^5 (arcseconds, T in Julian centuries TT since J2000.0); Capitaine et al.,
+# A&A 412, 567 (2003), Table 1.  The linear terms are the AA values:
+_psi_a = (aa.dpsi_dt,      -1.0790069, -0.00114045,  0.000132851, -0.0000000951)  # Precession of the equator in longitude
+_omega_a = (aa.domega_dt,   0.0512623, -0.00772503, -0.000000467,  0.0000003337)  # Inclination of the equator of date on the J2000 ecliptic
+_chi_a = (10.556403,       -2.3814292, -0.00121197,  0.000170663, -0.0000000560)  # Planetary precession along the equator
+_eps_a = (aa.depsilon_dt,  -0.0001831,  0.00200340, -0.000000576, -0.0000000434)  # Obliquity of the ecliptic of date
+_p_a   = (aa.p_a,           1.1054348,  0.00007964, -0.000023857, -0.0000000383)  # General precession in longitude
+
+cache_size = 256;  """Maximum number of precession matrices kept in the LRU cache."""
+
+
+def _poly(coefs, tjc):
+    """Evaluate sum(coefs[i] * tjc^(i+1)) with Horner's scheme, for a scalar or array tjc."""
+    result = 0.0
+    for coef in reversed(coefs):
+        result = (result + coef)*tjc
+    return result
+
+
+def obliquity(jd):
+    """Return the mean obliquity of the ecliptic of date.
+
+    Parameters:
+      jd (float or array):  Julian Day(s) (TT).
+
+    Returns:
+      (float or array):  Mean obliquity of the ecliptic (rad).
+    """
+    return eps2000 + _poly(_eps_a, (np.asarray(jd) - jd2000)/36525) * as2r
+
+
+def general_precession(jd):
+    """Return the general precession in longitude since J2000.0.
+
+    Parameters:
+      jd (float or array):  Julian Day(s) (TT).
+
+    Returns:
+      (float or array):  Accumulated general precession in longitude (rad).
+    """
+    return _poly(_p_a, (np.asarray(jd) - jd2000)/36525) * as2r
+
+
+def _rot1(angle):
+    """Rotation matrix for a rotation of the coordinate frame about the x axis."""
+    cosa, sina = math.cos(angle), math.sin(angle)
+    return np.array([[1,0,0], [0,cosa,sina], [0,-sina,cosa]])
+
+
+def _rot3(angle):
+    """Rotation matrix for a rotation of the coordinate frame about the z axis."""
+    cosa, sina = math.cos(angle), math.sin(angle)
+    return np.array([[cosa,sina,0], [-sina,cosa,0], [0,0,1]])
+
+
+def _matrix_from_j2000(jd):
+    """Compute the precession matrix from the J2000.0 mean equator and equinox to those of date jd."""
+
+    tjc = (jd - jd2000)/36525
+    psi   = _poly(_psi_a, tjc) * as2r
+    omega = eps2000 + _poly(_omega_a, tjc) * as2r
+    chi   = _poly(_chi_a, tjc) * as2r
+
+    return _rot3(chi) @ _rot1(-omega) @ _rot3(-psi) @ _rot1(eps2000)
+
+
+@functools.lru_cache(maxsize=cache_size)
+def _precession_matrix(jd_from, jd_to):
+    """Compute and cache the read-only precession matrix for precession_matrix()."""
+
+    matrix = _matrix_from_j2000(jd_to) @ _matrix_from_j2000(jd_from).T
+    matrix.setflags(write=False)
+    return matrix
+
+
+def precession_matrix(jd_from, jd_to):
+    """Return the precession matrix between two epochs.
+
+    Parameters:
+      jd_from (float):  Julian Day (TT) of the original epoch, e.g. jd_hip.
+      jd_to (float):    Julian Day (TT) of the target epoch, e.g. jd2000.
+
+    Returns:
+      (np.array):  Read-only 3x3 rotation matrix P, so that v_to = P @ v_from for unit vectors v.
+
+    Note:
+      - The matrices are memoised in an LRU cache of cache_size entries, keyed on (jd_from, jd_to).  Use
+        precession_matrix.cache_info() and precession_matrix.cache_clear() to inspect or clear the cache.
+    """
+
+    return _precession_matrix(float(jd_from), float(jd_to))
+
+precession_matrix.cache_info  = _precession_matrix.cache_info
+precession_matrix.cache_clear = _precession_matrix.cache_clear
+
+
+def precess(ra, dec, jd_from, jd_to, out=None, chunksize=None):
+    """Precess equatorial coordinates from one epoch to another.
+
+    Parameters:
+      ra (float or array):   Right ascension(s) at epoch jd_from (rad).
+      dec (float or array):  Declination(s) at epoch jd_from (rad).
+      jd_from (float):       Julian Day (TT) of the original epoch.
+      jd_to (float):         Julian Day (TT) of the target epoch.
+      out (tuple):           Tuple of two C-contiguous output arrays for (ra, dec) (optional).
+      chunksize (int):       Number of elements processed at once (optional).
+
+    Returns:
+      tuple (array,array):  Tuple containing (ra, dec) at epoch jd_to (rad); ra in [0, 2π).
+    """
+
+    return rotate_angles(ra, dec, precession_matrix(jd_from, jd_to), out, chunksize)
+
+
+def precess_vec(vec, jd_from, jd_to, out=None, chunksize=None):
+    """Precess equatorial (unit) vectors from one epoch to another.
+
+    Parameters:
+      vec (array):      Array of vectors at epoch jd_from, with shape (..., 3).
+      jd_from (float):  Julian Day (TT) of the original epoch.
+      jd_to (float):    Julian Day (TT) of the target epoch.
+      out (array):      C-contiguous output array with the same shape (optional; may be vec for in-place operation).
+      chunksize (int):  Number of vectors processed at once (optional).
+
+    Returns:
+      (array):  Vectors at epoch jd_to, with shape (..., 3).
+    """
+
+    return rotate_vectors(vec, precession_matrix(jd_from, jd_to), out, chunksize)
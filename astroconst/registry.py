@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" registry.py:  Structured registry of the scalar constants, with uncertainties and Monte-Carlo sampling.
+
+The registry is built on first use from the definitions and docstrings in astroconst/__init__.py and
+astroconst/aa.py.  The constants of the aa submodule are named with the prefix 'aa.', e.g. 'aa.g', and their
+uncertainties and units are parsed from docstrings like "Constant of gravitation: 6.67428E-11 ± 6.7E-15
+m^3/kg/s^2".  The constants in the main module have no uncertainties or units in the registry; their description
+is their docstring.  Only the parsed docstrings are cached: the values are looked up when they are requested, so
+that they follow changes of the constants by astroconst.editions.
+
+Example:
+  >>> from astroconst import registry
+  >>> registry.get('aa.g')                              # Record with name, value, uncertainty, unit, source, ...
+  >>> registry.sample(['aa.g', 'aa.gms'], 1000000)      # Array with shape (1000000, 2)
+"""
+
+
+import ast
+import functools
+import re
+
+import numpy as np
+
+import astroconst as _ac
+from . import aa as _aa
+
+
+_sources = [('', _ac, 'astroconst'), ('aa.', _aa, 'AA 2021')]  # (prefix, module, source)
+_aa_doc = re.compile(r'^(?:(.*):)?\s*([-+]?[0-9.]+(?:[Ee][-+]?\d+)?)\s*(?:±\s*([-+]?[0-9.]+(?:[Ee][-+]?\d+)?))?\s*(.*?)\s*$')
+
+
+def _documented_assignments(module):
+    """Yield (name, docstring) for the assignments in the source of a module that are followed by a docstring."""
+
+    with open(module.__file__, encoding='utf-8') as sfile:
+        body = ast.parse(sfile.read()).body
+
+    for stmt, next_stmt in zip(body[:-1], body[1:]):
+        if (isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 and isinstance(stmt.targets[0], ast.Name)
+                and isinstance(next_stmt, ast.Expr) and isinstance(next_stmt.value, ast.Constant)
+                and isinstance(next_stmt.value.value, str)):
+            yield stmt.targets[0].id, next_stmt.value.value
+
+
+def _parse_aa_doc(doc):
+    """Parse an aa docstring like 'Description: value ± uncertainty unit' into (description, uncertainty, unit)."""
+
+    desc, _, rest = doc.rpartition(': ')
+    match = _aa_doc.match(rest)
+    if match is None: return doc, 0.0, ''
+    unit = ' '.join(match.group(4).split())
+    return desc.strip(), float(match.group(3) or 0), unit
+
+
+@functools.lru_cache(maxsize=None)
+def _build():
+    """Build the registry table and name index from the docstrings; called once, on first use.
+
+    Returns:
+      tuple (np.array,dict,list):  Tuple containing (table, index, refs):
+
+      - table (np.array):  Read-only structured array with the values at the time of the build.
+      - index (dict):      Name -> row index in table.
+      - refs (list):       (module, attribute name) for each row, to look up the current value.
+    """
+
+    rows, refs = {}, {}  # Name -> row; a later definition of the same name replaces the earlier one
+    for prefix, module, source in _sources:
+        for name, doc in _documented_assignments(module):
+            value = getattr(module, name)
+            if isinstance(value, bool) or not isinstance(value, (int, float)): continue
+            if prefix == 'aa.':
+                desc, unc, unit = _parse_aa_doc(doc)
+            else:
+                desc, unc, unit = doc.strip(), 0.0, ''
+            rows[prefix+name] = (prefix+name, float(value), unc, unit, source, desc)
+            refs[prefix+name] = (module, name)
+
+    rows = list(rows.values())
+    width = [max(len(row[col]) for row in rows) for col in (0, 3, 4, 5)]
+    dtype = np.dtype([('name', 'U%i' % width[0]), ('value', 'f8'), ('uncertainty', 'f8'), ('unit', 'U%i' % width[1]),
+                      ('source', 'U%i' % width[2]), ('description', 'U%i' % width[3])])
+    table = np.array(rows, dtype=dtype)
+    table.setflags(write=False)
+
+    return table, {name: ind for ind, name in enumerate(table['name'].tolist())}, list(refs.values())
+
+
+def _values(ind):
+    """Return the current value(s) of the constant(s) in row(s) ind of the registry table.
+
+    Note:
+      - The values are looked up in astroconst and astroconst.aa on every call, rather than cached with the
+        parsed docstrings, so that they follow changes of the constants by astroconst.editions.
+    """
+
+    refs = _build()[2]
+    if np.ndim(ind) == 0: return np.float64(getattr(*refs[ind]))
+    return np.array([getattr(*refs[row]) for row in ind], dtype=np.float64)
+
+
+def table():
+    """Return the (read-only) registry as a structured numpy array, with the current values of the constants.
+
+    Returns:
+      (np.array):  Structured array with the fields name, value, uncertainty, unit, source and description.
+    """
+
+    table = _build()[0]
+    values = _values(range(len(table)))
+    if np.array_equal(values, table['value']): return table
+
+    table = table.copy()
+    table['value'] = values
+    table.setflags(write=False)
+    return table
+
+
+def names():
+    """Return the names of the constants in the registry, e.g. 'c' and 'aa.c'."""
+    return list(_build()[1])
+
+
+def index(names):
+    """Return the row index/indices of constants in the registry table.
+
+    Parameters:
+      names (str or list):  Name(s) of the constant(s), e.g. 'aa.g' or ['aa.g', 'aa.gms'].
+
+    Returns:
+      (int or array):  Row index/indices in table().
+    """
+
+    name_index = _build()[1]
+    try:
+        if isinstance(names, str): return name_index[names]
+        return np.array([name_index[name] for name in names], dtype=np.int64)
+    except KeyError as err:
+        raise KeyError('unknown constant %s in the registry' % err) from None
+
+
+def get(name):
+    """Return the registry record (name, value, uncertainty, unit, source, description) of a constant."""
+    record = _build()[0][index(name)].copy()
+    record['value'] = value(name)
+    return record
+
+
+def value(names):
+    """Return the (current) value(s) of one or more constants."""
+    return _values(index(names))
+
+
+def uncertainty(names):
+    """Return the (1σ) uncertainty/uncertainties of one or more constants."""
+    return _build()[0]['uncertainty'][index(names)]
+
+
+def sample(names, size, corr=None, seed=None, dtype=np.float64):
+    """Draw Monte-Carlo samples of a set of constants from (correlated) Gaussian distributions.
+
+    Parameters:
+      names (str or list):  Name(s) of the constant(s) to sample, e.g. 'aa.g' or ['aa.g', 'aa.gms'].
+      size (int):      Number of samples.
+      corr (array):    Correlation matrix with shape (k, k) for the k constants (optional; default: independent).
+      seed (int or np.random.Generator):  Seed or random-number generator (optional).
+      dtype (np.dtype):  Floating-point type of the result (optional, default: np.float64).
+
+    Returns:
+      (np.array):  Array of samples with shape (size, k), with k = 1 for a single name.
+
+    Note:
+      - Only the constants of the aa submodule have uncertainties in the registry.  The constants of the main
+        module (e.g. 'G' or 'c') have zero uncertainty, so that their samples are constant.
+    """
+
+    ind   = np.atleast_1d(index(names))
+    mean  = _values(ind)
+    sigma = _build()[0]['uncertainty'][ind]
+    rng   = np.random.default_rng(seed)
+
+    samples = rng.standard_normal((size, len(ind)), dtype=dtype)
+    if corr is not None:
+        samples = samples @ np.linalg.cholesky(np.asarray(corr)).T.astype(dtype)
+    samples *= sigma.astype(dtype)
+    samples += mean.astype(dtype)
+    return samples
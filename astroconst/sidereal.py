@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" sidereal.py:  Vectorised Earth Rotation Angle (ERA) and Greenwich mean sidereal time (GMST).
+
+The ERA is computed from aa.theta_0 and aa.dtheta_dut1 (IAU 2000).  To keep full precision, Julian Days can be
+passed in two parts, e.g. an integer and a fraction; the whole days drop out of the ERA exactly, so that the
+precision is limited by the fraction only.  With a single JD array, the resolution of a float64 JD (~40 µs at
+present epochs) limits the precision to ~1 mas.
+"""
+
+
+import numpy as np
+
+from . import aa, pi2, as2r, jd2000
+
+
+_dtheta_frac = 0.00273781191135448  # aa.dtheta_dut1 - 1, without the rounding error of the float aa.dtheta_dut1
+
+# Polynomial coefficients for GMST - ERA, T^0 - T^5 (arcseconds, T in Julian centuries TT since J2000.0);
+# IAU 2006, Capitaine et al., A&A 432, 355 (2005):
+_gmst_poly = (0.014506, 4612.156534, 1.3915817, -0.00000044, -0.000029956, -0.0000000368)
+
+
+def era(jd, jd2=None, out=None):
+    """Compute the Earth Rotation Angle.
+
+    Parameters:
+      jd (float or array):   Julian Day(s) (UT1), or the first part (e.g. the integer day) of the two-part JD(s).
+      jd2 (float or array):  Second part of the two-part Julian Day(s) (UT1), e.g. the day fraction (optional).
+      out (array):           Output buffer (optional).
+
+    Returns:
+      (float or array):  Earth Rotation Angle(s), [0, 2π) (rad).
+    """
+
+    jd = np.asarray(jd, dtype=np.float64)
+    if out is None:
+        out = np.empty(np.broadcast_shapes(jd.shape, np.shape(jd2)))
+
+    # ERA = 2π (frac(jd) + theta_0 + (dtheta_dut1-1) (jd-jd2000)), after IAU SOFA iauEra00():
+    days = jd - jd2000
+    np.fmod(jd, 1, out=out)
+    if jd2 is not None:
+        days = days + jd2
+        out += np.fmod(jd2, 1)
+
+    out += days*_dtheta_frac
+    out += aa.theta_0
+    np.mod(out, 1, out=out)
+    out *= pi2
+
+    if out.ndim == 0: return out[()]
+    return out
+
+
+def gmst(jd, jd2=None, delta_t=0, out=None):
+    """Compute the Greenwich mean sidereal time (IAU 2006).
+
+    Parameters:
+      jd (float or array):       Julian Day(s) (UT1), or the first part of the two-part JD(s).
+      jd2 (float or array):      Second part of the two-part Julian Day(s) (UT1) (optional).
+      delta_t (float or array):  ΔT = TT - UT1 (s), used for the precession part (optional, default: 0; the error
+                                 is ~0.1 mas for ΔT ~ 70 s).
+      out (array):               Output buffer (optional).
+
+    Returns:
+      (float or array):  Greenwich mean sidereal time(s), [0, 2π) (rad).
+    """
+
+    tjc = np.subtract(jd, jd2000, dtype=np.float64)
+    if jd2 is not None: tjc = tjc + jd2
+    tjc = (tjc + np.divide(delta_t, 86400)) / 36525
+
+    poly = 0.0
+    for coef in reversed(_gmst_poly):
+        poly = poly*tjc + coef
+
+    if out is None:
+        out = np.empty(np.shape(tjc))
+    era(jd, jd2, out)
+    out += poly*as2r
+    np.mod(out, pi2, out=out)
+
+    if out.ndim == 0: return out[()]
+    return out
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" timescales.py:  Batched conversion of two-part Julian Days between the time scales TT, TAI, TCG, TDB, TCB
+and UT1.
+
+The defining constants aa.l_g, aa.l_b and aa.tdb_0 are used for TCG and TCB (IAU 2006 Resolution B3), TDB - TT
+uses the two main periodic terms (error < ~30 µs), and UT1 uses a piecewise-polynomial ΔT model (Espenak &
+Meeus, 2006), with the long-term parabola centred on jd1820.  All conversions go through TT, and each step adds
+its correction to the second part of the JD, so that the precision of two-part JDs is retained.
+"""
+
+
+import numpy as np
+
+from . import aa, d2r, day, jd1820, jd2000
+from ._batch import chunks, flat_out
+
+
+scales = ('tt', 'tai', 'tcg', 'tdb', 'tcb', 'ut1');  """Supported time scales."""
+
+_tt_minus_tai = 32.184/day           # TT - TAI (days)
+_t77          = 2443144.5003725      # 1977-01-01 00:00:32.184 TT (JD), where TT, TCG and TCB coincide (up to aa.tdb_0)
+_elgg         = aa.l_g/(1 - aa.l_g)  # d(TCG)/d(TT) - 1
+_elbb         = aa.l_b/(1 - aa.l_b)  # d(TCB)/d(TDB) - 1
+_tdb_0        = aa.tdb_0/day         # TDB - TCB at _t77 (days)
+
+
+# ΔT model: segment start years (the first segment extends to -inf), polynomial offsets and scales for the year,
+# and coefficients for x^0 - x^7, with x = (year - offset)/scale; Espenak & Meeus (2006):
+_year_1820 = 2000 + (jd1820 - jd2000)/365.25  # Year where the long-term parabola has its minimum
+_dt_segments = [
+    # start,   offset,     scale,  coefficients
+    (-np.inf,  _year_1820, 100,    [-20, 0, 32]),
+    (-500,     0,          100,    [10583.6, -1014.41, 33.78311, -5.952053, -0.1798452, 0.022174192, 0.0090316521]),
+    (500,      1000,       100,    [1574.2, -556.01, 71.23472, 0.319781, -0.8503463, -0.005050998, 0.0083572073]),
+    (1600,     1600,       1,      [120, -0.9808, -0.01532, 1/7129]),
+    (1700,     1700,       1,      [8.83, 0.1603, -0.0059285, 0.00013336, -1/1174000]),
+    (1800,     1800,       1,      [13.72, -0.332447, 0.0068612, 0.0041116, -0.00037436, 0.0000121272, -0.0000001699,
+                                    0.000000000875]),
+    (1860,     1860,       1,      [7.62, 0.5737, -0.251754, 0.01680668, -0.0004473624, 1/233174]),
+    (1900,     1900,       1,      [-2.79, 1.494119, -0.0598939, 0.0061966, -0.000197]),
+    (1920,     1920,       1,      [21.20, 0.84493, -0.076100, 0.0020936]),
+    (1941,     1950,       1,      [29.07, 0.407, -1/233, 1/2547]),
+    (1961,     1975,       1,      [45.45, 1.067, -1/260, -1/718]),
+    (1986,     2000,       1,      [63.86, 0.3345, -0.060374, 0.0017275, 0.000651814, 0.00002373599]),
+    (2005,     2000,       1,      [62.92, 0.32217, 0.005589]),
+    (2050,     _year_1820, 100,    [-20 - 0.5628*(2150-_year_1820), 0.5628*100, 32]),  # -20 + 32u² - 0.5628(2150-y)
+    (2150,     _year_1820, 100,    [-20, 0, 32]),
+]
+_dt_start  = np.array([seg[0] for seg in _dt_segments[1:]])
+_dt_offset = np.array([seg[1] for seg in _dt_segments])
+_dt_scale  = np.array([seg[2] for seg in _dt_segments], dtype=float)
+_dt_coefs  = np.array([seg[3] + [0]*(8-len(seg[3])) for seg in _dt_segments])
+
+
+def delta_t(jd):
+    """Return ΔT = TT - UT1, from the piecewise-polynomial model of Espenak & Meeus (2006).
+
+    Parameters:
+      jd (float or array):  Julian Day(s) (UT1 or TT).
+
+    Returns:
+      (float or array):  ΔT (s).
+    """
+
+    year = 2000 + (np.asarray(jd, dtype=np.float64) - jd2000)/365.25
+    seg  = np.searchsorted(_dt_start, year, side='right')
+    x    = (year - _dt_offset[seg]) / _dt_scale[seg]
+
+    coefs = _dt_coefs[seg]  # Shape (..., 8)
+    result = coefs[..., 7]
+    for deg in range(6, -1, -1):
+        result = result*x + coefs[..., deg]
+    return result
+
+
+def tdb_minus_tt(jd):
+    """Return TDB - TT, using the two largest periodic terms (error < ~30 µs).
+
+    Parameters:
+      jd (float or array):  Julian Day(s) (TT or TDB).
+
+    Returns:
+      (float or array):  TDB - TT (s).
+    """
+
+    mean_anom = (357.53 + 0.98560028*(np.asarray(jd) - jd2000)) * d2r  # Mean anomaly of the Earth
+    return 0.001657*np.sin(mean_anom) + 0.000014*np.sin(2*mean_anom)
+
+
+# Conversion steps; each function returns the correction in days to add to a JD in the first scale:
+def _tai_tt(jd):  return _tt_minus_tai
+def _tt_tai(jd):  return -_tt_minus_tai
+def _tcg_tt(jd):  return -aa.l_g*(jd - _t77)
+def _tt_tcg(jd):  return _elgg*(jd - _t77)
+def _tdb_tt(jd):  return -tdb_minus_tt(jd)/day
+def _tt_tdb(jd):  return tdb_minus_tt(jd)/day
+def _tcb_tdb(jd): return _tdb_0 - aa.l_b*(jd - _t77)
+def _tdb_tcb(jd): return -_tdb_0 + _elbb*(jd - _tdb_0 - _t77)
+def _ut1_tt(jd):  return delta_t(jd)/day
+def _tt_ut1(jd):  return -delta_t(jd - delta_t(jd)/day)/day  # Evaluate ΔT at (approximately) UT1
+
+_to_tt   = {'tt': [], 'tai': [_tai_tt], 'tcg': [_tcg_tt], 'tdb': [_tdb_tt], 'tcb': [_tcb_tdb, _tdb_tt],
+            'ut1': [_ut1_tt]}
+_from_tt = {'tt': [], 'tai': [_tt_tai], 'tcg': [_tt_tcg], 'tdb': [_tt_tdb], 'tcb': [_tt_tdb, _tdb_tcb],
+            'ut1': [_tt_ut1]}
+
+
+def convert(jd1, jd2, from_scale, to_scale, out=None, chunksize=None):
+    """Convert two-part Julian Days from one time scale to another.
+
+    Parameters:
+      jd1 (float or array):  First part of the Julian Day(s), e.g. the integer day; this part is not changed.
+      jd2 (float or array):  Second part of the Julian Day(s), e.g. the day fraction.
+      from_scale (str):      Original time scale: 'tt', 'tai', 'tcg', 'tdb', 'tcb' or 'ut1'.
+      to_scale (str):        Target time scale: 'tt', 'tai', 'tcg', 'tdb', 'tcb' or 'ut1'.
+      out (tuple):           Tuple of two C-contiguous float64 output arrays for (jd1, jd2) (optional; may be
+                             (jd1, jd2) for in-place operation).
+      chunksize (int):       Number of elements processed at once (optional).
+
+    Returns:
+      tuple (array,array):  Tuple containing the two-part Julian Day(s) (jd1, jd2) in the target time scale.
+
+    Note:
+      - All corrections of the chain (e.g. TCB -> TDB -> TT -> UT1) are added to the second part of the JD
+        chunk by chunk, without intermediate copies of the full arrays.
+    """
+
+    try:
+        steps = _to_tt[from_scale] + _from_tt[to_scale]
+    except KeyError:
+        raise ValueError('unknown time scale in %r -> %r; use one of %s' % (from_scale, to_scale,
+                                                                           ', '.join(scales))) from None
+
+    jd1, jd2 = np.asarray(jd1, dtype=np.float64), np.asarray(jd2, dtype=np.float64)
+    shape = np.broadcast_shapes(jd1.shape, jd2.shape)
+    if out is None:
+        out = (np.empty(shape), np.empty(shape))
+
+    out1, out2 = flat_out(out[0], shape), flat_out(out[1], shape)
+    in1 = np.broadcast_to(jd1, shape).reshape(-1)
+    in2 = np.broadcast_to(jd2, shape).reshape(-1)
+
+    for chunk in chunks(out1.size, chunksize):
+        part1, part2 = out1[chunk], out2[chunk]
+        if not np.shares_memory(part1, in1): part1[:] = in1[chunk]
+        if not np.shares_memory(part2, in2): part2[:] = in2[chunk]
+        for step in steps:
+            part2 += step(part1 + part2)
+
+    if out[0].ndim == 0: return out[0][()], out[1][()]
+    return out
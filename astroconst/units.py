@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+""" units.py:  Fast conversion between the units defined in astroconst, including compound units.
+
+Units are given as strings like 'Mpc', 'km/s/Mpc' or 'W/m^2/Hz'; unit names are the names of the astroconst
+constants (e.g. 'pc', 'ly', 'au', 'eV', 'Jy', 'year_jul', 'Msun') or SI base and derived units.  Units are
+multiplied with '*' or '.', divided with '/', and may have integer powers with '^' or '**'.  The gram is
+'gram' rather than 'g', since astroconst.g is the constant of gravitation.  Conversion factors are resolved
+once and cached, so that converting an array costs a single multiplication; the cache is cleared when the
+constants are changed with astroconst.editions.
+
+Example:
+  >>> from astroconst import units
+  >>> units.convert(1, 'Mpc', 'ly')       # 3261563.77...
+  >>> units.convert(70, 'km/s/Mpc', 'Hz')  # H0 in SI
+"""
+
+
+import functools
+import re
+
+import numpy as np
+
+import astroconst as _ac
+
+
+# Dimensions, as powers of (m, kg, s, K, A):
+_length, _mass, _time = (1,0,0,0,0), (0,1,0,0,0), (0,0,1,0,0)
+_none = (0,0,0,0,0)
+_energy   = (2,1,-2,0,0)
+_power    = (2,1,-3,0,0)
+_flux_den = (0,1,-2,0,0)   # W m^-2 Hz^-1
+_magn     = (0,1,-2,0,-1)  # Tesla
+
+_units = {}  # Unit name -> (SI factor, dimensions)
+
+def _add(dims, names):
+    """Add the astroconst constants with the given names to the unit table."""
+    for name in names:
+        _units[name] = (float(getattr(_ac, name)), dims)
+
+def _build_units():
+    """(Re)build the unit table from the current values of the astroconst constants."""
+
+    _units.clear()
+
+    # SI base and derived units.  The gram is 'gram', since astroconst.g is the constant of gravitation:
+    _units.update({'m': (1.0, _length), 'kg': (1.0, _mass), 's': (1.0, _time), 'K': (1.0, (0,0,0,1,0)),
+                   'A': (1.0, (0,0,0,0,1)), 'J': (1.0, _energy), 'W': (1.0, _power), 'Hz': (1.0, (0,0,-1,0,0)),
+                   'N': (1.0, (1,1,-2,0,0)), 'T': (1.0, _magn), 'rad': (1.0, _none), 'gram': (1e-3, _mass)})
+
+    _add(_length, ['fm', 'pm', 'nm', 'mum', 'mm', 'cm', 'km', 'au', 'pc', 'kpc', 'Mpc', 'Gpc', 'ly', 'kly', 'Mly',
+                   'Gly', 'r_sun', 'Rsun', 'Ro', 'r_earth', 'earth_r', 'moon_r', 'a_0'])
+    _add(_mass,   ['amu', 'm_sun', 'Msun', 'Mo', 'm_earth', 'earth_m', 'moon_m', 'm_e', 'm_pr', 'm_h'])
+    _add(_time,   ['second', 'minute', 'hour', 'hr', 'day', 'day_sol', 'month', 'month_greg', 'month_sid',
+                   'month_trop', 'month_ano', 'month_drac', 'month_syn', 'year', 'year_jul', 'year_greg', 'year_sid',
+                   'year_trop', 'year_anom', 'kyr', 'Myr', 'Gyr'])
+    _add(_energy, ['erg', 'eV', 'keV', 'MeV', 'GeV'])
+    _add(_power,  ['l_sun', 'Lsun', 'Lo'])
+    _add(_flux_den, ['Jy', 'kJy', 'MJy'])
+    _add(_magn,   ['gauss'])
+    _add(_none,   ['d2r', 'h2r', 'am2r', 'as2r', 'mas2r'])
+
+    # Common aliases:
+    for alias, name in [('min', 'minute'), ('h', 'hour'), ('d', 'day'), ('yr', 'year'), ('um', 'mum'),
+                        ('deg', 'd2r'), ('arcmin', 'am2r'), ('arcsec', 'as2r'), ('mas', 'mas2r')]:
+        _units[alias] = _units[name]
+
+_build_units()
+
+_token = re.compile(r'\s*([/*.]?)\s*([A-Za-z_][A-Za-z_0-9]*)\s*(?:(?:\^|\*\*)\s*([+-]?\d+))?\s*')
+
+
+def _reset():
+    """Rebuild the unit table and clear the cached factors; called by astroconst.editions when constants change."""
+    _build_units()
+    si_factor.cache_clear()
+    factor.cache_clear()
+
+
+def unit_names():
+    """Return a sorted list of the known unit names."""
+    return sorted(_units)
+
+
+@functools.lru_cache(maxsize=None)
+def si_factor(unit):
+    """Return the SI factor and dimensions of a (compound) unit.
+
+    Parameters:
+      unit (str):  Unit, e.g. 'Mpc' or 'km/s/Mpc'.
+
+    Returns:
+      tuple (float,tuple):  Tuple containing (factor, dims):
+
+      - factor (float):  Factor to convert the unit to SI.
+      - dims (tuple):    Dimensions as powers of (m, kg, s, K, A).
+    """
+
+    factor, dims = 1.0, [0]*5
+    pos = 0
+    while pos < len(unit):
+        match = _token.match(unit, pos)
+        if match is None or match.end() == pos or (pos == 0 and match.group(1) == '/'):
+            raise ValueError('cannot parse unit %r at position %i' % (unit, pos))
+        oper, name, power = match.groups()
+        if name not in _units:
+            raise ValueError('unknown unit %r in %r' % (name, unit))
+
+        power = int(power or 1)
+        if oper == '/': power = -power
+        unit_factor, unit_dims = _units[name]
+        factor *= unit_factor**power
+        dims = [dim + power*udim for dim, udim in zip(dims, unit_dims)]
+        pos = match.end()
+
+    return factor, tuple(dims)
+
+
+@functools.lru_cache(maxsize=None)
+def factor(from_unit, to_unit):
+    """Return the factor to convert values from one (compound) unit to another.
+
+    Parameters:
+      from_unit (str):  Original unit, e.g. 'Mpc'.
+      to_unit (str):    Target unit, e.g. 'ly'.
+
+    Returns:
+      (float):  Conversion factor, so that value_to = value_from * factor.
+    """
+
+    from_factor, from_dims = si_factor(from_unit)
+    to_factor, to_dims = si_factor(to_unit)
+    if from_dims != to_dims:
+        raise ValueError('cannot convert %r to %r: incompatible dimensions' % (from_unit, to_unit))
+    return from_factor/to_factor
+
+
+def convert(value, from_unit, to_unit, out=None):
+    """Convert values from one (compound) unit to another.
+
+    Parameters:
+      value (float or array):  Value(s) to convert.
+      from_unit (str):         Original unit, e.g. 'Mpc' or 'km/s/Mpc'.
+      to_unit (str):           Target unit, e.g. 'ly' or 'Hz'.
+      out (array):             Output buffer (optional; may be value for in-place operation).
+
+    Returns:
+      (float or array):  Converted value(s).
+    """
+
+    if out is None and np.isscalar(value):
+        return value * factor(from_unit, to_unit)
+    return np.multiply(value, factor(from_unit, to_unit), out=out)
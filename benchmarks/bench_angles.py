@@ -0,0 +1,78 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""bench_angles.py:  Compare astroconst.angles with naive per-element Python.
+"""
+
+import math
+import time
+
+import numpy as np
+
+import astroconst as ac
+from astroconst import angles
+
+
+def python_wrap_pi(angles_rad):
+    """Naive per-element wrapping to (-π, π]."""
+    return [ac.pi - (ac.pi - ang) % ac.pi2 for ang in angles_rad]
+
+
+def python_rad2dms(angles_rad):
+    """Naive per-element split into sign, d, m, s."""
+    result = []
+    for ang in angles_rad:
+        deg = abs(ang)*ac.r2d
+        d = math.floor(deg)
+        m = math.floor((deg-d)*60)
+        result.append((int(math.copysign(1, ang)), d, m, (deg-d-m/60)*3600))
+    return result
+
+
+def timeit(func, *args):
+    """Return the shortest wall-clock time of three calls of func(*args) (s)."""
+    best = float('inf')
+    for _ in range(3):
+        t0 = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter()-t0)
+    return best
+
+
+def main(size=1_000_000):
+    """Print timings for the conversion of size random angles."""
+
+    rng  = np.random.default_rng(1)
+    rad  = rng.uniform(-10, 10, size)
+    lrad = rad.tolist()
+    buf  = np.empty_like(rad)
+
+    print('%-34s %12s %12s %8s' % ('Operation (%i angles)' % size, 'Python (s)', 'numpy (s)', 'Speedup'))
+    for name, pyfunc, npfunc, args in [
+            ('deg2rad',            lambda lst: [a*ac.d2r for a in lst], angles.deg2rad,  (rad, buf)),
+            ('wrap_2pi (in place)', lambda lst: [a % ac.pi2 for a in lst], angles.wrap_2pi, (buf, buf)),
+            ('wrap_pi',            python_wrap_pi,                       angles.wrap_pi,  (rad, buf)),
+            ('rad2dms',            python_rad2dms,                       angles.rad2dms,  (rad,)),
+    ]:
+        tpy = timeit(pyfunc, lrad)
+        tnp = timeit(npfunc, *args)
+        print('%-34s %12.4f %12.4f %8.1f' % (name, tpy, tnp, tpy/tnp))
+
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""bench_cosmology.py:  Compare the cached cosmology tables with numerical quadrature per redshift.
+"""
+
+import time
+
+import numpy as np
+
+from astroconst import cosmology, c, H0
+
+
+def timeit(func, *args):
+    """Return the best of three run times of func(*args) in ms."""
+    best = np.inf
+    for _ in range(3):
+        t0 = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best*1e3
+
+
+def quadrature(redshift, npoints=64):
+    """Comoving distance with Gauss-Legendre quadrature per redshift (vectorised, but no table)."""
+    nodes, weights = np.polynomial.legendre.leggauss(npoints)
+    omega_m, omega_r = cosmology.omega_matter, cosmology.omega_radiation()
+    result = np.empty_like(redshift)
+    for start in range(0, redshift.size, 10000):
+        zval = redshift[start:start+10000, None]
+        opz = 1 + zval/2*(nodes+1)
+        inv_e = 1/np.sqrt((omega_r*opz + omega_m)*opz**3 + (1 - omega_m - omega_r))
+        result[start:start+10000] = zval[:, 0]/2 * (inv_e @ weights)
+    return result * c/H0
+
+
+def main(size=10_000_000):
+    """Print the timings for size random redshifts between 0 and 3."""
+
+    redshift = np.random.default_rng(1).uniform(0, 3, size)
+    print('%i redshifts' % size)
+    cosmology.clear_cache()
+    print('Build one table:                        %8.1f ms' % timeit(lambda: (cosmology.clear_cache(),
+                                                                            cosmology.error_bound())))
+    print('64-point quadrature per redshift:       %8.1f ms' % timeit(quadrature, redshift))
+    print('cosmology.comoving_distance():          %8.1f ms' % timeit(cosmology.comoving_distance, redshift))
+    print('cosmology.luminosity_distance():        %8.1f ms' % timeit(cosmology.luminosity_distance, redshift))
+    print('cosmology.age():                        %8.1f ms' % timeit(cosmology.age, redshift))
+    print('Relative difference with quadrature:    %8.1e' % np.max(np.abs(cosmology.comoving_distance(redshift[:100000])
+                                                                          / quadrature(redshift[:100000]) - 1)))
+    print('Stated error bound:                     %8.1e' % cosmology.error_bound())
+
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""bench_crossmatch.py:  Compare the cross-match index of astroconst.crossmatch with a brute-force search.
+"""
+
+import os
+import time
+
+import numpy as np
+
+from astroconst import crossmatch, as2r, d2r
+
+
+def timeit(func, *args):
+    """Return the best of three run times of func(*args) in ms."""
+    best = np.inf
+    for _ in range(3):
+        t0 = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best*1e3
+
+
+def brute_force(ra, dec, ra_cat, dec_cat, radius):
+    """Nearest neighbour within radius by computing all separations, per query."""
+    vec_cat = crossmatch.unit_vectors(ra_cat, dec_cat)
+    result = np.empty(ra.size, dtype=np.intp)
+    for iquery, vec in enumerate(crossmatch.unit_vectors(ra, dec)):
+        dist2 = np.einsum('ij,ij->i', vec_cat - vec, vec_cat - vec)
+        best = np.argmin(dist2)
+        result[iquery] = best if dist2[best] <= crossmatch.angle_to_chord(radius)**2 else -1
+    return result
+
+
+def main(ncat=10_000_000, nquery=1_000_000):
+    """Print the timings for a random catalogue of ncat positions and nquery perturbed copies of them."""
+
+    rng = np.random.default_rng(1)
+    ra_cat  = rng.uniform(0, 2*np.pi, ncat)
+    dec_cat = np.arcsin(rng.uniform(-1, 1, ncat))
+    sel = rng.integers(0, ncat, nquery)
+    ra  = ra_cat[sel] + rng.normal(0, 0.3*as2r, nquery)
+    dec = dec_cat[sel] + rng.normal(0, 0.3*as2r, nquery)
+
+    print('Catalogue of %i positions, %i queries, %i CPUs' % (ncat, nquery, os.cpu_count()))
+    print('Brute force, per query:                %10.3f ms' % (timeit(brute_force, ra[:10], dec[:10], ra_cat,
+                                                                         dec_cat, 1*as2r)/10))
+    t0 = time.perf_counter()
+    index = crossmatch.SkyIndex(ra_cat, dec_cat)
+    print('Build SkyIndex:                        %10.1f ms' % ((time.perf_counter() - t0)*1e3))
+    print('SkyIndex.match(1″), all queries:       %10.1f ms' % timeit(index.match, ra, dec, 1*as2r))
+    print('SkyIndex.match(1″, workers=-1):        %10.1f ms' % timeit(lambda: index.match(ra, dec, 1*as2r, workers=-1)))
+    print('SkyIndex.cone_search(0.1°), 10⁴ cones: %10.1f ms' % timeit(index.cone_search, ra[:10000], dec[:10000],
+                                                                      0.1*d2r))
+
+    return
+
+
+if __name__ == '__main__':
+    main()
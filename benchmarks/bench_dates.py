@@ -0,0 +1,89 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""bench_dates.py:  Compare astroconst.dates with a scalar Meeus-style loop.
+"""
+
+import math
+import time
+
+import numpy as np
+
+from astroconst import dates
+
+
+def python_date2jd(year, month, day):
+    """Scalar Gregorian date -> JD (Meeus, Ch.7)."""
+    if month <= 2:
+        year -= 1
+        month += 12
+    cent = year//100
+    return math.floor(365.25*(year+4716)) + math.floor(30.6001*(month+1)) + day + 2 - cent + cent//4 - 1524.5
+
+
+def python_jd2date(jd):
+    """Scalar JD -> Gregorian date (Meeus, Ch.7)."""
+    jd += 0.5
+    whole = math.floor(jd)
+    alpha = math.floor((whole - 1867216.25)/36524.25)
+    b = whole + 1 + alpha - alpha//4 + 1524
+    c = math.floor((b - 122.1)/365.25)
+    d = math.floor(365.25*c)
+    e = math.floor((b - d)/30.6001)
+    month = e - 1 if e < 14 else e - 13
+    return (c - 4716 if month > 2 else c - 4715), month, b - d - math.floor(30.6001*e) + jd - whole
+
+
+def timeit(func, *args):
+    """Return the shortest wall-clock time of three calls of func(*args) (s)."""
+    best = float('inf')
+    for _ in range(3):
+        t0 = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter()-t0)
+    return best
+
+
+def main(size=1_000_000):
+    """Print timings for the conversion of size random dates."""
+
+    rng = np.random.default_rng(1)
+    jd  = rng.uniform(2415020.5, 2488069.5, size)  # 1900-2100
+    year, month, day = dates.jd2date(jd, 'gregorian')
+    dt  = dates.jd2datetime(jd)
+    ly, lm, ld, ljd = year.tolist(), month.tolist(), day.tolist(), jd.tolist()
+
+    print('%-34s %12s %12s %8s' % ('Operation (%i dates)' % size, 'Python (s)', 'numpy (s)', 'Speedup'))
+    for name, pyfunc, pyargs, npfunc, npargs in [
+            ('date2jd', lambda y, m, d: [python_date2jd(*ymd) for ymd in zip(y, m, d)], (ly, lm, ld),
+             dates.date2jd, (year, month, day, 'gregorian')),
+            ('jd2date', lambda jds: [python_jd2date(j) for j in jds], (ljd,),
+             dates.jd2date, (jd, 'gregorian')),
+            ('datetime2jd', None, None, dates.datetime2jd, (dt,)),
+            ('day_of_week', None, None, dates.day_of_week, (jd,)),
+    ]:
+        tnp = timeit(npfunc, *npargs)
+        if pyfunc is None:
+            print('%-34s %12s %12.4f %8s' % (name, '-', tnp, '-'))
+        else:
+            tpy = timeit(pyfunc, *pyargs)
+            print('%-34s %12.4f %12.4f %8.1f' % (name, tpy, tnp, tpy/tnp))
+
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""bench_dtypes.py:  Show that the constants of astroconst.f32 keep large float32 arrays in float32.
+"""
+
+import time
+
+import numpy as np
+
+import astroconst as ac
+import astroconst.f32 as acf32
+
+
+def timeit(func, *args):
+    """Return the best of three run times of func(*args) in ms, and the result of the last run."""
+    best = np.inf
+    for _ in range(3):
+        t0 = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best*1e3, result
+
+
+def main(size=10_000_000):
+    """Multiply a float32 array by scalar and array constants from astroconst and astroconst.f32."""
+
+    dist = np.random.default_rng(1).random((size//10, 10), dtype=np.float32)  # Distances in au, for 10 planets
+    print('Input: %s %s, %.0f MB' % (dist.shape, dist.dtype, dist.nbytes/2**20))
+
+    cases = [('dist * ac.pc        (Python float)', lambda: dist * ac.pc),
+             ('dist * acf32.pc     (np.float32)',   lambda: dist * acf32.pc),
+             ('dist * ac.pl_a      (float64 array)', lambda: dist * (ac.pl_a/ac.au)),
+             ('dist * acf32.pl_a   (float32 array)', lambda: dist * (acf32.pl_a/acf32.au)),
+             ('dist * ac.pl_r[3]   (np.float64)',   lambda: dist * ac.pl_r[3]),
+             ('dist * acf32.pl_r[3] (np.float32)',  lambda: dist * acf32.pl_r[3])]
+
+    for label, func in cases:
+        dtime, result = timeit(func)
+        print('%-38s %8.2f ms   -> %-8s %5.0f MB' % (label, dtime, result.dtype, result.nbytes/2**20))
+
+    return
+
+
+if __name__ == '__main__':
+    main()
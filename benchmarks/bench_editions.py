@@ -0,0 +1,51 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""bench_editions.py:  Compare switching constant editions with reloading the astroconst module.
+"""
+
+import importlib
+import time
+
+import astroconst
+from astroconst import editions
+
+
+def main(number=1000):
+    """Print the time per edition switch, per base-value update and per module reload."""
+
+    t0 = time.perf_counter()
+    for _ in range(number//2):
+        editions.use('CODATA 2018')
+        editions.use('default')
+    print('%-36s %10.3f µs' % ('editions.use()', (time.perf_counter()-t0)/number*1e6))
+
+    t0 = time.perf_counter()
+    for ind in range(number):
+        editions.update(H0=(67 + ind%2)*astroconst.km/astroconst.Mpc)
+    print('%-36s %10.3f µs' % ('editions.update(H0=...)', (time.perf_counter()-t0)/number*1e6))
+    editions.use('default')
+
+    t0 = time.perf_counter()
+    for _ in range(number//10):
+        importlib.reload(astroconst)
+    print('%-36s %10.3f µs' % ('importlib.reload(astroconst)', (time.perf_counter()-t0)/(number//10)*1e6))
+
+    return
+
+
+if __name__ == '__main__':
+    main()
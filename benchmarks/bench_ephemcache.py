@@ -0,0 +1,66 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""bench_ephemcache.py:  Compare the start-up time and memory of worker processes with and without astroconst.ephemcache.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+
+_worker = '''
+import time
+t0 = time.perf_counter()
+import numpy as np
+from astroconst import jd2000, kepler, ephemcache
+jd = jd2000 + np.arange(0, 36525, %(step)r)
+pos = ephemcache.positions(jd) if %(cached)r else kepler.propagate(jd)
+pos.sum()  # Touch all pages
+dt = time.perf_counter() - t0
+private = 0
+with open('/proc/self/smaps_rollup') as smaps:
+    for line in smaps:
+        if line.startswith('Private_Dirty'): private += int(line.split()[1])  # Unshareable
+print(dt*1e3, private/1024)
+'''
+
+
+def worker(cached, step, directory):
+    """Run a worker in a fresh interpreter and return its start-up time (ms) and private dirty memory (MiB)."""
+    env = dict(os.environ, ASTROCONST_CACHE_DIR=directory)
+    output = subprocess.run([sys.executable, '-c', _worker % {'cached': cached, 'step': step}], env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return tuple(float(val) for val in output.split())
+
+
+def main(step=0.1, nworkers=3):
+    """Print the start-up times and private memory of workers on a grid of a century with the given step (days)."""
+
+    with tempfile.TemporaryDirectory() as directory:
+        print('Grid of %i epochs x 10 bodies (%.0f MiB)' % (36525/step, 36525/step*10*3*8/1024**2))
+        print('                         start-up (ms)   private dirty (MiB)')
+        for label, cached in (('kepler.propagate():', False), ('ephemcache, first:', True),
+                              ('ephemcache, warm:', True)):
+            for _ in range(nworkers if label.endswith('warm:') else 1):
+                print('%-24s %12.1f %16.1f' % ((label,) + worker(cached, step, directory)))
+
+    return
+
+
+if __name__ == '__main__':
+    main()
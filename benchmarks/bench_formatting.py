@@ -0,0 +1,73 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""bench_formatting.py:  Compare astroconst.formatting with per-element Python string formatting.
+"""
+
+import time
+
+import numpy as np
+
+import astroconst as ac
+from astroconst import formatting, angles, dates
+
+
+def timeit(func, *args):
+    """Return the best of three run times of func(*args) in ms."""
+    best = np.inf
+    for _ in range(3):
+        t0 = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best*1e3
+
+
+def python_hms(ra):
+    """Per-element f-string formatting of the output of angles.rad2hms()."""
+    _, hrs, mins, secs = angles.rad2hms(ra, decimals=2)
+    return [f'{h:02d}h{m:02d}m{s:05.2f}s' for h, m, s in zip(hrs.tolist(), mins.tolist(), secs.tolist())]
+
+
+def python_date(jd):
+    """Per-element f-string formatting of the output of dates.jd2date()."""
+    year, month, day = dates.jd2date(jd)
+    dow = dates.day_of_week(jd)
+    return [f'{ac.dow_en[w]} {int(d)} {ac.months_en[m]} {y}'
+            for w, d, m, y in zip(dow.tolist(), day.tolist(), month.tolist(), year.tolist())]
+
+
+def main(size=1_000_000):
+    """Print the timings for size random right ascensions, declinations and dates."""
+
+    rng = np.random.default_rng(1)
+    ra  = rng.uniform(0, ac.pi2, size)
+    dec = rng.uniform(-ac.pio2, ac.pio2, size)
+    jd  = rng.uniform(2415020.5, 2488069.5, size)
+
+    print('%i values' % size)
+    print('Python f-strings, hms:              %8.1f ms' % timeit(python_hms, ra))
+    print('formatting.format_hms():            %8.1f ms' % timeit(formatting.format_hms, ra))
+    print('formatting.format_hms(kind=S):      %8.1f ms' % timeit(lambda: formatting.format_hms(ra, kind='S')))
+    print('formatting.format_dms():            %8.1f ms' % timeit(formatting.format_dms, dec))
+    print('Python f-strings, date:             %8.1f ms' % timeit(python_date, jd))
+    print('formatting.format_date():           %8.1f ms' % timeit(formatting.format_date, jd))
+    print('formatting.format_date(time=True):  %8.1f ms' % timeit(lambda: formatting.format_date(jd, time=True)))
+
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""bench_galactic.py:  Compare astroconst.galactic with per-star spherical trigonometry in Python.
+"""
+
+import math
+import time
+
+import numpy as np
+
+import astroconst as ac
+from astroconst import galactic
+
+
+def python_eq2gal(ra, dec):
+    """Per-star equatorial to Galactic conversion using the classical spherical-trigonometry formulae."""
+    result = []
+    for alpha, delta in zip(ra, dec):
+        dra = alpha - ac.ra_gp_2000
+        sin_b = math.sin(delta)*ac.sin_dec_gp_2000 + math.cos(delta)*ac.cos_dec_gp_2000*math.cos(dra)
+        lon = ac.glon_se_2000 + ac.pio2 - math.atan2(math.cos(delta)*math.sin(dra),
+                                                      math.sin(delta)*ac.cos_dec_gp_2000
+                                                      - math.cos(delta)*ac.sin_dec_gp_2000*math.cos(dra))
+        result.append((lon % ac.pi2, math.asin(sin_b)))
+    return result
+
+
+def timeit(func, *args):
+    """Return the shortest wall-clock time of three calls of func(*args) (s)."""
+    best = float('inf')
+    for _ in range(3):
+        t0 = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter()-t0)
+    return best
+
+
+def main(size=1_000_000):
+    """Print the throughput of the Galactic transformation of size random stars."""
+
+    rng = np.random.default_rng(1)
+    ra  = rng.uniform(0, ac.pi2, size)
+    dec = np.arcsin(rng.uniform(-1, 1, size))
+
+    tpy = timeit(python_eq2gal, ra.tolist(), dec.tolist())
+    print('%-28s %10.2f Mstars/s' % ('Python, per star', size/tpy/1e6))
+
+    for dtype in (np.float64, np.float32):
+        ra_t, dec_t = ra.astype(dtype), dec.astype(dtype)
+        out = (np.empty_like(ra_t), np.empty_like(dec_t))
+        tnp = timeit(galactic.eq2gal, ra_t, dec_t, out)
+        print('%-28s %10.2f Mstars/s' % ('eq2gal, '+np.dtype(dtype).name, size/tnp/1e6))
+
+    vec = np.stack([np.cos(dec)*np.cos(ra), np.cos(dec)*np.sin(ra), np.sin(dec)], axis=-1)
+    tnp = timeit(galactic.eq2gal_vec, vec, vec)
+    print('%-28s %10.2f Mstars/s' % ('eq2gal_vec, in place', size/tnp/1e6))
+
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""bench_import.py:  Measure the cold import time of astroconst, with and without numpy.
+
+Each measurement runs in a fresh Python interpreter, so that nothing is cached in sys.modules.
+"""
+
+import subprocess
+import sys
+
+
+def cold_import(statement, nrep=20):
+    """Time a statement in fresh interpreters and report whether numpy was loaded.
+
+    Parameters:
+      statement (str):  Python import statement to time.
+      nrep (int):       Number of fresh interpreters to start.
+
+    Returns:
+      tuple (float,bool):  Tuple containing (best_time, numpy_loaded):
+
+      - best_time (float):      Shortest wall-clock time of the statement over the repetitions (s).
+      - numpy_loaded (bool):    Whether numpy was in sys.modules after the statement.
+    """
+
+    code = ('import sys, time\n'
+            't0 = time.perf_counter()\n'
+            + statement + '\n'
+            'print(time.perf_counter()-t0, "numpy" in sys.modules)\n')
+
+    best = float('inf')
+    for _ in range(nrep):
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.split()
+        best = min(best, float(out[0]))
+
+    return best, out[1] == 'True'
+
+
+def main():
+    """Print the cold import times of some typical astroconst imports."""
+
+    statements = ['from astroconst import au, d2r',
+                  'import astroconst.aa',
+                  'from astroconst import au, months_en',
+                  'import numpy']
+
+    for statement in statements:
+        best, numpy_loaded = cold_import(statement)
+        print('%-40s  %8.3f ms   numpy loaded: %s' % (statement, best*1e3, numpy_loaded))
+
+
+if __name__ == '__main__':
+    main()
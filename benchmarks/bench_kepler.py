@@ -0,0 +1,72 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""bench_kepler.py:  Compare astroconst.kepler with a scalar Newton solver.
+"""
+
+import math
+import time
+
+import numpy as np
+
+import astroconst as ac
+from astroconst import kepler
+
+
+def scalar_kepler(mean_anom, ecc, tol=1e-15):
+    """Solve Kepler's equation for a single mean anomaly with Newton's method."""
+    ecc_anom = mean_anom
+    while True:
+        delta = (ecc_anom - ecc*math.sin(ecc_anom) - mean_anom) / (1 - ecc*math.cos(ecc_anom))
+        ecc_anom -= delta
+        if abs(delta) < tol: return ecc_anom
+
+
+def scalar_propagate(jd):
+    """Compute in-plane positions for all bodies and epochs with scalar Python code."""
+    mot = kepler.mean_motion()
+    result = []
+    for body in range(len(ac.pl_a)):
+        for epoch in jd:
+            ecc_anom = scalar_kepler((mot[body]*(epoch - ac.jd2000) + math.pi) % ac.pi2 - math.pi, ac.pl_e[body])
+            result.append((ac.pl_a[body]*(math.cos(ecc_anom) - ac.pl_e[body]),
+                           ac.pl_a[body]*math.sqrt(1-ac.pl_e[body]**2)*math.sin(ecc_anom)))
+    return result
+
+
+def main(nepoch=100_000):
+    """Print timings for all bodies at nepoch epochs."""
+
+    jd  = np.linspace(ac.jd2000, ac.jd2000 + 100*365.25, nepoch)
+    out = np.empty((len(ac.pl_a), nepoch, 3))
+
+    t0 = time.perf_counter()
+    scalar_propagate(jd[:nepoch//10].tolist())
+    tpy = (time.perf_counter() - t0)*10
+
+    t0 = time.perf_counter()
+    kepler.propagate(jd, out=out)
+    tnp = time.perf_counter() - t0
+
+    nsol = len(ac.pl_a)*nepoch
+    print('%-24s %10.3f Msolutions/s' % ('Scalar Newton', nsol/tpy/1e6))
+    print('%-24s %10.3f Msolutions/s' % ('kepler.propagate()', nsol/tnp/1e6))
+
+    return
+
+
+if __name__ == '__main__':
+    main()
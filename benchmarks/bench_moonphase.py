@@ -0,0 +1,51 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""bench_moonphase.py:  Time the lunar-phase annotation of a large array of Julian Days, for both accuracy models.
+"""
+
+import time
+
+import numpy as np
+
+from astroconst import moonphase, jd2000
+
+
+def timeit(func, *args, **kwargs):
+    """Return the run time of func(*args, **kwargs) in ms."""
+    t0 = time.perf_counter()
+    func(*args, **kwargs)
+    return (time.perf_counter() - t0)*1e3
+
+
+def main(size=1_000_000):
+    """Print the timings for size random epochs between 1950 and 2050."""
+
+    jd = np.random.default_rng(1).uniform(jd2000 - 50*365.25, jd2000 + 50*365.25, size)
+    print('%i epochs' % size)
+    for accuracy in moonphase.accuracies:
+        print('%-6s illuminated_fraction():        %8.1f ms' % (accuracy, timeit(moonphase.illuminated_fraction, jd,
+                                                                                   accuracy)))
+        print('%-6s principal_phase(which=nearest): %8.1f ms' % ('', timeit(moonphase.principal_phase, jd,
+                                                                             accuracy=accuracy)))
+        print('%-6s principal_phase(which=next):    %8.1f ms' % ('', timeit(moonphase.principal_phase, jd, 'next',
+                                                                             accuracy)))
+
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""bench_names.py:  Compare astroconst.names with a linear np.where() scan per token.
+"""
+
+import time
+
+import numpy as np
+
+import astroconst as ac
+from astroconst import names
+
+
+def timeit(func, *args):
+    """Return the shortest wall-clock time of three calls of func(*args) (s)."""
+    best = float('inf')
+    for _ in range(3):
+        t0 = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter()-t0)
+    return best
+
+
+def main(size=200_000):
+    """Print timings for the lookup of size random month names."""
+
+    rng    = np.random.default_rng(1)
+    tokens = ac.months_en[rng.integers(1, 13, size)]
+
+    tscan = timeit(lambda toks: [np.where(ac.months_en == tok)[0][0] for tok in toks], tokens)
+    tdict = timeit(lambda toks: [names.month_index(tok) for tok in toks], tokens.tolist())
+    tbat  = timeit(names.month_index, tokens)
+
+    print('Lookup of %i month names:' % size)
+    print('  %-30s %10.4f s' % ('np.where() per token', tscan))
+    print('  %-30s %10.4f s' % ('month_index() per token', tdict))
+    print('  %-30s %10.4f s' % ('month_index() on array', tbat))
+
+    return
+
+
+if __name__ == '__main__':
+    main()
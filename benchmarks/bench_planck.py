@@ -0,0 +1,63 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""bench_planck.py:  Compare astroconst.planck.b_lambda() with the naive formula on a temperature x wavelength grid.
+"""
+
+import time
+
+import numpy as np
+
+from astroconst import planck, h_p, k_b, c, nm
+
+
+def timeit(func, *args):
+    """Return the best of three run times of func(*args) in ms."""
+    best = np.inf
+    for _ in range(3):
+        t0 = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best*1e3
+
+
+def naive(wav, temp):
+    """Planck function B_λ without chunking; overflows (with warnings) in the Wien limit."""
+    return 2*h_p*c**2 / wav**5 / np.expm1(h_p*c/(wav*k_b*temp))
+
+
+def main(ntemp=1000, nwav=10000):
+    """Print the timings for a grid of ntemp x nwav cells, in float64 and float32."""
+
+    print('Grid: %i temperatures x %i wavelengths' % (ntemp, nwav))
+    for dtype in (np.float64, np.float32):
+        temp = np.geomspace(10, 1e5, ntemp, dtype=dtype)[:, None]
+        wav  = np.geomspace(10, 1e6, nwav, dtype=dtype) * dtype(nm)
+        out  = np.empty((ntemp, nwav), dtype=dtype)
+
+        with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+            print('%-9s naive formula:                  %8.1f ms' % (np.dtype(dtype).name, timeit(naive, wav, temp)))
+        print('%-9s planck.b_lambda():              %8.1f ms' % ('', timeit(planck.b_lambda, wav, temp)))
+        print('%-9s planck.b_lambda(out=out):       %8.1f ms' % ('', timeit(lambda: planck.b_lambda(wav, temp,
+                                                                                                  out=out))))
+        print('%-9s planck.band_radiance() per row: %8.1f ms' % ('', timeit(planck.band_radiance, wav[:-1],
+                                                                             wav[1:], temp)))
+
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""bench_precession.py:  Precess a Hipparcos-epoch catalogue to J2000, per star and as a batch.
+"""
+
+import time
+
+import numpy as np
+
+import astroconst as ac
+from astroconst import precession
+
+
+def per_star(ra, dec):
+    """Precess each star with a freshly computed matrix."""
+    for alpha, delta in zip(ra[:10000], dec[:10000]):
+        precession.precession_matrix.cache_clear()
+        precession.precess(alpha, delta, ac.jd_hip, ac.jd2000)
+
+
+def main(size=1_000_000):
+    """Print the throughput of the precession of size random stars."""
+
+    rng = np.random.default_rng(1)
+    ra  = rng.uniform(0, ac.pi2, size)
+    dec = np.arcsin(rng.uniform(-1, 1, size))
+    out = (np.empty_like(ra), np.empty_like(dec))
+
+    t0 = time.perf_counter()
+    per_star(ra, dec)
+    tstar = (time.perf_counter()-t0)/10000
+
+    precession.precession_matrix.cache_clear()
+    t0 = time.perf_counter()
+    precession.precess(ra, dec, ac.jd_hip, ac.jd2000, out)
+    tbatch = (time.perf_counter()-t0)/size
+
+    print('%-36s %10.3f Mstars/s' % ('Matrix per star', 1e-6/tstar))
+    print('%-36s %10.3f Mstars/s' % ('Cached matrix, batch', 1e-6/tbatch))
+    print(precession.precession_matrix.cache_info())
+
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""bench_registry.py:  Time the registry build, lookups and Monte-Carlo sampling.
+"""
+
+import time
+
+import numpy as np
+
+from astroconst import registry
+
+
+def main(size=1_000_000):
+    """Print timings for the registry."""
+
+    t0 = time.perf_counter()
+    registry.table()
+    print('%-46s %10.3f ms' % ('Build registry (first use)', (time.perf_counter()-t0)*1e3))
+
+    t0 = time.perf_counter()
+    for _ in range(100_000): registry.value('aa.gms')
+    print('%-46s %10.3f µs' % ('value() lookup', (time.perf_counter()-t0)*10))
+
+    names = [name for name in registry.names() if name.startswith('aa.m_s_over')] + ['aa.g', 'aa.gms']
+
+    rng = np.random.default_rng(1)
+    t0 = time.perf_counter()
+    np.stack([rng.normal(registry.value(name), registry.uncertainty(name), size) for name in names], axis=1)
+    print('%-46s %10.3f ms' % ('%i x %i samples, one constant at a time' % (size, len(names)),
+                              (time.perf_counter()-t0)*1e3))
+
+    t0 = time.perf_counter()
+    registry.sample(names, size, seed=1)
+    print('%-46s %10.3f ms' % ('%i x %i samples, sample()' % (size, len(names)), (time.perf_counter()-t0)*1e3))
+
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""bench_sidereal.py:  Throughput and precision of astroconst.sidereal.era() and gmst().
+"""
+
+import time
+
+import numpy as np
+
+import astroconst as ac
+from astroconst import angles, sidereal
+
+
+def timeit(func, *args, **kwargs):
+    """Return the shortest wall-clock time of three calls of func(*args, **kwargs) (s)."""
+    best = float('inf')
+    for _ in range(3):
+        t0 = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter()-t0)
+    return best
+
+
+def main(size=2_000_000):
+    """Print the throughput for size timestamps, and the precision loss of single-array JDs."""
+
+    rng  = np.random.default_rng(1)
+    day  = np.floor(rng.uniform(2.45e6, 2.47e6, size))
+    frac = rng.uniform(0, 1, size)
+    jd   = day + frac
+    out  = np.empty(size)
+
+    for name, func, args in [('era, two-part JD',  sidereal.era,  (day, frac)),
+                             ('era, single JD',    sidereal.era,  (jd,)),
+                             ('gmst, two-part JD', sidereal.gmst, (day, frac)),
+                             ('gmst, single JD',   sidereal.gmst, (jd,))]:
+        print('%-24s %10.2f Mtimestamps/s' % (name, size/timeit(func, *args, out=out)/1e6))
+
+    diff = angles.wrap_pi(sidereal.era(jd) - sidereal.era(day, frac))
+    print('Max. ERA difference single vs. two-part JD: %.3f mas' % (np.abs(diff).max()*ac.r2mas))
+
+    return
+
+
+if __name__ == '__main__':
+    main()
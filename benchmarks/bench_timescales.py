@@ -0,0 +1,45 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""bench_timescales.py:  Throughput of astroconst.timescales.convert() for some conversion chains.
+"""
+
+import time
+
+import numpy as np
+
+from astroconst import timescales
+
+
+def main(size=2_000_000):
+    """Print the throughput for the conversion of size two-part JDs."""
+
+    rng  = np.random.default_rng(1)
+    day  = np.floor(rng.uniform(2.45e6, 2.47e6, size))
+    frac = rng.uniform(0, 1, size)
+    out  = (np.empty(size), np.empty(size))
+
+    for from_scale, to_scale in [('tt', 'tai'), ('tt', 'tcg'), ('tt', 'tdb'), ('tcb', 'tt'), ('tcb', 'ut1')]:
+        t0 = time.perf_counter()
+        timescales.convert(day, frac, from_scale, to_scale, out)
+        dtime = time.perf_counter() - t0
+        print('%-12s %10.2f Mtimestamps/s' % (from_scale+' -> '+to_scale, size/dtime/1e6))
+
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""bench_units.py:  Compare astroconst.units.convert() with a bare multiplication.
+"""
+
+import timeit
+
+import numpy as np
+
+import astroconst as ac
+from astroconst import units
+
+
+def main():
+    """Print the time per call for scalars and arrays."""
+
+    arr = np.random.default_rng(1).uniform(0, 1, 1_000_000)
+    out = np.empty_like(arr)
+    fac = ac.km/ac.Mpc
+
+    for name, bare, conv, number in [
+            ('scalar', lambda: 70.0*fac, lambda: units.convert(70.0, 'km/s/Mpc', 'Hz'), 1_000_000),
+            ('array of 1e6', lambda: np.multiply(arr, fac, out=out),
+             lambda: units.convert(arr, 'km/s/Mpc', 'Hz', out=out), 1000),
+    ]:
+        tbare = min(timeit.repeat(bare, number=number, repeat=3))/number
+        tconv = min(timeit.repeat(conv, number=number, repeat=3))/number
+        print('%-14s  bare: %10.3f µs   convert(): %10.3f µs   overhead: %8.3f µs' % (name, tbare*1e6, tconv*1e6,
+                                                                                     (tconv-tbare)*1e6))
+
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,314 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""suite.py:  Benchmark suite for import cost, attribute access, memory footprint and the vectorised helpers.
+
+The suite measures:
+  - import:      cold import times, each in a fresh interpreter (s);
+  - importtime:  the self and cumulative import times of the astroconst modules from python -X importtime (s);
+  - attributes:  the latency of repeated attribute access, e.g. astroconst.au and astroconst.aa.c (s), and of the
+                 first access of a lazy array constant in a fresh interpreter;
+  - memory:      the memory allocated by importing astroconst, and the size of the array-valued constants (bytes);
+  - helpers:     the run time of the vectorised helpers of the submodules per array element (s).
+
+The results are printed, and written as JSON with -o.  With --compare, every metric is compared with a
+baseline JSON file, and the exit status is 1 if any metric is slower or larger than the baseline by more than
+the tolerance, so that CI can flag regressions.  Submodules that have no helper benchmark are listed under
+"untimed"; add a case to helper_cases() when adding a vectorised submodule.
+
+Usage:
+  python benchmarks/suite.py [-o results.json] [--compare baseline.json] [--tolerance 0.25] [--size 100000]
+"""
+
+import argparse
+import json
+import os
+import pkgutil
+import platform
+import subprocess
+import sys
+import time
+import timeit as _timeit
+
+import numpy as np
+
+# Use the astroconst of this repository, also when it is not installed, in this process and in the fresh
+# interpreters that the suite starts:
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _root)
+os.environ['PYTHONPATH'] = os.pathsep.join(filter(None, [_root, os.environ.get('PYTHONPATH')]))
+
+import astroconst as ac  # pylint: disable=wrong-import-position
+from astroconst import aa  # pylint: disable=wrong-import-position
+
+from bench_import import cold_import  # pylint: disable=wrong-import-position
+
+
+sections = ('import', 'importtime', 'attributes', 'memory', 'helpers');  """Sections of the suite, in order."""
+_untimed = {'aa', 'f32', 'f128', 'export', 'editions',  # Submodules without array helpers
+            'ephemcache'}  # Writes to disk; see bench_ephemcache.py
+
+
+def run_python(code, *options):
+    """Run code in a fresh interpreter and return its stdout and stderr."""
+    proc = subprocess.run([sys.executable, *options, '-c', code], capture_output=True, text=True, check=True)
+    return proc.stdout, proc.stderr
+
+
+def bench_import(nrep=20):
+    """Return the cold import times (s) of typical astroconst imports, with numpy as a reference."""
+
+    statements = ['import astroconst', 'from astroconst import au, d2r', 'import astroconst.aa',
+                  'from astroconst import au, months_en', 'import numpy']
+    return {statement: cold_import(statement, nrep)[0] for statement in statements}
+
+
+def bench_importtime(nrep=5):
+    """Return the self and cumulative import times (s) of the astroconst modules, from python -X importtime.
+
+    The best of nrep runs is taken per module.
+    """
+
+    result = {}
+    for _ in range(nrep):
+        _, stderr = run_python('import astroconst, astroconst.aa', '-X', 'importtime')
+        for line in stderr.splitlines():
+            if not line.startswith('import time:') or '|' not in line: continue
+            fields = line[len('import time:'):].split('|')
+            if not fields[0].strip().isdigit(): continue  # Header line
+            name = fields[2].strip()
+            if not name.startswith('astroconst'): continue
+            times = [int(fields[0])*1e-6, int(fields[1])*1e-6]
+            result[name] = {'self': min(result[name]['self'], times[0]) if name in result else times[0],
+                            'cumulative': min(result[name]['cumulative'], times[1]) if name in result else times[1]}
+    return result
+
+
+def bench_attributes(number=1_000_000):
+    """Return the latency (s) of attribute access on astroconst and astroconst.aa.
+
+    Parameters:
+      number (int):  Number of accesses per timing; the best of five timings is used.
+    """
+
+    tests = {'astroconst.au': 'ac.au', 'astroconst.h_bar': 'ac.h_bar', 'astroconst.pl_a (array)': 'ac.pl_a',
+             'astroconst.pl_a[3] (array element)': 'ac.pl_a[3]', 'astroconst.aa.c': 'ac.aa.c', 'aa.c': 'aa.c',
+             'local au (reference)': 'au'}
+    env = {'ac': ac, 'aa': aa, 'au': ac.au}
+    ac.pl_a  # pylint: disable=pointless-statement  # Create the array before timing repeated access
+
+    result = {}
+    for label, stmt in tests.items():
+        timer = _timeit.Timer(stmt, globals=env)
+        result[label] = min(timer.repeat(5, number)) / number
+
+    # First access of a lazy array constant (creates the numpy array), in fresh interpreters:
+    code = ('import time, numpy, astroconst\n'
+            't0 = time.perf_counter()\n'
+            'astroconst.pl_a\n'
+            'print(time.perf_counter()-t0)\n')
+    result['astroconst.pl_a (first access)'] = min(float(run_python(code)[0]) for _ in range(5))
+    return result
+
+
+def bench_memory():
+    """Return the memory allocated by importing astroconst (bytes, measured with tracemalloc in a fresh
+    interpreter), and the sizes of the array-valued constants once created as numpy arrays (bytes)."""
+
+    code = ('import tracemalloc\n'
+            'tracemalloc.start()\n'
+            'import astroconst, astroconst.aa\n'
+            'print(tracemalloc.get_traced_memory()[0])\n')
+    result = {'import astroconst, astroconst.aa': int(run_python(code)[0])}
+
+    arrays = {name: getattr(ac, name) for name in vars(ac)['__arrays']}
+    result.update({'array '+name: int(array.nbytes) for name, array in arrays.items()})
+    result['arrays (total)'] = sum(int(array.nbytes) for array in arrays.values())
+    return result
+
+
+def helper_cases(size):
+    """Return the benchmark cases of the vectorised helpers.
+
+    Parameters:
+      size (int):  Number of array elements per case.
+
+    Returns:
+      (dict):  Dictionary of 'module.function' -> (function, args, kwargs, number of elements).
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from astroconst import (angles, cosmology, crossmatch, dates, formatting, galactic, kepler, moonphase, names,
+                            planck, precession, registry, sidereal, timescales, units)
+
+    rng = np.random.default_rng(1)
+    ang = rng.uniform(-np.pi, np.pi, size)
+    lat = rng.uniform(-np.pi/2, np.pi/2, size)
+    jd  = rng.uniform(ac.jd2000 - 36525, ac.jd2000 + 36525, size)
+    nbody = len(ac.pl_a)
+    wav = np.geomspace(100*ac.nm, 1e5*ac.nm, size)
+    month_names = rng.choice(ac.months_en, size)
+    index = crossmatch.SkyIndex(ang, lat)
+
+    return {
+        'angles.wrap_pi':                  (angles.wrap_pi, (ang*10,), {}, size),
+        'angles.rad2dms':                  (angles.rad2dms, (ang,), {'decimals': 3}, size),
+        'cosmology.luminosity_distance':   (cosmology.luminosity_distance, (rng.uniform(0, 3, size),), {}, size),
+        'crossmatch.SkyIndex.match':       (index.match, (ang + 1e-6, lat), {'radius': 1*ac.as2r}, size),
+        'dates.jd2date':                   (dates.jd2date, (jd,), {}, size),
+        'formatting.format_hms':           (formatting.format_hms, (ang,), {}, size),
+        'formatting.format_date':          (formatting.format_date, (jd,), {'time': True}, size),
+        'galactic.eq2gal':                 (galactic.eq2gal, (ang, lat), {}, size),
+        'kepler.propagate':                (kepler.propagate, (jd[:size//nbody],), {}, size//nbody*nbody),
+        'moonphase.illuminated_fraction':  (moonphase.illuminated_fraction, (jd,), {}, size),
+        'moonphase.principal_phase':       (moonphase.principal_phase, (jd,), {}, size),
+        'names.month_index':               (names.month_index, (month_names,), {}, size),
+        'planck.b_lambda':                 (planck.b_lambda, (wav, 5772), {}, size),
+        'precession.precess':              (precession.precess, (ang, lat, ac.jd2000, ac.jd2000+36525), {}, size),
+        'registry.sample':                 (registry.sample, (['aa.g', 'aa.gms'], size//2), {'seed': 1}, size//2*2),
+        'sidereal.gmst':                   (sidereal.gmst, (jd,), {}, size),
+        'timescales.convert':              (timescales.convert, (jd, 0, 'tt', 'tdb'), {}, size),
+        'units.convert':                   (units.convert, (ang, 'km/s/Mpc', 'Hz'), {'out': np.empty(size)}, size),
+    }
+
+
+def bench_helpers(size=100_000):
+    """Return the run time per array element (s) of the vectorised helpers (best of three), and the names of
+    the submodules that have no helper benchmark."""
+
+    result = {}
+    cases = helper_cases(size)
+    for label, (func, args, kwargs, nelem) in cases.items():
+        func(*args, **kwargs)  # Warm up caches and lazy imports
+        best = float('inf')
+        for _ in range(3):
+            t0 = time.perf_counter()
+            func(*args, **kwargs)
+            best = min(best, time.perf_counter() - t0)
+        result[label] = best / nelem
+
+    modules = {info.name for info in pkgutil.iter_modules(ac.__path__) if not info.name.startswith('_')}
+    timed = {label.split('.')[0] for label in cases}
+    return result, sorted(modules - timed - _untimed)
+
+
+def run(selected=sections, size=100_000):
+    """Run (a selection of) the suite and return the results as a JSON-serialisable dictionary."""
+
+    results = {'meta': {'astroconst': _version(), 'python': platform.python_version(), 'numpy': np.__version__,
+                        'platform': platform.platform(), 'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+                        'size': size}}
+    funcs = {'import': bench_import, 'importtime': bench_importtime, 'attributes': bench_attributes,
+             'memory': bench_memory}
+    for section in selected:
+        if section == 'helpers':
+            results['helpers'], results['untimed'] = bench_helpers(size)
+        else:
+            results[section] = funcs[section]()
+    return results
+
+
+def _version():
+    """Return the version of astroconst from pyproject.toml, if available."""
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'pyproject.toml')
+    try:
+        with open(path, encoding='utf-8') as ifile:
+            for line in ifile:
+                if line.startswith('version'): return line.split('=')[1].strip().strip('"')
+    except OSError:
+        pass
+    return None
+
+
+def metrics(results):
+    """Flatten the results to a dictionary 'section/name[/kind]' -> value, for the metrics where lower is better."""
+
+    flat = {}
+    for section in sections:
+        for name, value in results.get(section, {}).items():
+            if isinstance(value, dict):
+                flat.update({'%s/%s/%s' % (section, name, kind): val for kind, val in value.items()})
+            else:
+                flat['%s/%s' % (section, name)] = value
+    return flat
+
+
+def compare(results, baseline, tolerance=0.25):
+    """Compare results with a baseline.
+
+    Parameters:
+      results (dict):     Results from run().
+      baseline (dict):    Baseline results from run(), e.g. read from a JSON file.
+      tolerance (float):  Allowed relative increase of a metric (optional, default: 0.25).
+
+    Returns:
+      (list):  Tuples (metric, baseline value, new value, ratio) of the metrics that regressed.
+    """
+
+    new, old = metrics(results), metrics(baseline)
+    regressions = []
+    for name in sorted(new.keys() & old.keys()):
+        if old[name] > 0 and new[name] > old[name]*(1+tolerance):
+            regressions.append((name, old[name], new[name], new[name]/old[name]))
+    return regressions
+
+
+def report(results):
+    """Print the results in human-readable form."""
+
+    units = {'import': ('ms', 1e3), 'importtime': ('ms', 1e3), 'attributes': ('ns', 1e9), 'memory': ('KiB', 1/1024),
+             'helpers': ('ns/element', 1e9)}
+    for name, value in metrics(results).items():
+        unit, scale = units[name.split('/')[0]]
+        print('%-70s %12.3f %s' % (name, value*scale, unit))
+    if results.get('untimed'):
+        print('Submodules without helper benchmark:', ', '.join(results['untimed']))
+
+
+def main(args=None):
+    """Command-line interface: run the suite, print and save the results, and compare with a baseline."""
+
+    parser = argparse.ArgumentParser(description='Benchmark suite for astroconst.')
+    parser.add_argument('-o', '--output', help='write the results as JSON to this file (- for stdout)')
+    parser.add_argument('-s', '--sections', nargs='+', choices=sections, default=list(sections),
+                        help='sections to run (default: all)')
+    parser.add_argument('--size', type=int, default=100_000, help='array size for the helpers (default: 100000)')
+    parser.add_argument('--compare', metavar='BASELINE', help='JSON file with baseline results to compare with')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed relative increase before a metric counts as a regression (default: 0.25)')
+    args = parser.parse_args(args)
+
+    results = run(args.sections, args.size)
+    if args.output == '-':
+        json.dump(results, sys.stdout, indent=1)
+        print()
+    else:
+        report(results)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as ofile:
+                json.dump(results, ofile, indent=1)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as ifile:
+            regressions = compare(results, json.load(ifile), args.tolerance)
+        for name, old, new, ratio in regressions:
+            print('REGRESSION  %-60s  %.4g -> %.4g  (x%.2f)' % (name, old, new, ratio), file=sys.stderr)
+        if regressions: return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
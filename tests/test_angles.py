@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""test_angles.py:  Tests for astroconst.angles."""
+
+
+import numpy as np
+import pytest
+
+from astroconst import angles, pi, pi2
+
+
+@pytest.mark.parametrize('angle, expected', [(4.0, 4.0-pi2), (-4.0, pi2-4.0), (pi, pi), (-pi, pi), (0, 0.0)])
+def test_wrap_pi_scalar(angle, expected):
+    result = angles.wrap_pi(angle)
+    assert np.ndim(result) == 0
+    assert result == pytest.approx(expected, abs=1e-15)
+
+
+def test_wrap_pi_keeps_float32():
+    assert angles.wrap_pi(np.float32(4)).dtype == np.float32
+    assert angles.wrap_pi(np.array([4, -4], dtype=np.float32)).dtype == np.float32
+
+
+def test_wrap_pi_in_place():
+    angle = np.array([4.0, -4.0, 7*pi])
+    result = angles.wrap_pi(angle, out=angle)
+    assert result is angle
+    np.testing.assert_allclose(angle, [4-pi2, pi2-4, pi], atol=1e-14)
+
+
+def test_wrap_2pi_scalar():
+    assert angles.wrap_2pi(-1e-20) == 0
+    assert angles.wrap_2pi(7.0) == pytest.approx(7-pi2)
+
+
+@pytest.mark.parametrize('alias', ['units', 'minutes', 'seconds'])
+def test_join_sexagesimal_out_aliases_input(alias):
+    inputs = {'units': np.array([-0.0, 12, -12]), 'minutes': np.array([30.0, 30, 30]), 'seconds': np.zeros(3)}
+    result = angles.join_sexagesimal(inputs['units'], inputs['minutes'], inputs['seconds'], out=inputs[alias])
+    assert result is inputs[alias]
+    np.testing.assert_array_equal(result, [-0.5, 12.5, -12.5])
+
+
+def test_join_sexagesimal_out_aliases_sign():
+    sign = np.array([-1.0, 1, -1])
+    result = angles.join_sexagesimal(np.array([0.0, 1, 2]), 30, 0, sign=sign, out=sign)
+    np.testing.assert_array_equal(result, [-0.5, 1.5, -2.5])
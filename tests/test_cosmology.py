@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""test_cosmology.py:  Tests for astroconst.cosmology."""
+
+
+import numpy as np
+import pytest
+
+from astroconst import cosmology, c, H0, Gyr, pc
+
+
+redshifts = np.array([0, 0.5, 1, 3, 10, 1000])
+
+
+def test_comoving_distance_brute_force():
+    # D_C(z=1) by trapezoidal integration of c/H0 / E(z) on a dense grid:
+    omega_m, omega_r = cosmology.omega_matter, cosmology.omega_radiation()
+    zval = np.linspace(0, 1, 2000001)
+    inv_e = 1/np.sqrt(omega_r*(1+zval)**4 + omega_m*(1+zval)**3 + 1 - omega_m - omega_r)
+    assert cosmology.comoving_distance(1) == pytest.approx(c/H0*np.trapezoid(inv_e, zval), rel=1e-10)
+
+
+def test_einstein_de_sitter():
+    # Ω_m = 1: D_C = 2c/H0 (1 - 1/√(1+z)) and t = 2/(3 H0) (1+z)^-3/2:
+    d_c = cosmology.comoving_distance(redshifts, omega_m=1, omega_r=0)
+    np.testing.assert_allclose(d_c, 2*c/H0*(1 - 1/np.sqrt(1+redshifts)), rtol=1e-10)
+    ages = cosmology.age(redshifts, omega_m=1, omega_r=0)
+    bound = cosmology.error_bound(omega_m=1, omega_r=0) * ages[0]/ages
+    assert np.all(np.abs(ages/(2/(3*H0)*(1+redshifts)**-1.5) - 1) <= bound)
+    np.testing.assert_allclose(cosmology.lookback_time(redshifts, omega_m=1, omega_r=0) + ages, ages[0], rtol=1e-14)
+
+
+def test_lambda_cdm_age():
+    # Flat ΛCDM without radiation: t0 = 2/(3 H0 √Ω_Λ) asinh(√(Ω_Λ/Ω_m)):
+    t_0 = 2/(3*H0*np.sqrt(0.7)) * np.arcsinh(np.sqrt(0.7/0.3))
+    assert cosmology.age(0, omega_m=0.3, omega_r=0) == pytest.approx(t_0, rel=1e-9)
+    assert cosmology.age(0)/Gyr == pytest.approx(13.79, abs=0.01)
+
+
+def test_distance_relations():
+    zval = redshifts[1:]
+    d_c = cosmology.comoving_distance(zval)
+    np.testing.assert_allclose(cosmology.luminosity_distance(zval), d_c*(1+zval), rtol=1e-15)
+    np.testing.assert_allclose(cosmology.angular_diameter_distance(zval), d_c/(1+zval), rtol=1e-15)
+    np.testing.assert_allclose(cosmology.distance_modulus(zval), 5*np.log10(d_c*(1+zval)/(10*pc)), rtol=1e-14)
+    assert np.all(np.isnan(cosmology.comoving_distance([-1, np.inf, np.nan])))
+    assert cosmology.comoving_distance(2e4) > cosmology.comoving_distance(1e4)  # Beyond z_max
+
+
+def test_out():
+    zval = np.linspace(0, 5, 12).reshape(3, 4)
+    out = np.empty((3, 4))
+    assert cosmology.comoving_distance(zval, out=out, chunksize=5) is out
+    np.testing.assert_array_equal(out, cosmology.comoving_distance(zval))
+    assert cosmology.age(np.float32(1)).dtype == np.float32
+
+    with pytest.raises(ValueError, match='C-contiguous'):
+        cosmology.age(zval, out=np.empty((4, 3)).T)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""test_crossmatch.py:  Tests for astroconst.crossmatch."""
+
+
+import numpy as np
+import pytest
+
+from astroconst import crossmatch, as2r, d2r, mas2r, pi
+
+
+def _sky(rng, size):
+    """Return random positions: half uniform on the sky, a quarter within 2° of the poles and a quarter near RA = 0."""
+    ra, dec = rng.uniform(0, 2*pi, size), np.arcsin(rng.uniform(-1, 1, size))
+    npol, nzero = len(ra[::4]), len(ra[1::4])
+    dec[::4] = np.sign(dec[::4]) * (pi/2 - rng.uniform(0, 2*d2r, npol))
+    ra[1::4] = np.mod(rng.normal(0, 1*d2r, nzero), 2*pi)
+    return ra, dec
+
+
+@pytest.fixture(scope='module')
+def catalogues():
+    rng = np.random.default_rng(1)
+    ra_cat, dec_cat = _sky(rng, 3000)
+    ra, dec = _sky(rng, 400)
+    ra[:200] = ra_cat[:200] + rng.normal(0, 20*as2r, 200)/np.cos(dec_cat[:200])  # Sources with close counterparts
+    dec[:200] = np.clip(dec_cat[:200] + rng.normal(0, 20*as2r, 200), -pi/2, pi/2)
+    ra = np.mod(ra, 2*pi)
+    sep = crossmatch.separation(ra[:, None], dec[:, None], ra_cat, dec_cat)  # Brute force, shape (400, 3000)
+    return ra_cat, dec_cat, ra, dec, sep
+
+
+def test_separation():
+    assert crossmatch.separation(0, 0, 1*mas2r, 0) == pytest.approx(1*mas2r, rel=1e-12)
+    assert crossmatch.separation(0, 0, pi, 0) == pytest.approx(pi, rel=1e-15)
+    assert crossmatch.separation(0, pi/2, 1, pi/2) == pytest.approx(0, abs=1e-16)  # cos(π/2) ≠ 0
+    assert crossmatch.separation(0, 0.5, 0.3, -0.2) == pytest.approx(
+        np.arccos(np.sin(0.5)*np.sin(-0.2) + np.cos(0.5)*np.cos(-0.2)*np.cos(0.3)), rel=1e-13)
+    assert crossmatch.chord_to_angle(crossmatch.angle_to_chord(0.7)) == pytest.approx(0.7, rel=1e-15)
+
+
+@pytest.mark.parametrize('radius', [1*as2r, 60*as2r, 2*d2r, 100*d2r])
+def test_cone_search_brute_force(catalogues, radius):
+    ra_cat, dec_cat, ra, dec, sep = catalogues
+    index = crossmatch.SkyIndex(ra_cat, dec_cat)
+    query, found, separation = index.cone_search(ra, dec, radius, workers=2, chunksize=64)
+
+    expected = np.nonzero(sep <= radius)
+    assert sorted(zip(query.tolist(), found.tolist())) == sorted(zip(*[ind.tolist() for ind in expected]))
+    np.testing.assert_allclose(separation, sep[query, found], rtol=0, atol=1e-15)
+    assert np.all(np.diff(query) >= 0)
+
+
+@pytest.mark.parametrize('radius', [60*as2r, 5*d2r])
+def test_match_brute_force(catalogues, radius):
+    ra_cat, dec_cat, ra, dec, sep = catalogues
+    match, separation = crossmatch.crossmatch(ra, dec, ra_cat, dec_cat, radius, workers=3)
+
+    nearest = np.argmin(sep, axis=1)
+    found = sep[np.arange(len(ra)), nearest] <= radius
+    np.testing.assert_array_equal(match, np.where(found, nearest, -1))
+    np.testing.assert_array_equal(separation[found], sep[found, nearest[found]])
+    assert np.all(np.isnan(separation[~found]))
+    assert 0 < found.sum() < len(ra)
+
+
+def test_match_shapes():
+    index = crossmatch.SkyIndex([0.1, 0.2], [0.0, 0.0])
+    assert len(index) == 2
+    match, separation = index.match(0.1 + 1*as2r, 0, 2*as2r)
+    assert match == 0 and separation == pytest.approx(1*as2r, rel=1e-9)
+    match, separation = index.match(np.full((2, 3), 0.2), np.zeros((2, 3)), 1*as2r)
+    assert match.shape == (2, 3) and np.all(match == 1) and np.all(separation == 0)
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""test_dates.py:  Tests for astroconst.dates, with the examples and table 7.a of Meeus, Astronomical Algorithms."""
+
+
+import numpy as np
+import pytest
+
+from astroconst import dates
+
+
+# (year, month, day, JD), Meeus, Astronomical Algorithms, example 7.a and table 7.a:
+_meeus = [(1957, 10, 4.81, 2436116.31), (333, 1, 27.5, 1842713.0), (2000, 1, 1.5, 2451545.0),
+          (1999, 1, 1.0, 2451179.5), (1987, 1, 27.0, 2446822.5), (1987, 6, 19.5, 2446966.0),
+          (1988, 1, 27.0, 2447187.5), (1988, 6, 19.5, 2447332.0), (1900, 1, 1.0, 2415020.5),
+          (1600, 1, 1.0, 2305447.5), (1600, 12, 31.0, 2305812.5), (837, 4, 10.3, 2026871.8),
+          (-123, 12, 31.0, 1676496.5), (-122, 1, 1.0, 1676497.5), (-1000, 7, 12.5, 1356001.0),
+          (-1000, 2, 29.0, 1355866.5), (-1001, 8, 17.9, 1355671.4), (-4712, 1, 1.5, 0.0)]
+
+
+@pytest.mark.parametrize('year, month, day, jd', _meeus)
+def test_date2jd_meeus(year, month, day, jd):
+    assert dates.date2jd(year, month, day) == pytest.approx(jd, abs=1e-6)
+
+
+@pytest.mark.parametrize('year, month, day, jd', _meeus)
+def test_jd2date_meeus(year, month, day, jd):
+    result = dates.jd2date(jd)
+    assert result[:2] == (year, month)
+    assert result[2] == pytest.approx(day, abs=1e-6)
+
+
+def test_arrays_match_scalars():
+    year, month, day, jd = (np.array(col) for col in zip(*_meeus))
+    np.testing.assert_allclose(dates.date2jd(year, month, day), jd, atol=1e-6)
+    np.testing.assert_array_equal(dates.jd2date(jd)[0], year)
+
+
+def test_gregorian_reform():
+    # Thursday 4 October 1582 (Julian) is followed by Friday 15 October 1582 (Gregorian):
+    assert dates.date2jd(1582, 10, 4.0) == 2299159.5
+    assert dates.date2jd(1582, 10, 15.0) == 2299160.5
+    assert dates.day_of_week(2299160.5) == 5
+    assert dates.date2jd(1582, 10, 15.0, calendar='julian') == 2299170.5
+
+
+def test_day_of_week():
+    assert dates.day_of_week(2434923.5) == 3  # Wednesday 30 June 1954, Meeus example 7.e
+    np.testing.assert_array_equal(dates.day_of_week(2451545.0 + np.arange(7)), [6, 0, 1, 2, 3, 4, 5])
+
+
+def test_day_of_year():
+    assert dates.day_of_year(1978, 11, 14) == 318  # Meeus example 7.f
+    assert dates.day_of_year(1988, 4, 22) == 113   # Meeus example 7.g
+    np.testing.assert_array_equal(dates.is_leap_year([1900, 2000, 2023, 2024, 1500]),
+                                  [False, True, False, True, True])
+
+
+def test_datetime64_round_trip():
+    dt = np.array(['2000-01-01T12:00', '1957-10-04T19:26:24', '2026-01-04T00:00'], dtype='datetime64[s]')
+    jd = dates.datetime2jd(dt)
+    assert jd[0] == 2451545.0
+    assert jd[1] == pytest.approx(2436116.31, abs=1e-8)
+    np.testing.assert_array_equal(dates.jd2datetime(jd, unit='s'), dt)
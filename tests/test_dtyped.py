@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""test_dtyped.py:  Tests for the typed namespaces astroconst.f32 and astroconst.f128."""
+
+
+import numpy as np
+
+import astroconst as ac
+import astroconst.f32 as acf32
+import astroconst.f128 as acf128
+
+
+def test_float_constants():
+    assert type(acf32.pc) is np.float32 and acf32.pc == np.float32(ac.pc)
+    assert type(acf32.aa.gms) is np.float32
+    assert acf32.pl_a.dtype == np.float32
+    np.testing.assert_array_equal(acf32.pl_a, ac.pl_a.astype(np.float32))
+
+    assert type(acf128.c3rd) is np.longdouble
+    assert acf128.c3rd == np.longdouble(1)/3  # Computed in long double, not rounded from float64
+    assert acf128.h_bar == acf128.h_p/acf128.pi2
+
+
+def test_integer_constants():
+    for namespace in (acf32, acf128):
+        assert type(namespace.c) is int and namespace.c == 299792458
+        assert type(namespace.jd2000) is int and type(namespace.aa.au) is int
+        assert namespace.mlen.dtype == ac.mlen.dtype
+        np.testing.assert_array_equal(namespace.mlen, ac.mlen)
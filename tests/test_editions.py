@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""test_editions.py:  Tests for astroconst.editions and the submodules that depend on the constants."""
+
+
+import pytest
+
+import astroconst as ac
+from astroconst import editions, planck, registry, units
+
+
+@pytest.fixture(autouse=True)
+def default_edition():
+    editions.use('default')
+    yield
+    editions.use('default')
+
+
+def test_use_updates_derived_constants():
+    changed = editions.use('CODATA 2018')
+    assert 'h_p' in changed and 'h_bar' in changed
+    assert ac.h_p == 6.62607015e-34
+    assert ac.h_bar == pytest.approx(6.62607015e-34/ac.pi2, rel=1e-15)
+
+
+@pytest.mark.parametrize('edition', ['CODATA 2018', 'CODATA 2022'])
+def test_submodules_follow_edition(edition):
+    # Fill the caches with the default values first:
+    assert units.convert(1, 'eV', 'J') == 1.6021766208e-19
+    assert registry.value('h_p') == 6.62607004e-34
+    assert planck.factors()['c1'] == pytest.approx(2*6.62607004e-34*ac.c**2, rel=1e-15)
+
+    editions.use(edition)
+    assert units.convert(1, 'eV', 'J') == 1.602176634e-19
+    assert units.convert(1, 'keV', 'J') == pytest.approx(1.602176634e-16, rel=1e-15)
+    assert registry.value('h_p') == 6.62607015e-34
+    assert registry.table()['value'][registry.index('h_p')] == 6.62607015e-34
+    assert planck.factors()['c1'] == pytest.approx(1.19104297240e-16, rel=1e-11)
+    assert planck.factors()['c2'] == pytest.approx(6.62607015e-34*ac.c/1.380649e-23, rel=1e-15)
+
+    editions.use('default')
+    assert units.convert(1, 'eV', 'J') == 1.6021766208e-19
+    assert registry.value('h_p') == 6.62607004e-34
+    assert planck.factors()['c1'] == pytest.approx(1.19104295262e-16, rel=1e-11)
+
+
+def test_update_resets_submodules():
+    editions.update(eV=1.6e-19)
+    assert editions.edition() == 'custom'
+    assert units.convert(1, 'eV', 'J') == 1.6e-19
+    assert registry.value('eV') == 1.6e-19
+
+
+def test_update_non_root_dependants():
+    changed = editions.update(day_sol=86400.002)
+    assert {'day', 'month_syn', 'year', 'kyr', 'Gyr', 'Mo_per_year', 'pl_p', 'age_of_universe'} <= set(changed)
+    assert ac.day == ac.day_sol == 86400.002
+    assert ac.month_syn == 29.530588853*86400.002
+    assert ac.Gyr == pytest.approx(1e9*365.24218967*86400.002, rel=1e-15)
+    assert ac.age_of_universe == pytest.approx(13.787*ac.Gyr, rel=1e-15)
+    assert ac.Mo_per_year == ac.Mo/ac.year
+    assert ac.pl_p[3] == pytest.approx(ac.year_trop, rel=1e-15)
+    assert units.convert(1, 'Gyr', 's') == ac.Gyr
+
+    assert editions.update(pc=3.0857e16) == ['pc', 'kpc', 'Mpc', 'Gpc']
+    assert ac.Gpc == pytest.approx(3.0857e25, rel=1e-15)
+
+    editions.use('default')
+    assert ac.day == 86400 and ac.pl_p[3] == 365.24218967*86400
+    assert ac.Gpc == pytest.approx(3.0856776e25, rel=1e-15)
+
+
+def test_update_rejects_non_updatable():
+    with pytest.raises(ValueError, match='derived constant'):
+        editions.update(year=3.2e7)
+    with pytest.raises(ValueError, match='cannot be updated'):
+        editions.update(pi=3)
+    with pytest.raises(ValueError, match='cannot be updated'):
+        editions.update(ly=9.5e15)
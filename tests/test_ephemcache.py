@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""test_ephemcache.py:  Tests for astroconst.ephemcache."""
+
+
+import os
+import time
+
+import numpy as np
+import pytest
+
+import astroconst as ac
+from astroconst import editions, ephemcache, kepler, jd2000
+
+
+@pytest.fixture
+def directory(tmp_path):
+    yield str(tmp_path)
+    ephemcache.clear(str(tmp_path))
+    editions.use('default')
+
+
+def test_positions(directory):
+    jd = jd2000 + np.arange(0, 1000, 10.0)
+    pos = ephemcache.positions(jd, [3, 5], incl=0.1, directory=directory)
+    assert pos.shape == (2, 100, 3) and not pos.flags.writeable
+    np.testing.assert_array_equal(pos, kepler.propagate(jd, [3, 5], incl=0.1))
+    assert ephemcache.positions(jd, [3, 5], incl=0.1, directory=directory) is pos  # Mapped once per process
+
+    names = os.listdir(directory)
+    assert len(names) == 1 and names[0].startswith('positions-v%i-' % ephemcache.format_version)
+    ephemcache.positions(jd, [3, 5], incl=0.2, directory=directory)  # Other parameters -> other file
+    assert len(os.listdir(directory)) == 2
+
+
+def test_bodies(directory):
+    table = ephemcache.bodies(directory=directory)
+    assert table['name_en'].tolist() == list(ac.plname_en)
+    np.testing.assert_array_equal(table['a'], ac.pl_a)
+    np.testing.assert_allclose(table['perihelion'], ac.pl_a*(1 - ac.pl_e), rtol=1e-15)
+    np.testing.assert_array_equal(table['mean_motion'], kepler.mean_motion())
+
+
+def test_changed_constants(directory):
+    old = ephemcache.bodies(directory=directory)
+    editions.update(au=1.5e11)
+    new = ephemcache.bodies(directory=directory)
+    assert new['a'][5] == pytest.approx(old['a'][5]*1.5e11/ac.aa.au, rel=1e-15)
+    assert len(os.listdir(directory)) == 2
+
+
+def test_clear(directory):
+    ephemcache.bodies(directory=directory)
+    ephemcache.positions(jd2000, directory=directory)
+    paths = {name: os.path.join(directory, name) for name in ('.positions-abc123.npy', '.bodies-old456.npy',
+                                                              'positions-notes.npy', 'other.npy')}
+    for path in paths.values():
+        with open(path, 'wb'):
+            pass
+    day_ago = time.time() - 86400 - 60
+    os.utime(paths['.bodies-old456.npy'], (day_ago, day_ago))
+
+    assert ephemcache.clear(directory) == 3  # Two tables and the stale temporary file
+    assert sorted(os.listdir(directory)) == ['.positions-abc123.npy', 'other.npy', 'positions-notes.npy']
+    assert ephemcache.clear(directory, max_age=0) == 1
+    assert ephemcache.clear(os.path.join(directory, 'missing')) == 0
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""test_export.py:  Tests for astroconst.export."""
+
+
+import os
+import shutil
+
+import pytest
+
+from astroconst import export
+
+
+@pytest.fixture(scope='module')
+def directory(tmp_path_factory):
+    directory = tmp_path_factory.mktemp('export')
+    export.export(str(directory))
+    return str(directory)
+
+
+@pytest.mark.skipif(not (os.environ.get('CC') or shutil.which('cc')), reason='no C compiler')
+def test_c_header_compiles_bit_identical(directory):
+    assert export.compile_check(directory, ['c'])['c'] == len(export.constants())
+
+
+@pytest.mark.skipif(not (os.environ.get('FC') or shutil.which('gfortran')), reason='no Fortran compiler')
+def test_f90_module_compiles_bit_identical(directory):
+    assert export.compile_check(directory, ['f90'])['f90'] > 0
+
+
+@pytest.mark.skipif(not (os.environ.get('CC') or shutil.which('cc')), reason='no C compiler')
+def test_compile_check_detects_changed_value(directory, tmp_path):
+    with open(os.path.join(directory, 'astroconst.h'), encoding='utf-8') as ifile:
+        text = ifile.read()
+    assert '= 149597870700.0;' in text
+    with open(tmp_path / 'astroconst.h', 'w', encoding='utf-8') as ofile:
+        ofile.write(text.replace('= 149597870700.0;', '= 149597870700.00003;'))  # One ulp off
+
+    with pytest.raises(ValueError, match='ac_au'):
+        export.compile_check(str(tmp_path), ['c'])
+    with pytest.raises(ValueError, match='ac_au'):
+        export.check((tmp_path / 'astroconst.h').read_text(encoding='utf-8'), 'c')
+
+
+def test_check_unknown_constant(directory):
+    with open(os.path.join(directory, 'astroconst.h'), encoding='utf-8') as ifile:
+        text = ifile.read().replace('static const double ac_au ', 'static const double ac_aux ')
+    with pytest.raises(ValueError, match='c: unknown constant ac_aux'):
+        export.check(text, 'c')
+
+
+def test_f90_line_length(directory):
+    with open(os.path.join(directory, 'astroconst.f90'), encoding='utf-8') as ifile:
+        assert max(len(line) for line in ifile.read().split('\n')) <= 132
+
+
+@pytest.mark.parametrize('fmt', list(export.formats))
+def test_check_generated_text(directory, fmt):
+    with open(os.path.join(directory, export.formats[fmt]), encoding='utf-8') as ifile:
+        assert export.check(ifile.read(), fmt) > 0
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""test_formatting.py:  Tests for astroconst.formatting."""
+
+
+import numpy as np
+import pytest
+
+from astroconst import formatting, d2r, h2r, jd2000
+
+
+def test_format_angles():
+    np.testing.assert_array_equal(formatting.format_hms(np.array([12.5822, 23.99999999])*h2r),
+                                  ['12h34m55.92s', '00h00m00.00s'])
+    np.testing.assert_array_equal(formatting.format_dms(np.array([12.58240, -0.5])*d2r),
+                                  ['+12°34′56.6″', '-00°30′00.0″'])
+    assert formatting.format_hms(-1*h2r, wrap=False) == '-01h00m00.00s'
+    assert formatting.format_dms(0.5, kind='S') == '+28°38′52.4″'.encode()
+    assert formatting.format_dms(-185*d2r, decimals=0, symbols=('d', 'm', 's'), width=3) == '-185d00m00s'
+    assert formatting.format_sexagesimal(123.999999, decimals=2, symbols=(':', ':', ''), sign='-') == '124:00:00.00'
+
+
+def test_format_date():
+    assert formatting.format_date(jd2000 + 9499.5) == 'Sunday 4 January 2026'
+    assert formatting.format_date(jd2000 + 9499.5, 'nl', time=True) == 'zondag 4 januari 2026 00:00:00'
+    assert formatting.format_date(2436116.31, time=True) == 'Friday 4 October 1957 19:26:24'  # Meeus, example 7.a
+    assert formatting.format_date(jd2000 + 0.4999999, time=True, decimals=1) == 'Sunday 2 January 2000 00:00:00.0'
+    np.testing.assert_array_equal(formatting.format_date([2299159.5, 2299160.5]),
+                                  ['Thursday 4 October 1582', 'Friday 15 October 1582'])  # Julian -> Gregorian
+    assert formatting.format_date(1355807.5, weekday=False) == '1 January -1000'
+    np.testing.assert_array_equal(formatting.format_date([jd2000]*2, dst=[False, True], kind='S'),
+                                  [b'Saturday 1 January 2000 standard time',
+                                   b'Saturday 1 January 2000 daylight-savings time'])
+
+
+def test_chunks_and_shapes():
+    angles = np.linspace(-np.pi/2, np.pi/2, 60).reshape(3, 4, 5)
+    result = formatting.format_dms(angles, chunksize=7)
+    assert result.shape == (3, 4, 5)
+    np.testing.assert_array_equal(result, formatting.format_dms(angles))
+    np.testing.assert_array_equal(result.ravel(), [formatting.format_dms(angle) for angle in angles.ravel()])
+
+
+def test_errors():
+    with pytest.raises(ValueError, match='kind'):
+        formatting.format_hms(1, kind='B')
+    with pytest.raises(ValueError, match='unknown language'):
+        formatting.format_date(jd2000, lang='de')
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""test_galactic.py:  Tests for astroconst.galactic."""
+
+
+import numpy as np
+import pytest
+
+from astroconst import galactic, d2r
+
+
+def test_north_galactic_pole():
+    # The J2000 north Galactic pole at α = 192.85948°, δ = 27.12825° (Hipparcos, ESA 1997):
+    _, lat = galactic.eq2gal(192.85948*d2r, 27.12825*d2r)
+    assert lat == pytest.approx(np.pi/2, abs=1e-7)
+
+
+def test_galactic_centre():
+    # The direction l = b = 0 at α = 266.40510°, δ = -28.936175° (J2000):
+    lon, lat = galactic.eq2gal(266.40510*d2r, -28.936175*d2r)
+    assert np.remainder(lon + np.pi, 2*np.pi) - np.pi == pytest.approx(0, abs=1e-4*d2r)
+    assert lat == pytest.approx(0, abs=1e-4*d2r)
+
+
+def test_north_celestial_pole():
+    # The Galactic longitude of the north celestial pole, l_NCP = 122.93192°, and b = δ_NGP:
+    lon, lat = galactic.eq2gal(0, np.pi/2)
+    assert lon == pytest.approx(122.93192*d2r, abs=1e-7)
+    assert lat == pytest.approx(27.12825*d2r, abs=1e-7)
+
+
+def test_round_trip():
+    rng = np.random.default_rng(1)
+    ra, dec = rng.uniform(0, 2*np.pi, 1000), np.arcsin(rng.uniform(-1, 1, 1000))
+    ra2, dec2 = galactic.gal2eq(*galactic.eq2gal(ra, dec, chunksize=97))
+    np.testing.assert_allclose(dec2, dec, atol=1e-13)
+    np.testing.assert_allclose(np.remainder(ra2 - ra + np.pi, 2*np.pi) - np.pi, 0, atol=1e-12)
+
+
+def test_vectors_match_angles():
+    rng = np.random.default_rng(2)
+    ra, dec = rng.uniform(0, 2*np.pi, 100), np.arcsin(rng.uniform(-1, 1, 100))
+    vec = np.stack([np.cos(ra)*np.cos(dec), np.sin(ra)*np.cos(dec), np.sin(dec)], axis=-1)
+    lon, lat = galactic.eq2gal(ra, dec)
+    expected = np.stack([np.cos(lon)*np.cos(lat), np.sin(lon)*np.cos(lat), np.sin(lat)], axis=-1)
+    np.testing.assert_allclose(galactic.eq2gal_vec(vec), expected, atol=1e-14)
+    np.testing.assert_allclose(galactic.eq2gal_matrix() @ galactic.gal2eq_matrix(), np.eye(3), atol=1e-15)
+
+
+def test_float32():
+    lon, lat = galactic.eq2gal(np.float32([1, 2]), np.float32([0.1, -0.2]))
+    assert lon.dtype == np.float32 and lat.dtype == np.float32
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""test_kepler.py:  Tests for astroconst.kepler."""
+
+
+import numpy as np
+import pytest
+
+from astroconst import kepler, day, jd2000, pl_a, pl_e, pl_p
+
+
+@pytest.mark.parametrize('mean_anom, ecc', [(1.0, 0.5), (0.0, 0.2), (-3.0, 0.9), (10.0, 0.0)])
+def test_solve_kepler_scalar(mean_anom, ecc):
+    ecc_anom = kepler.solve_kepler(mean_anom, ecc, iterations=8)
+    assert np.ndim(ecc_anom) == 0
+    mean_anom = (mean_anom + np.pi) % (2*np.pi) - np.pi
+    assert ecc_anom - ecc*np.sin(ecc_anom) == pytest.approx(mean_anom, abs=1e-13)
+
+
+def test_solve_kepler_array():
+    mean_anom = np.linspace(-10, 10, 101)
+    ecc = np.linspace(0, 0.5, 101)
+    ecc_anom = kepler.solve_kepler(mean_anom, ecc)
+    np.testing.assert_allclose(ecc_anom - ecc*np.sin(ecc_anom), (mean_anom + np.pi) % (2*np.pi) - np.pi, atol=1e-13)
+
+
+def test_solve_kepler_meeus():
+    # Meeus, Astronomical Algorithms, example 30.a: e = 0.1, M = 5° -> E = 5.554589°
+    assert np.degrees(kepler.solve_kepler(np.radians(5), 0.1)) == pytest.approx(5.554589, abs=1e-6)
+
+
+def test_propagate_orbit():
+    jd = jd2000 + np.linspace(0, 1, 5)*pl_p[:, None]/day  # One period per body
+    for body in range(len(pl_a)):
+        pos = kepler.propagate(jd[body], body)[0]
+        np.testing.assert_allclose(pos[0], [pl_a[body]*(1 - pl_e[body]), 0, 0])                        # Perihelion
+        np.testing.assert_allclose(pos[2], [-pl_a[body]*(1 + pl_e[body]), 0, 0], atol=1e-9*pl_a[body])  # Aphelion
+        np.testing.assert_allclose(pos[4], pos[0], atol=1e-9*pl_a[body])  # Back after one period
+        assert np.all(pos[:, 2] == 0)
+
+
+def test_propagate_orientation():
+    # Kepler's third law holds for the tabulated values to 0.3% (Pluto):
+    np.testing.assert_allclose(kepler.mean_motion(use_gm=True), kepler.mean_motion(), rtol=3e-3)
+
+    # Orbits perpendicular to the reference plane, with their ascending nodes on the y axis:
+    jd = jd2000 + np.linspace(0, 1000, 11)
+    pos = kepler.propagate(jd, [3, 5], incl=np.pi/2, node=np.pi/2, argp=[0, np.pi/2])
+    np.testing.assert_allclose(pos[:, :, 0], 0, atol=1e-3)
+    np.testing.assert_allclose(pos[0, 0], [0, pl_a[3]*(1 - pl_e[3]), 0], atol=1e-3)
+    np.testing.assert_allclose(pos[1, 0, 2], pl_a[5]*(1 - pl_e[5]))
+
+    out = np.empty((2, 11, 3))
+    assert kepler.propagate(jd, [3, 5], incl=np.pi/2, node=np.pi/2, argp=[0, np.pi/2], out=out, chunksize=4) is out
+    np.testing.assert_array_equal(out, pos)
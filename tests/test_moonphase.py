@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""test_moonphase.py:  Tests for astroconst.moonphase."""
+
+
+import numpy as np
+import pytest
+
+from astroconst import moonphase, r2d
+
+
+def test_phase_jd_meeus():
+    # Meeus, Astronomical Algorithms (1998), examples 49.a (New Moon of 1977 February) and 49.b (Last Quarter of
+    # 2044 January):
+    assert moonphase.phase_jd(-283) == pytest.approx(2443192.65118, abs=1e-5)
+    assert moonphase.phase_jd(544.75) == pytest.approx(2467636.49186, abs=1e-5)
+    np.testing.assert_allclose(moonphase.phase_jd([-283, 544.75]), [2443192.65118, 2467636.49186], atol=1e-5)
+    assert moonphase.phase_jd(-283, accuracy='mean') == pytest.approx(2443192.65118, abs=14/24)
+
+
+def test_illuminated_fraction_meeus():
+    # Meeus (1998), example 48.a: 1992 April 12, 0h TD: i = 69.0756°, k = 0.6786 (with the full lunar theory):
+    assert moonphase.phase_angle(2448724.5)*r2d == pytest.approx(69.0756, abs=0.25)
+    assert moonphase.illuminated_fraction(2448724.5) == pytest.approx(0.6786, abs=0.003)
+    assert moonphase.illuminated_fraction(2443192.65118) == pytest.approx(0, abs=1e-4)
+
+
+@pytest.mark.parametrize('accuracy', moonphase.accuracies)
+def test_principal_phase(accuracy):
+    jd = 2451545 + np.linspace(0, 3000, 2000).reshape(40, 50)
+    index, jd_phase = moonphase.principal_phase(jd, accuracy=accuracy, chunksize=300)
+    assert index.shape == jd.shape and index.dtype == np.int8
+    assert np.all(np.abs(jd_phase - jd) <= 29.53/8 + 1)
+    quarter = np.rint((jd_phase - moonphase.jd_new_moon_2000)/29.530589*4)
+    np.testing.assert_allclose(jd_phase, moonphase.phase_jd(quarter/4, accuracy), atol=1e-6)
+    assert np.all(index == quarter % 4)
+
+    index, jd_next = moonphase.principal_phase(jd, which='next', accuracy=accuracy)
+    assert np.all((jd_next > jd) & (jd_next - jd < 29.53/4 + 1))
+
+    assert moonphase.principal_phase(2443190.0, which='next', accuracy=accuracy)[0] == 0
+
+
+def test_errors():
+    with pytest.raises(ValueError, match='unknown accuracy'):
+        moonphase.elongation(2451545, accuracy='exact')
+    with pytest.raises(ValueError, match='which'):
+        moonphase.principal_phase(2451545, which='previous')
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""test_names.py:  Tests for astroconst.names."""
+
+
+import numpy as np
+import pytest
+
+import astroconst as ac
+from astroconst import names
+
+
+def test_month_index_languages_and_case():
+    assert names.month_index('January') == 1
+    assert names.month_index('  mrt ') == 3
+    assert names.month_index('OKT') == 10
+    assert names.month_index('dec') == 12
+    assert names.month_index('Smarch') == -1
+    assert names.month_index('Smarch', default=0) == 0
+
+
+def test_every_table_entry_maps_to_its_index():
+    for category, tables in names._tables.items():
+        for table in tables:
+            for ind, name in enumerate(getattr(ac, table)):
+                if name: assert names.lookup(category, name) == ind, (table, name)
+
+
+def test_other_categories():
+    assert names.weekday_index('zaterdag') == 6
+    assert names.planet_index('Jup.') == 5
+    assert names.planet_index('Zon') == 3
+    assert names.moonphase_index('Volle Maan') == 2
+    assert names.greek_index('&omega;') == 23
+
+
+def test_array_lookup():
+    tokens = np.array([['Jan', 'februari', 'x'], ['DEC', 'Jan', '']])
+    np.testing.assert_array_equal(names.month_index(tokens), [[1, 2, -1], [12, 1, -1]])
+    assert names.month_index(np.array([], dtype='U3')).shape == (0,)
+    assert names.month_index(['mei'] * 5).tolist() == [5] * 5
+
+
+def test_unknown_category():
+    with pytest.raises(ValueError, match='unknown category'):
+        names.lookup('colour', 'red')
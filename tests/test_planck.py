@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""test_planck.py:  Tests for astroconst.planck."""
+
+
+import numpy as np
+import pytest
+
+from astroconst import planck, c, h_p, k_b, nm, pi, sigma
+
+
+temps = np.array([3, 300, 5772, 1e5])
+
+
+def test_radiation_constants():
+    # CODATA 2014: c1 = 2hc² and c2 = hc/k:
+    assert planck.factors()['c1'] == pytest.approx(1.191042953e-16, rel=1e-9)
+    assert planck.factors()['c2'] == pytest.approx(1.43877736e-2, rel=1e-8)
+
+
+def test_total_radiance():
+    # σT⁴ = π ∫ B_λ dλ, and the total photon radiance 4ζ(3) c (kT/hc)³:
+    np.testing.assert_allclose(pi*planck.band_radiance(0, np.inf, temps), sigma*temps**4, rtol=1e-14)
+    np.testing.assert_allclose(planck.band_radiance(0, np.inf, temps, photons=True),
+                               4*1.2020569031595942*c*(k_b*temps/(h_p*c))**3, rtol=1e-14)
+
+
+def test_numerical_integrals():
+    wav = np.linspace(400*nm, 700*nm, 100001)
+    assert np.trapezoid(planck.b_lambda(wav, 5772), wav) == pytest.approx(planck.band_radiance(400*nm, 700*nm, 5772),
+                                                                          rel=1e-9)
+    freq = np.geomspace(1e9, 1e16, 400001)
+    assert pi*np.trapezoid(planck.b_nu(freq, 5772), freq) == pytest.approx(sigma*5772**4, rel=1e-8)
+    assert np.trapezoid(planck.photon_lambda(wav, 5772), wav) == pytest.approx(
+        planck.band_radiance(400*nm, 700*nm, 5772, photons=True), rel=1e-9)
+
+
+def test_limits():
+    wav = np.geomspace(100*nm, 10e-6, 200001)
+    assert wav[planck.b_lambda(wav, 5772).argmax()]*5772 == pytest.approx(2.897771955e-3, rel=1e-4)  # Wien's law
+
+    xval = h_p*c/(1e-2*300*k_b)  # Rayleigh-Jeans limit, with the first-order correction:
+    assert planck.b_lambda(1e-2, 300) == pytest.approx(2*c*k_b*300/1e-2**4 * (1 - xval/2), rel=1e-5)
+
+    assert planck.b_lambda(1e-9, 10) == 0  # Extreme Wien limit, without overflow
+    assert planck.b_lambda(np.float32(1e-9), np.float32(1e4)).dtype == np.float32
+    np.testing.assert_allclose(planck.photon_nu(1e12, temps) * h_p*1e12, planck.b_nu(1e12, temps), rtol=1e-14)
+
+
+def test_out():
+    wav, temp = np.linspace(100, 3000, 8)*nm, temps[:, None]
+    out = np.empty((4, 8))
+    assert planck.b_lambda(wav, temp, out=out, chunksize=5) is out
+    np.testing.assert_array_equal(out, planck.b_lambda(wav, temp))
+
+    with pytest.raises(ValueError, match='C-contiguous'):
+        planck.b_lambda(wav, temp, out=np.empty((8, 4)).T)
+    with pytest.raises(ValueError, match='shape'):
+        planck.band_radiance(wav, 2*wav, temp, out=np.empty(32))
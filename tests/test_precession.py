@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""test_precession.py:  Tests for astroconst.precession."""
+
+
+import numpy as np
+import pytest
+
+from astroconst import precession, as2r, d2r, jd2000, r2as
+
+
+def _p03_matrix(tjc):
+    """Precession matrix R3(-z_A) R2(θ_A) R3(-ζ_A) from the IAU 2006 (P03) equatorial precession angles
+    (Capitaine et al. 2003; IERS Conventions 2010, eq. 5.40)."""
+
+    def poly(coefs): return sum(coef * tjc**power for power, coef in enumerate(coefs)) * as2r
+    def rot2(ang): return np.array([[np.cos(ang), 0, -np.sin(ang)], [0, 1, 0], [np.sin(ang), 0, np.cos(ang)]])
+    def rot3(ang): return np.array([[np.cos(ang), np.sin(ang), 0], [-np.sin(ang), np.cos(ang), 0], [0, 0, 1]])
+
+    zeta  = poly([2.650545, 2306.083227, 0.2988499, 0.01801828, -0.000005971, -0.0000003173])
+    z_a   = poly([-2.650545, 2306.077181, 1.0927348, 0.01826837, -0.000028596, -0.0000002904])
+    theta = poly([0, 2004.191903, -0.4294934, -0.04182264, -0.000007089, -0.0000001274])
+    return rot3(-z_a) @ rot2(theta) @ rot3(-zeta)
+
+
+@pytest.mark.parametrize('tjc', [-2, -0.5, 0.04, 1, 3])
+def test_matrix_p03_angles(tjc):
+    np.testing.assert_allclose(precession.precession_matrix(jd2000, jd2000 + 36525*tjc), _p03_matrix(tjc),
+                               rtol=0, atol=1e-10)
+
+
+def test_meeus_example_21b():
+    # θ Persei, Meeus, Astronomical Algorithms, example 21.b: J2000 position (with proper motion applied) to
+    # 2028 November 13.19 TD.  Meeus uses the IAU 1976 precession, which differs by ~0.1" after 29 years:
+    ra, dec = precession.precess(41.054063*d2r, 49.227750*d2r, jd2000, 2462088.69)
+    assert ra*r2as == pytest.approx(41.547214*3600, abs=0.2)
+    assert dec*r2as == pytest.approx(49.348483*3600, abs=0.2)
+
+
+def test_obliquity_and_general_precession():
+    assert precession.obliquity(jd2000)*r2as == pytest.approx(84381.406, abs=1e-3)
+    assert precession.general_precession(jd2000 + 36525)*r2as == pytest.approx(5028.796195 + 1.1054348, abs=0.01)
+
+
+def test_round_trip_and_vectors():
+    rng = np.random.default_rng(1)
+    ra, dec = rng.uniform(0, 2*np.pi, 1000), np.arcsin(rng.uniform(-1, 1, 1000))
+    ra2, dec2 = precession.precess(*precession.precess(ra, dec, jd2000, 2488070.5), 2488070.5, jd2000)
+    np.testing.assert_allclose(dec2, dec, atol=1e-13)
+    np.testing.assert_allclose(np.remainder(ra2 - ra + np.pi, 2*np.pi) - np.pi, 0, atol=1e-12)
+
+    vec = np.stack([np.cos(ra)*np.cos(dec), np.sin(ra)*np.cos(dec), np.sin(dec)], axis=-1)
+    out = vec.copy()
+    precession.precess_vec(out, jd2000, 2488070.5, out=out)
+    np.testing.assert_allclose(out, vec @ precession.precession_matrix(jd2000, 2488070.5).T, atol=1e-15)
+
+
+def test_matrix_cache():
+    precession.precession_matrix.cache_clear()
+    matrix = precession.precession_matrix(jd2000, 2451910.5)
+    assert precession.precession_matrix(jd2000, 2451910.5) is matrix
+    assert precession.precession_matrix.cache_info().hits == 1
+    assert not matrix.flags.writeable
+
+
+def test_out_validation():
+    ra, dec = np.zeros((4, 2)), np.zeros((4, 2))
+    out = (np.empty((4, 2)), np.empty((4, 2)))
+    assert precession.precess(ra, dec, jd2000, 2488070.5, out=out) is out
+
+    with pytest.raises(ValueError, match='C-contiguous'):
+        precession.precess(ra, dec, jd2000, 2488070.5, out=(np.zeros((4, 3))[:, :2], np.zeros((4, 2))))
+    with pytest.raises(ValueError, match='shape'):
+        precession.precess(ra, dec, jd2000, 2488070.5, out=(np.zeros(8), np.zeros(8)))
+    with pytest.raises(ValueError, match='floating-point'):
+        precession.precess(ra, dec, jd2000, 2488070.5, out=(np.zeros((4, 2), int), np.zeros((4, 2), int)))
+    with pytest.raises(ValueError, match='C-contiguous'):
+        precession.precess_vec(np.zeros((4, 3)), jd2000, 2488070.5, out=np.zeros((3, 4)).T)
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""test_registry.py:  Tests for astroconst.registry."""
+
+
+import numpy as np
+import pytest
+
+from astroconst import registry, aa, G, c
+
+
+def test_records():
+    record = registry.get('aa.g')
+    assert record['value'] == aa.g == 6.67428e-11
+    assert record['uncertainty'] == 6.7e-15
+    assert record['unit'] == 'm^3/kg/s^2'
+    assert record['description'] == 'Constant of gravitation'
+    assert registry.get('aa.c')['uncertainty'] == 0
+
+    assert registry.value('c') == c
+    np.testing.assert_array_equal(registry.value(['G', 'aa.g']), [G, aa.g])
+    with pytest.raises(KeyError, match='unknown constant'):
+        registry.index('no_such_constant')
+
+
+def test_sample():
+    samples = registry.sample('aa.g', 3)
+    assert samples.shape == (3, 1)
+
+    samples = registry.sample(['aa.g', 'aa.gms', 'G'], 100000, seed=1)
+    assert samples.shape == (100000, 3)
+    np.testing.assert_allclose(samples.mean(axis=0), [aa.g, aa.gms, G], rtol=1e-6)
+    np.testing.assert_allclose(samples[:, :2].std(axis=0), registry.uncertainty(['aa.g', 'aa.gms']), rtol=0.01)
+    assert np.all(samples[:, 2] == G)  # Main-module constants have no uncertainty
+
+
+def test_sample_correlated():
+    corr = [[1, 0.9], [0.9, 1]]
+    samples = registry.sample(['aa.g', 'aa.gms'], 100000, corr=corr, seed=np.random.default_rng(2))
+    assert np.corrcoef(samples, rowvar=False)[0, 1] == pytest.approx(0.9, abs=0.01)
+    assert registry.sample('aa.g', 10, dtype=np.float32).dtype == np.float32
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""test_sidereal.py:  Tests for astroconst.sidereal."""
+
+
+import numpy as np
+import pytest
+
+from astroconst import sidereal, aa, pi2, jd2000
+
+
+def test_era_sofa():
+    # IAU SOFA t_sofa_c.c, t_era00(): iauEra00(2400000.5, 54388.0)
+    assert sidereal.era(2400000.5, 54388.0) == pytest.approx(0.4022837240028158102, abs=1e-12)
+
+
+def test_gmst_sofa():
+    # IAU SOFA t_sofa_c.c, t_gmst06(): iauGmst06(2400000.5, 53736.0, 2400000.5, 53736.0)
+    assert sidereal.gmst(2400000.5, 53736.0) == pytest.approx(1.754174971870091203, abs=1e-12)
+
+
+def test_two_part_jd():
+    jd = 2460000.5 + np.linspace(0, 1, 25)
+    np.testing.assert_allclose(sidereal.era(np.floor(jd), jd - np.floor(jd)), sidereal.era(jd), rtol=0, atol=1e-9)
+    np.testing.assert_allclose(sidereal.gmst(2400000.5, jd - 2400000.5), sidereal.gmst(jd), rtol=0, atol=1e-9)
+
+
+def test_era_rate():
+    # The ERA advances by 2π dθ/dUT1 per UT1 day:
+    jd2 = np.arange(0, 1000, 7.3)
+    diff = sidereal.era(jd2000, jd2) - sidereal.era(jd2000, 0) - pi2*aa.dtheta_dut1*jd2
+    np.testing.assert_allclose(np.remainder(diff + np.pi, pi2) - np.pi, 0, atol=1e-11)
+
+
+def test_out_and_range():
+    jd = jd2000 + np.linspace(-36525, 36525, 1001).reshape(7, 143)
+    out = np.empty(jd.shape)
+    assert sidereal.gmst(jd, out=out) is out
+    assert np.all((out >= 0) & (out < pi2))
+    np.testing.assert_array_equal(out, [[sidereal.gmst(val) for val in row] for row in jd])
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""test_timescales.py:  Tests for astroconst.timescales."""
+
+
+import numpy as np
+import pytest
+
+from astroconst import timescales, day, jd2000
+
+
+def _jd(year):
+    return jd2000 + (year - 2000)*365.25
+
+
+def test_sofa():
+    # IAU SOFA t_sofa_c.c: t_tttcg(), t_tcbtdb() and t_tdbtcb(); TCG and TCB are defined exactly by aa.l_g,
+    # aa.l_b and aa.tdb_0:
+    assert timescales.convert(2453750.5, 0.892482639, 'tt', 'tcg')[1] == pytest.approx(0.8924900312508587113,
+                                                                                       abs=1e-12)
+    assert timescales.convert(2453750.5, 0.893019599, 'tcb', 'tdb')[1] == pytest.approx(0.8928551362746343397,
+                                                                                        abs=1e-12)
+    assert timescales.convert(2453750.5, 0.892855137, 'tdb', 'tcb')[1] == pytest.approx(0.8930195997253656716,
+                                                                                        abs=1e-12)
+
+
+def test_tt_tai():
+    jd1, jd2 = timescales.convert(2453750.5, 0.25, 'tai', 'tt')
+    assert jd1 == 2453750.5
+    assert (jd2 - 0.25)*day == pytest.approx(32.184, abs=1e-9)
+
+
+@pytest.mark.parametrize('year, delta_t', [(0, 10583.6), (1600, 120), (1700, 8.83), (1800, 13.72),
+                                           (1900, -2.79), (1950, 29.07), (1975, 45.45), (2000, 63.86)])
+def test_delta_t_segments(year, delta_t):
+    # Espenak & Meeus (2006): the constant terms of the polynomials at their offset years:
+    assert timescales.delta_t(_jd(year)) == pytest.approx(delta_t, abs=1e-6)
+
+
+def test_delta_t_continuity():
+    # The polynomials of the adjacent segments agree to better than 0.3 s at the boundaries:
+    start = timescales._dt_start
+    np.testing.assert_allclose(timescales.delta_t(_jd(start) - 1e-6), timescales.delta_t(_jd(start)), atol=0.3)
+    assert timescales.delta_t(_jd(-1000)) == pytest.approx(-20 + 32*((-1000 - timescales._year_1820)/100)**2)
+
+
+@pytest.mark.parametrize('scales', [('tt', 'ut1'), ('tcb', 'ut1'), ('tai', 'tcg'), ('tdb', 'tcb')])
+def test_round_trip(scales):
+    jd2 = np.linspace(-1e5, 1e5, 1001)
+    jd1, jd2b = timescales.convert(*timescales.convert(jd2000, jd2, *scales), *scales[::-1])
+    np.testing.assert_array_equal(jd1, jd2000)
+    np.testing.assert_allclose(jd2b, jd2, rtol=0, atol=1e-8/day)
+
+
+def test_out():
+    jd1, jd2 = np.full((4, 2), 2460000.5), np.linspace(0, 1, 8).reshape(4, 2)
+    out = (np.empty((4, 2)), np.empty((4, 2)))
+    assert timescales.convert(jd1, jd2, 'tt', 'tdb', out=out, chunksize=3) is out
+    np.testing.assert_array_equal(out[1], timescales.convert(jd1, jd2, 'tt', 'tdb')[1])
+
+    with pytest.raises(ValueError, match='C-contiguous'):
+        timescales.convert(jd1, jd2, 'tt', 'tdb', out=(np.empty((4, 3))[:, :2], np.empty((4, 2))))
+    with pytest.raises(ValueError, match='unknown time scale'):
+        timescales.convert(jd1, jd2, 'tt', 'utc')
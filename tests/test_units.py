@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2022-2025  Marc van der Sluys - marc.vandersluys.nl
+#
+#  This file is part of the AstroConst Python package:
+#  A Python package that provides astronomical constants.
+#  See: https://github.com/MarcvdSluys/AstroConst
+#
+#  This is free software: you can redistribute it and/or modify it under the terms of the European Union
+#  Public Licence 1.2 (EUPL 1.2).  This software is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+#  PURPOSE.  See the EU Public License for more details.  You should have received a copy of the European
+#  Union Public License along with this code.  If not, see <https://www.eupl.eu/1.2/en/>.
+
+
+"""test_units.py:  Tests for astroconst.units."""
+
+
+import numpy as np
+import pytest
+
+from astroconst import units, Jy, Mpc, km, ly, pc
+
+
+def test_convert_scalars_and_sequences():
+    assert units.convert(1, 'pc', 'ly') == pc/ly
+    np.testing.assert_array_equal(units.convert([1, 2], 'pc', 'ly'), [pc/ly, 2*pc/ly])
+    np.testing.assert_array_equal(units.convert((1.5,), 'Mpc', 'pc'), [1.5e6])
+
+    values = np.arange(4.0)
+    assert units.convert(values, 'kpc', 'pc', out=values) is values
+    np.testing.assert_array_equal(values, [0, 1e3, 2e3, 3e3])
+
+
+def test_compound_units():
+    assert units.convert(70, 'km/s/Mpc', 'Hz') == pytest.approx(70*km/Mpc, rel=1e-15)
+    assert units.factor('W/m^2/Hz', 'Jy') == pytest.approx(1/Jy, rel=1e-15)
+    assert units.factor('W.m^-2.Hz^-1', 'W/m**2/Hz') == 1
+    assert units.factor('m**3 kg**-1 s^-2', 'm^3/kg/s**2') == 1
+    assert units.si_factor('km/s/Mpc') == (pytest.approx(km/Mpc, rel=1e-15), (0, 0, -1, 0, 0))
+    assert units.factor('deg', 'arcsec') == pytest.approx(3600)
+
+
+def test_errors():
+    with pytest.raises(ValueError, match='incompatible dimensions'):
+        units.factor('km/s', 'Hz')
+    with pytest.raises(ValueError, match='cannot parse'):
+        units.si_factor('/s')
+    with pytest.raises(ValueError, match='cannot parse'):
+        units.si_factor('m^')
+    with pytest.raises(ValueError, match='unknown unit'):
+        units.si_factor('g')  # The gram is 'gram'